@@ -0,0 +1,66 @@
+"""
+pubDate 변환 벤치마크: 기존 strptime(" GMT" 제거 후) vs common/dates.py (정규식 + 월 이름 표, 한국 시간 변환)
+
+실행: python benchmarks/bench_dates.py [날짜 수]
+구글 뉴스 RSS 형식의 날짜로 다음을 출력합니다.
+- 기존 방식과 같은 순간을 가리키는지 (기존 값은 UTC 기준, 새 값은 한국 시간) / 날짜가 바뀌는 15시(UTC) 이후 건수
+- 기존 strptime / parse_pub_date(캐시 없이) / parse_pub_dates(목록 한 번에)의 처리 시간
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from common import dates
+
+def make_pub_dates(size):
+    random.seed(0)
+    texts = []
+    for _ in range(size):
+        dt = datetime(2025, random.randint(1, 12), random.randint(1, 28), random.randint(0, 23),
+                      random.randint(0, 59), random.randint(0, 59))
+        texts.append(dt.strftime("%a, %d %b %Y %H:%M:%S GMT"))
+    return texts
+
+def legacy_parse(texts):
+    """기존 member_search/keyword_news 방식 (시간대 없는 UTC datetime)"""
+    return [datetime.strptime(text.replace(" GMT", ""), "%a, %d %b %Y %H:%M:%S") for text in texts]
+
+def uncached_parse(texts):
+    parse = dates.parse_pub_date.__wrapped__
+    return [parse(text) for text in texts]
+
+def batch_parse(texts):
+    dates.parse_pub_date.cache_clear()  # 하나씩 변환하는 경우로 되돌아가도 캐시 덕을 보지 않게 함
+    return dates.parse_pub_dates(texts)
+
+def measure(function, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    texts = make_pub_dates(size)
+
+    legacy, legacy_time = measure(legacy_parse, texts)
+    parsed, parse_time = measure(uncached_parse, texts)
+    batch, batch_time = measure(batch_parse, texts)
+
+    same_instant = all(old.replace(tzinfo=timezone.utc) == new for old, new in zip(legacy, parsed))
+    shifted = sum(old.day != new.day for old, new in zip(legacy, parsed))
+    print(f"{size}건: 같은 순간 {same_instant}, 목록 변환 결과 일치 {batch == parsed}, "
+          f"한국 시간으로 날짜가 바뀌는 기사 {shifted}건")
+    print(f"기존 strptime {legacy_time * 1000:.1f}ms, parse_pub_date {parse_time * 1000:.1f}ms "
+          f"({legacy_time / parse_time:.1f}배), parse_pub_dates {batch_time * 1000:.1f}ms "
+          f"({legacy_time / batch_time:.1f}배, pandas {'사용' if dates.pd is not None and size >= dates.VECTORIZE_MIN_SIZE else '사용 안 함'})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+기사 정보 추출 벤치마크: 기존 select_one 반복 방식 vs 한 번 순회하는 parse_news_page (도메인 규칙 + 선택자 기록)
+
+실행: python benchmarks/bench_extract.py [반복 횟수]
+여러 형태의 기사 페이지(고정 예제)로 두 방식의 결과가 같은지 확인하고 페이지당 처리 시간을 출력합니다.
+기존 방식은 최초 버전의 선택자 목록을 그대로 복사해 두고 쓰므로, newscaptor의 선택자를 바꾸면 불일치로 드러납니다.
+예제는 실제 기사 페이지를 저장한 것이 아니라 언론사 페이지의 흔한 구조를 본떠 만든 HTML입니다.
+"""
+import os
+import re
+import sys
+import time
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT_DIR, "news_captor"))
+
+import newscaptor
+
+BODY = "".join(f"<p>본문 문단 {i} 입니다. 반도체 업계는 올해 하반기 투자를 늘릴 계획이다.</p>" for i in range(300))
+SCRIPTS = "".join(f"<script>var x{i} = {{a: {i}, b: '광고'}};</script><!-- 주석 {i} -->" for i in range(50))
+
+FIXTURES = [
+    ("https://www.yna.co.kr/view/AKR20251127039200530?input=1195m", f"""<html><head><title>반도체 수출 역대 최대 | 연합뉴스</title>
+<meta property="og:site_name" content="연합뉴스"><meta property="article:published_time" content="2025-11-27T10:30:00+09:00">
+</head><body>{SCRIPTS}<div class="article-head"><h1 class="tit">반도체 수출 역대 최대</h1></div>{BODY}</body></html>"""),
+    ("http://newsis.com/view/NISX20251126_0003417415", f"""<html><head><title>뉴시스</title>
+<meta property="og:site_name" content="뉴시스"></head><body>{SCRIPTS}<h1 class="title">AI 반도체 신규 투자 발표</h1>
+<div class="date">기사등록 2025.11.26 오후 3:10</div>{BODY}</body></html>"""),
+    ("https://www.news1.kr/photos/7620222", f"""<html><head><title>[포토] 신제품 공개 - 뉴스1</title>
+<meta name="author" content="뉴스1"></head><body>{SCRIPTS}<div class="article-title">[포토] 신제품 공개</div>
+<time datetime="2025-11-25T09:00:00+09:00">2025년 11월 25일</time>{BODY}</body></html>"""),
+    ("https://news.naver.com/main/read.naver?oid=001&aid=0014", f"""<html><head><title>네이버 뉴스</title></head>
+<body>{SCRIPTS}<h1 class="headline">로봇 산업 육성 방안</h1><span class="media">한국경제</span>
+<span class="date">2025년 1월 5일</span>{BODY}</body></html>"""),
+    ("https://www.example-news.com/article/123", f"""<html><head><title>제목만 있는 페이지</title></head>
+<body>{SCRIPTS}{BODY}<div class="source">  </div><div class="press">예제뉴스</div><p class="publish-date">게시일 미상</p>
+<p class="article-date">2024.3.7</p></body></html>"""),
+    ("https://blog.example.org/post", f"""<html><body>{SCRIPTS}<h1>  </h1>{BODY}</body></html>"""),
+    ("https://www.example-daily.co.kr/news/articleView.html?idxno=1", f"""<html><head><title>예제일보</title>
+<meta property="og:title" content="배터리 소재 수출 증가 - 예제일보"><meta property="og:site_name" content="예제일보">
+</head><body>{SCRIPTS}<h1>배터리 소재 수출 증가</h1><time datetime="2025-09-05T08:00:00+09:00">9월 5일</time>{BODY}</body></html>"""),
+]
+
+# 최초 버전(extract_news_info)의 선택자 목록 (newscaptor의 현재 목록과 따로 고정)
+LEGACY_TITLE_SELECTORS = [
+    'h1.headline',
+    'h1.title',
+    'h1',
+    '.article-head h1',
+    '.article-title',
+    'title'
+]
+LEGACY_PRESS_SELECTORS = [
+    'meta[property="og:site_name"]',
+    'meta[name="author"]',
+    '.press',
+    '.source',
+    '.media'
+]
+LEGACY_DATE_SELECTORS = [
+    'meta[property="article:published_time"]',
+    'meta[name="article:published_time"]',
+    'time',
+    '.date',
+    '.publish-date',
+    '.article-date'
+]
+
+LEGACY_DOMAIN_TO_PRESS = {
+    'news.naver.com': '네이버뉴스',
+    'www.chosun.com': '조선일보',
+    'www.donga.com': '동아일보',
+    'www.joongang.co.kr': '중앙일보',
+    'www.hani.co.kr': '한겨레',
+    'www.khan.co.kr': '경향신문',
+    'www.yna.co.kr': '연합뉴스',
+    'news.kbs.co.kr': 'KBS',
+    'imnews.imbc.com': 'MBC',
+    'news.sbs.co.kr': 'SBS'
+}
+
+def legacy_parse(content, url):
+    """기존 extract_news_info의 파싱 부분 (선택자마다 select_one 호출)"""
+    soup = BeautifulSoup(content, 'html.parser')
+    title = None
+    for selector in LEGACY_TITLE_SELECTORS:
+        element = soup.select_one(selector)
+        if element:
+            title = element.get_text().strip()
+            break
+    if not title:
+        title = soup.title.string if soup.title else "제목 없음"
+
+    domain = urlparse(url).netloc
+    press = LEGACY_DOMAIN_TO_PRESS.get(domain)
+    if not press:
+        for selector in LEGACY_PRESS_SELECTORS:
+            element = soup.select_one(selector)
+            if element:
+                if element.name == 'meta':
+                    press = element.get('content', '').strip()
+                else:
+                    press = element.get_text().strip()
+                if press:
+                    break
+    if not press:
+        press = domain
+
+    date = None
+    for selector in LEGACY_DATE_SELECTORS:
+        element = soup.select_one(selector)
+        if element:
+            if element.name == 'meta':
+                date_text = element.get('content', '')
+            elif element.name == 'time':
+                date_text = element.get('datetime', '') or element.get_text()
+            else:
+                date_text = element.get_text()
+            if date_text:
+                iso_match = re.search(r'(\d{4}-\d{2}-\d{2})', date_text)
+                if iso_match:
+                    date = iso_match.group(1)
+                    break
+                korean_match = re.search(r'(\d{4})[년\-\.](\d{1,2})[월\-\.](\d{1,2})', date_text)
+                if korean_match:
+                    year, month, day = korean_match.groups()
+                    date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+                    break
+    if not date:
+        date = "날짜 없음"
+    return {'url': url.strip(), 'title': title, 'date': date, 'press': press}
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for url, html in FIXTURES:
+            func(html.encode('utf-8'), url)
+    return (time.perf_counter() - start) / (repeat * len(FIXTURES))
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    mismatches = 0
+    # 선택자 기록은 저장하지 않고 이번 실행에서만 사용
+    newscaptor.EXTRACTION_RULES.learned_path = None
+
+    for url, html in FIXTURES:
+        expected = legacy_parse(html.encode('utf-8'), url)
+        actual = newscaptor.parse_news_page(html.encode('utf-8'), url)
+        if expected != actual:
+            mismatches += 1
+            print(f"결과 불일치: {url}\n  기존: {expected}\n  신규: {actual}")
+    print(f"예제 {len(FIXTURES)}개 중 결과 불일치 {mismatches}개 (파서: {newscaptor.HTML_PARSER})")
+    print("※ 예제는 실제 기사 페이지를 저장한 것이 아니라 흔한 구조를 본뜬 HTML이므로, 실제 페이지에서의 결과·속도와 다를 수 있습니다.")
+
+    legacy_time = timed(legacy_parse, repeat)
+    new_time = timed(newscaptor.parse_news_page, repeat)
+    print(f"기존 방식: 페이지당 {legacy_time * 1000:.2f}ms")
+    print(f"한 번 순회: 페이지당 {new_time * 1000:.2f}ms ({legacy_time / new_time:.1f}배)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+제목 중복 제거 벤치마크: 기존 쌍별 비교(is_similar_by_words) vs MinHash/LSH 색인(NearDuplicateIndex)
+
+실행: python benchmarks/bench_near_dup.py [제목 수]
+합성 한국어 헤드라인 말뭉치로 두 방식의 실행 시간과, 쌍별 비교가 찾은 중복을 색인이 얼마나 찾는지(재현율)를 출력합니다.
+"""
+import os
+import random
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, "member_search"))
+
+from common.near_dup import NearDuplicateIndex
+from newsletter_2 import is_similar_by_words
+
+COMPANIES = ["삼성전자", "LG전자", "SK하이닉스", "현대차", "네이버", "카카오", "포스코", "한화", "두산", "KT"]
+SUBJECTS = ["반도체", "AI", "배터리", "로봇", "클라우드", "자율주행", "수소", "6G", "우주항공", "바이오"]
+ACTIONS = ["신제품 공개", "기술 개발 성공", "공장 증설", "인재 채용 확대", "해외 진출", "실증 사업 착수",
+           "표준화 주도", "연구소 개소", "특허 확보", "서비스 출시"]
+EXTRAS = ["국내 최초", "세계 최대", "업계 주목", "정부 지원", "차세대", "올해 하반기", "내년 상반기",
+          "글로벌 시장", "고성능", "저전력", "친환경", "초격차"]
+
+def make_corpus(size, duplicate_ratio=0.3, seed=7):
+    """합성 헤드라인 목록을 만듭니다. 일부는 기존 제목의 단어를 조금 바꾼 변형(근접 중복)입니다."""
+    rng = random.Random(seed)
+    titles = []
+    for _ in range(size):
+        if titles and rng.random() < duplicate_ratio:
+            words = rng.choice(titles).split()
+            if rng.random() < 0.5:
+                words[rng.randrange(len(words))] = rng.choice(EXTRAS)
+            else:
+                words.append(rng.choice(EXTRAS))
+            titles.append(" ".join(words))
+        else:
+            words = [rng.choice(COMPANIES), rng.choice(SUBJECTS)] + rng.choice(ACTIONS).split()
+            words += rng.sample(EXTRAS, rng.randint(1, 3))
+            words += [f"{rng.randint(1, 10 ** 6)}억", f"{rng.randint(1, 10 ** 6)}호"]
+            rng.shuffle(words)
+            titles.append(" ".join(words))
+    return titles
+
+def dedup_pairwise(titles):
+    unique, flags = [], []
+    for title in titles:
+        duplicate = any(is_similar_by_words(title, kept) for kept in unique)
+        flags.append(duplicate)
+        if not duplicate:
+            unique.append(title)
+    return flags
+
+def dedup_index(titles):
+    index = NearDuplicateIndex()
+    return [not index.add_if_new(title) for title in titles]
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    titles = make_corpus(size)
+
+    start = time.perf_counter()
+    expected = dedup_pairwise(titles)
+    pairwise_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = dedup_index(titles)
+    index_time = time.perf_counter() - start
+
+    found = sum(1 for e, a in zip(expected, actual) if e and a)
+    total = sum(expected)
+    false_positive = sum(1 for e, a in zip(expected, actual) if a and not e)
+    print(f"제목 수: {size}, 쌍별 비교 중복: {total}")
+    print(f"쌍별 비교: {pairwise_time:.3f}초")
+    print(f"MinHash/LSH: {index_time:.3f}초 ({pairwise_time / index_time:.1f}배)")
+    print(f"재현율: {found / total if total else 1:.4f}, 쌍별 비교에 없는 중복 판정: {false_positive}")
+
+if __name__ == "__main__":
+    main()
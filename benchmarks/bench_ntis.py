@@ -0,0 +1,80 @@
+"""
+NTIS 공고 분석 벤치마크: 기존 iterrows 방식 vs 열 단위 연산(build_announcements)
+
+실행: python benchmarks/bench_ntis.py [행 수]
+합성 공고 목록으로 두 방식의 결과가 같은지(limit=None, limit=5) 확인하고 실행 시간을 출력합니다.
+"""
+import datetime
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT_DIR, "ntis"))
+
+import ntis_newsletter as ntis
+
+OTHER_DEPARTMENTS = ["보건복지부", "환경부", "국토교통부", "농림축산식품부", "해양수산부"]
+
+def make_sheet(size, today, seed=3):
+    rng = random.Random(seed)
+    departments = ntis.TARGET_DEPARTMENTS + OTHER_DEPARTMENTS
+    deadlines = []
+    for _ in range(size):
+        if rng.random() < 0.02:
+            deadlines.append("미정")
+        else:
+            deadlines.append((today + datetime.timedelta(days=rng.randint(-30, 90), hours=rng.randint(0, 23))).strftime("%Y-%m-%d %H:%M"))
+    return pd.DataFrame({
+        "부처명": [rng.choice(departments) for _ in range(size)],
+        "공고명": [f"2025년도 연구개발사업 신규과제 공고 {i}" for i in range(size)],
+        "공고문 바로가기(URL)": [f"https://www.ntis.go.kr/rndgate/eg/un/ra/view.do?roRndUid={i}" for i in range(size)],
+        "마감일": deadlines,
+    })
+
+def legacy_announcements(df, limit, today):
+    """기존 process_excel_file의 분석 부분 (limitless / only5)"""
+    df = df.copy()
+    df['마감일'] = pd.to_datetime(df['마감일'], errors='coerce')
+    df.dropna(subset=['마감일'], inplace=True)
+    filtered_df = df[df['부처명'].isin(ntis.TARGET_DEPARTMENTS)].copy()
+    filtered_df = filtered_df[(filtered_df['마감일'] - today).dt.days >= ntis.DEADLINE_THRESHOLD_DAYS]
+    if limit is None:
+        final_df = filtered_df.sort_values(by='마감일', ascending=False, kind='stable')
+    else:
+        sorted_for_selection = filtered_df.sort_values(by='마감일', ascending=True, kind='stable')
+        selected_df = sorted_for_selection.groupby('부처명').head(limit)
+        final_df = selected_df.sort_values(by='마감일', ascending=False, kind='stable')
+
+    all_announcements = {alias: [] for alias in ntis.DEPT_ALIAS.values()}
+    for index, row in final_df.iterrows():
+        alias = ntis.DEPT_ALIAS.get(row['부처명'], row['부처명'])
+        all_announcements[alias].append({
+            "title": row['공고명'],
+            "link": row['공고문 바로가기(URL)'],
+            "deadline": f"~{row['마감일'].strftime('%m/%d')}"
+        })
+    return all_announcements
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    today = datetime.datetime.now()
+    df = make_sheet(size, today)
+
+    for limit in (None, 5):
+        start = time.perf_counter()
+        expected = legacy_announcements(df, limit, today)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = ntis.build_announcements(df, limit, today)
+        new_time = time.perf_counter() - start
+
+        print(f"limit={limit}: 결과 일치 {expected == actual}, "
+              f"iterrows {legacy_time:.3f}초, 열 단위 {new_time:.3f}초 ({legacy_time / new_time:.1f}배)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""
+HTML 생성 벤치마크: 기존 문자열 += 방식 vs 미리 컴파일한 행 템플릿(common/html_render.py)
+
+실행: python benchmarks/bench_render.py [행 수]
+세 생성기(member_search, keyword_news, ntis)에 같은 합성 데이터를 넣어
+특수문자가 없는 입력에서 결과가 바이트 단위로 같은지 확인하고 다음을 출력합니다.
+- 실행 시간: 기존 방식 / 기존 방식 + 값마다 html.escape(같은 안전성 기준) / 템플릿 / 파일로 흘려 쓰기
+- 최대 메모리(tracemalloc): 문서 전체 문자열을 만드는 경우 vs 파일로 흘려 쓰는 경우
+"""
+import html
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for folder in ("member_search", "keyword_news", "ntis"):
+    sys.path.append(os.path.join(ROOT_DIR, folder))
+
+import newsletter_2 as member_search
+import newsletter_3 as keyword_news
+import ntis_newsletter as ntis
+
+# -------------------- [기존 방식 (비교용 사본)] --------------------
+def legacy_member_news_html(all_news_data):
+    """기존 member_search generate_member_news_html"""
+    html_content = f"""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <title>회원사 이슈</title>
+</head>
+<body>
+<table width="800" border="0" cellpadding="0" cellspacing="0" align="center">
+    <tbody>
+        <tr>
+            <td colspan="4" height="50" style="background-color: #f8f9fa; color:#333; font-size:16px; font-weight: 700; padding-left:15px; border-top: 2px solid #305eb3;">
+                표2. 회원사 이슈
+            </td>
+        </tr>
+        <tr>
+            <td colspan="4" valign="top">
+                <table border="0" cellpadding="0" cellspacing="0" width="100%" style="border-bottom:1px solid #e2e2e2">
+    """
+
+    for company_name, articles in all_news_data.items():
+        if not articles:
+            articles = [{"title": "해당 기간에 관련 기사가 없습니다.", "link": "#", "press": "", "date": ""}]
+        
+        rowspan = len(articles)
+        
+        for i, article in enumerate(articles):
+            html_content += "<tr>\n"
+            if i == 0:
+                html_content += f'''
+    <td rowspan="{rowspan}" style="background-color: #f9f7ff;text-align: center;font-size:13px;color:#305eb3;font-weight:700;border-top:1px solid #e2e2e2" width="120" valign="middle">
+        {company_name}
+    </td>
+'''
+            if "관련 기사가 없습니다" in article["title"]:
+                 html_content += f'''
+    <td colspan="3" style="padding:10px;border-top:1px solid #e2e2e2;color:#777;font-size:13px;">
+        {article["title"]}
+    </td>
+'''
+            else:
+                html_content += f'''
+    <td style="padding:10px;border-top:1px solid #e2e2e2">
+        <a href="{article["link"]}" target="_blank" style="text-decoration: none;color:#222;font-size:13px;">{article["title"]}</a>
+    </td>
+    <td width="100" style="background-color: #f5f5f5;text-align: center;font-size:13px;color:#222;border-top:1px solid #e2e2e2">
+        {article["press"]}
+    </td>
+    <td width="60" style="background-color: #f5f5f5;color:#222222;text-align: center;font-size:13px;border-top:1px solid #e2e2e2">
+        {article["date"]}
+    </td>
+'''
+            html_content += "</tr>\n"
+            
+    html_content += """
+                </table>
+            </td>
+        </tr>
+    </tbody>
+</table>
+</body>
+</html>
+    """
+    return html_content
+
+def legacy_table_html(news_list):
+    """기존 keyword_news generate_table_html"""
+
+    # ✨ 수정됨: 제목과 전체 틀을 포함하는 외부 테이블 구조 추가
+    # --- HTML 헤더 부분 ---
+    html_content = """
+<table width="800" border="0" cellpadding="0" cellspacing="0" align="center">
+    <tbody>
+        <tr>
+            <td height="40" style="background-color: #389c92;color:#fff;font-size:16px;font-weight: 700;padding-left:20px">
+                국내외 임베디드 산업 동향
+            </td>
+        </tr>
+        <tr>
+            <td valign="top">
+                <table border="0" cellpadding="0" cellspacing="0" width="100%" style="border-bottom:1px solid #e2e2e2">
+"""
+
+    # --- HTML 본문 (뉴스 목록) 부분 ---
+    for news in news_list:
+        html_content += f"""
+<tr>
+    <td width="100" style="background-color: #f9f7ff;text-align: center;font-size:13px;color:#305eb3;font-weight:700;border-top:1px solid #e2e2e2; padding: 10px 0;">
+        {news['topic']}
+    </td>
+    <td style="padding:10px;border-top:1px solid #e2e2e2">
+        <a href="{news['link']}" target="_blank" style="text-decoration: none;color:#222;font-size:13px;">{news['title']}</a>
+    </td>
+    <td width="100" style="background-color: #edfff5;text-align: center;font-size:13px;color:#222;border-top:1px solid #e2e2e2">
+        {news['press']}
+    </td>
+    <td width="60" style="background-color: #f5f5f5;color:#222222;text-align: center;font-size:13px;border-top:1px solid #e2e2e2">
+        {news['date']}
+    </td>
+</tr>
+"""
+
+    # ✨ 수정됨: 외부 테이블 구조를 닫는 태그 추가
+    # --- HTML 푸터 부분 ---
+    html_content += """
+                </table>
+            </td>
+        </tr>
+    </tbody>
+</table>
+"""
+    
+    return html_content
+
+def legacy_department_block(alias, dept_posts, is_first_department):
+    """한 부처의 공고 행들(HTML)을 만듭니다."""
+    html_content = ""
+    rowspan = len(dept_posts)
+    border_style = "" if is_first_department else 'border-top:1px solid #e2e2e2;'
+    
+    for i, post in enumerate(dept_posts):
+        html_content += "<tr>\n"
+        # 첫 번째 행에만 부처명과 '본공고' 셀을 추가 (rowspan 적용)
+        if i == 0:
+            html_content += f'''
+    <td rowspan="{rowspan}" style="background-color: #f0f0f0;color:#305eb3;text-align: center;font-size:13px;font-weight:700;padding:10px 0;{border_style}" width="75" valign="top">
+        [{alias}]
+    </td>
+    <td rowspan="{rowspan}" style="background-color: #fdfff4;color:#305eb3;text-align: center;font-size:13px;font-weight:700;padding:10px 0;{border_style}" width="63" valign="top">
+        본공고
+    </td>
+'''
+        # 모든 행에 공고 제목과 마감일 셀 추가
+        # 첫 번째 행에만 상단 테두리 스타일 적용
+        td_style = f'padding:10px;{border_style}' if i == 0 else 'padding:10px;'
+        deadline_style = f'background-color: #f5f5f5;color:#222222;text-align: center;font-size:13px;{border_style}' if i == 0 else 'background-color: #f5f5f5;color:#222222;text-align: center;font-size:13px;'
+        
+        html_content += f'''
+    <td style="{td_style}">
+        <a href="{post["link"]}" target="_blank" style="text-decoration: none;color:#222;font-size:13px;">{post["title"]}</a>
+    </td>
+    <td style="{deadline_style}" width="75">{post["deadline"]}</td>
+'''
+        html_content += "</tr>\n"
+    return html_content
+
+def legacy_ntis_html(all_data):
+    """기존 ntis generate_html_file"""
+    # (HTML 헤더 부분은 동일)
+    html_content = f"""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <title>신규 정부과제 안내</title>
+</head>
+<body>
+<table width="800" border="0" cellpadding="0" cellspacing="0" align="center">
+    <tbody>
+        <tr>
+            <td rowspan="2" valign="top" style="background-color:#634abb;"></td>
+            <td colspan="8" height="50" style="background-color: #634abb;color:#fff;font-size:16px;font-weight: 700; padding-left:15px;">
+                신규 정부과제 안내
+            </td>
+            <td rowspan="2" valign="top" style="background-color:#634abb;"></td>
+        </tr>
+        <tr>
+            <td colspan="8" valign="top">
+                <table border="0" cellpadding="0" cellspacing="0" width="100%" style="background-color: #fff;">
+    """
+
+    # 루프를 도는 순서를 지정
+    is_first_department = True
+
+    for alias in ntis.ORDERED_ALIASES:
+        # all_data 딕셔너리에서 현재 부처(alias)의 공고 목록을 가져옴
+        dept_posts = all_data.get(alias, [])
+        
+        # 공고가 없으면 다음 부처로 넘어감
+        if not dept_posts:
+            continue
+        
+        html_content += legacy_department_block(alias, dept_posts, is_first_department)
+        
+        is_first_department = False
+    
+    # (HTML 푸터 부분은 동일)
+    html_content += """
+                    <tr>
+                        <td height="29" style="background-color: #634abb;border-top:1px solid #e2e2e2;" colspan="4"></td>
+                    </tr>
+                </table>
+            </td>
+        </tr>
+    </tbody>
+</table>
+</body>
+</html>
+    """
+    return html_content
+
+# -------------------- [합성 데이터] --------------------
+def make_member_data(size):
+    data = {}
+    for i in range(size):
+        company = f"회원사{i // 5:05d}"
+        data.setdefault(company, []).append({
+            "title": f"{company}, 차세대 반도체 장비 개발 착수 {i}",
+            "link": f"https://news.example.com/article/{i}",
+            "press": "예제일보",
+            "date": "11/27",
+        })
+    data["기사없는회원사"] = []
+    return data
+
+def make_keyword_data(size):
+    return [{
+        "topic": "반도체",
+        "title": f"반도체 업계 하반기 투자 확대 {i}",
+        "link": f"https://news.example.com/view/{i}",
+        "press": "예제뉴스",
+        "date": "11/27",
+    } for i in range(size)]
+
+def make_ntis_data(size):
+    data = {alias: [] for alias in ntis.ORDERED_ALIASES}
+    for i in range(size):
+        alias = ntis.ORDERED_ALIASES[i % len(ntis.ORDERED_ALIASES)]
+        data[alias].append({
+            "title": f"2026년도 연구개발사업 신규과제 공고 {i}",
+            "link": f"https://www.ntis.go.kr/rndgate/eg/un/ra/view.do?roRndUid={i}",
+            "deadline": "~12/31",
+        })
+    return data
+
+def escape_values(data):
+    """기존 방식에 이스케이프를 더한 비교 기준: 값마다 html.escape 호출"""
+    if isinstance(data, list):
+        return [{key: html.escape(str(value)) for key, value in item.items()} for item in data]
+    return {html.escape(key): escape_values(items) for key, items in data.items()}
+
+def legacy_escaped(legacy):
+    return lambda data: legacy(escape_values(data))
+
+def peak_memory(function, *args, **kwargs):
+    tracemalloc.start()
+    function(*args, **kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+class NullWriter:
+    """쓰기만 받고 버리는 파일 핸들 (흘려 쓰기의 메모리 사용량만 보기 위함)"""
+    def write(self, chunk):
+        return len(chunk)
+
+def measure(function, *args, repeat=5, **kwargs):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    cases = [
+        ("member_search", legacy_member_news_html, member_search.generate_member_news_html, make_member_data(size)),
+        ("keyword_news", legacy_table_html, keyword_news.generate_table_html, make_keyword_data(size)),
+        ("ntis", legacy_ntis_html, ntis.generate_html_file, make_ntis_data(size)),
+    ]
+    for name, legacy, current, data in cases:
+        expected, legacy_time = measure(legacy, data)
+        _, escaped_time = measure(legacy_escaped(legacy), data)
+        actual, new_time = measure(current, data)
+        _, stream_time = measure(current, data, out=io.StringIO())
+        print(f"{name} ({size}행): 결과 일치 {expected == actual}, "
+              f"기존 {legacy_time * 1000:.1f}ms, 기존+escape {escaped_time * 1000:.1f}ms, "
+              f"템플릿 {new_time * 1000:.1f}ms ({escaped_time / new_time:.1f}배), 파일로 흘려 쓰기 {stream_time * 1000:.1f}ms")
+        print(f"    최대 메모리: 기존 {peak_memory(legacy, data):.1f}MB, "
+              f"흘려 쓰기 {peak_memory(current, data, out=NullWriter()):.1f}MB")
+
+    escaped = keyword_news.generate_table_html([{"topic": "AI", "title": "<b>R&D</b> \"속보\"", "link": "https://x.com/?a=1&b=2", "press": "", "date": ""}])
+    print("이스케이프 확인:", "&lt;b&gt;R&amp;D&lt;/b&gt; &quot;속보&quot;" in escaped and "?a=1&amp;b=2" in escaped)
+
+if __name__ == "__main__":
+    main()
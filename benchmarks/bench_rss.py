@@ -0,0 +1,75 @@
+"""
+RSS 파싱 벤치마크: 기존 BeautifulSoup(text, "xml") + find_all("item") vs 응답 바이트를 조금씩 파싱하는 iter_rss_items (common/rss.py)
+
+실행: python benchmarks/bench_rss.py [저장한 RSS 파일 ...]
+파일을 주지 않으면 구글 뉴스 검색 RSS 형식의 고정 예제(100건, 기사 요약 HTML 포함)를 사용합니다.
+(실제 응답 저장 예: curl -o feed.xml "https://news.google.com/rss/search?q=반도체&hl=ko&gl=KR&ceid=KR:ko")
+두 방식의 항목 값이 같은지 확인하고, 전체 항목 / 앞 15건만 읽을 때의 피드당 처리 시간을 출력합니다.
+"""
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from common.rss import iter_rss_items
+
+def make_feed(size=100):
+    items = "".join(f"""<item><title>반도체 업계, 차세대 공정 투자 확대 &amp; 인력 양성 {i} - 예제일보</title>
+<link>https://news.google.com/rss/articles/CBMiWkFVX3lxTE{i:06d}?oc=5</link>
+<guid isPermaLink="false">CBMiWkFVX3lxTE{i:06d}</guid>
+<pubDate>Thu, 27 Nov 2025 0{i % 10}:30:00 GMT</pubDate>
+<description>&lt;a href="https://news.google.com/rss/articles/CBMiWkFVX3lxTE{i:06d}?oc=5" target="_blank"&gt;반도체 업계, 차세대 공정 투자 확대 {i}&lt;/a&gt;&amp;nbsp;&amp;nbsp;&lt;font color="#6f6f6f"&gt;예제일보&lt;/font&gt;</description>
+<source url="https://www.example-news.co.kr">예제일보</source></item>
+""" for i in range(size))
+    return f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?><rss xmlns:media="http://search.yahoo.com/mrss/" version="2.0"><channel>
+<generator>NFE/5.0</generator><title>"반도체" - Google 뉴스</title><link>https://news.google.com/search?q=%EB%B0%98%EB%8F%84%EC%B2%B4</link>
+<language>ko</language><webMaster>news-webmaster@google.com</webMaster><copyright>Copyright © 2025 Google. All rights reserved.</copyright>
+<lastBuildDate>Thu, 27 Nov 2025 12:00:00 GMT</lastBuildDate><description>Google 뉴스</description>
+{items}</channel></rss>""".encode("utf-8")
+
+def legacy_items(content, limit=None):
+    """기존 방식: 전체를 문자열로 디코딩해 BeautifulSoup XML 트리를 만든 뒤 항목을 꺼냄"""
+    soup = BeautifulSoup(content.decode("utf-8"), "xml")
+    return [(
+        item.title.text if item.title else "",
+        item.link.text if item.link else "",
+        item.source.text if item.source else "",
+        item.pubDate.text if item.pubDate else "",
+        item.description.text if item.description else "",
+    ) for item in soup.find_all("item", limit=limit)]
+
+def streaming_items(content, limit=None):
+    return [(item.title, item.link, item.source, item.pub_date, item.description)
+            for item in iter_rss_items(content, limit=limit)]
+
+def measure(function, *args, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+def main():
+    feeds = []
+    for path in sys.argv[1:]:
+        with open(path, "rb") as file:
+            feeds.append((os.path.basename(path), file.read()))
+    if not feeds:
+        feeds.append(("예제 피드", make_feed()))
+
+    for name, content in feeds:
+        for limit in (None, 15):
+            expected, legacy_time = measure(legacy_items, content, limit)
+            actual, new_time = measure(streaming_items, content, limit)
+            label = "전체" if limit is None else f"앞 {limit}건"
+            print(f"{name} ({len(content) / 1024:.0f}KB, {label}, {len(actual)}건): 결과 일치 {expected == actual}, "
+                  f"BeautifulSoup {legacy_time * 1000:.2f}ms, 스트리밍 {new_time * 1000:.2f}ms "
+                  f"({legacy_time / new_time:.1f}배)")
+
+if __name__ == "__main__":
+    main()
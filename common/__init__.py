@@ -0,0 +1 @@
+"""뉴스레터 스크립트들이 함께 사용하는 공통 모듈입니다."""
@@ -0,0 +1,116 @@
+import copy
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+
+from common.near_dup import NearDuplicateIndex
+from common.url_utils import url_key
+
+# -------------------- [설정값] --------------------
+REGISTRY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "article_registry.sqlite3")
+HISTORY_DAYS = 28  # 이 기간 안에 이전 호에 실린 기사는 다시 싣지 않음
+
+def current_issue():
+    """오늘이 속한 주(ISO 주차)를 뉴스레터 호 번호로 사용합니다. 예: 2025-W48"""
+    year, week, _ = date.today().isocalendar()
+    return f"{year}-W{week:02d}"
+
+def issue_for(date_str):
+    """YYYY-MM-DD 날짜가 속한 주의 호 번호를 반환합니다. (기간별로 여러 호를 만들 때 종료 날짜 기준)"""
+    year, week, _ = datetime.strptime(date_str, "%Y-%m-%d").date().isocalendar()
+    return f"{year}-W{week:02d}"
+
+class ArticleRegistry:
+    """
+    keyword_news, member_search, news_captor가 함께 사용하는 기사 등록부입니다.
+    정규화한 URL과 비슷한 제목(MinHash/LSH)으로 이미 실린 기사를 찾습니다.
+
+    - 다른 섹션이 같은 호에 등록한 기사, 이전 호(HISTORY_DAYS 이내)에 실린 기사는 중복으로 봅니다.
+    - 같은 섹션을 같은 호로 다시 실행하면 그 섹션의 기존 기록은 지우고 새로 등록합니다.
+    - 여러 섹션을 동시에 실행할 때는 sections에 섹션들을 모두 주고 for_section()으로 나눠 쓰면
+      한 기록(URL·제목 색인, 잠금)을 함께 보므로 먼저 등록한 섹션의 기사를 다른 섹션이 바로 제외합니다.
+    """
+    def __init__(self, section, issue=None, path=REGISTRY_PATH, history_days=HISTORY_DAYS, sections=None):
+        self.section = section
+        self.owner = True
+        self.issue = issue or current_issue()
+        self.urls = set()
+        self.titles = NearDuplicateIndex()
+        self.lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    url TEXT,
+                    title TEXT,
+                    issue TEXT,
+                    section TEXT,
+                    seen_at REAL,
+                    PRIMARY KEY (url, issue, section)
+                )
+            """)
+            self.conn.executemany("DELETE FROM articles WHERE issue = ? AND section = ?",
+                                  [(self.issue, name) for name in sections or (section,)])
+        rows = self.conn.execute(
+            "SELECT url, title FROM articles WHERE seen_at >= ?", (time.time() - history_days * 86400,)
+        )
+        for url, title in rows:
+            self._remember(url, title)
+
+    def for_section(self, section):
+        """같은 기록을 함께 쓰면서 section 이름으로 등록하는 등록부 (close()는 처음 만든 등록부만 연결을 닫음)"""
+        shared = copy.copy(self)
+        shared.section = section
+        shared.owner = False
+        return shared
+
+    def _remember(self, url, title):
+        if url:
+            self.urls.add(url)
+        if title:
+            self.titles.add(title)
+
+    def is_seen(self, url=None, title=None):
+        """URL 또는 제목이 이미 등록된 기사와 같으면 True를 반환합니다."""
+        key = url_key(url) if url and url != "#" else ""
+        with self.lock:
+            return self._is_seen(key, title)
+
+    def _is_seen(self, key, title):
+        if key and key in self.urls:
+            return True
+        return bool(title) and self.titles.is_duplicate(title)
+
+    def claim(self, url=None, title=None):
+        """처음 보는 기사면 등록하고 True, 이미 본 기사면 False를 반환합니다."""
+        key = url_key(url) if url and url != "#" else ""
+        with self.lock:
+            if self._is_seen(key, title):
+                return False
+            self._remember(key, title)
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?)",
+                    (key, title or "", self.issue, self.section, time.time())
+                )
+            return True
+
+    def set_title(self, url, title):
+        """URL만으로 등록했던 기사에 제목을 추가합니다. (news_captor처럼 가져온 뒤에 제목을 아는 경우)"""
+        key = url_key(url)
+        with self.lock:
+            if title:
+                self.titles.add(title)
+            with self.conn:
+                self.conn.execute(
+                    "UPDATE articles SET title = ? WHERE url = ? AND issue = ? AND section = ?",
+                    (title or "", key, self.issue, self.section)
+                )
+
+    def close(self):
+        if self.owner:
+            self.conn.close()
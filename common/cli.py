@@ -0,0 +1,86 @@
+import argparse
+import json
+import os
+from datetime import date, datetime, timedelta
+
+# -------------------- [설정값] --------------------
+DATE_FORMAT = "%Y-%m-%d"
+DEFAULT_DAYS = 7  # 기간을 지정하지 않으면 오늘까지 최근 7일
+
+def valid_date(text):
+    """argparse용 날짜 형식(YYYY-MM-DD) 검사"""
+    try:
+        datetime.strptime(text, DATE_FORMAT)
+    except (TypeError, ValueError):
+        raise argparse.ArgumentTypeError(f"날짜 형식이 올바르지 않습니다 (YYYY-MM-DD): {text}")
+    return text
+
+def default_date_range(days=DEFAULT_DAYS):
+    """(days일 전, 오늘) 날짜 문자열을 반환합니다."""
+    today = date.today()
+    return (today - timedelta(days=days)).strftime(DATE_FORMAT), today.strftime(DATE_FORMAT)
+
+def add_common_arguments(parser, default_output, default_count):
+    """member_search, keyword_news가 함께 쓰는 옵션 (기간, 제외 키워드, 개수, 출력 경로, 배치 파일)"""
+    default_start, default_end = default_date_range()
+    parser.add_argument("--start", type=valid_date, default=default_start, help="검색 시작 날짜 (YYYY-MM-DD, 기본: 7일 전)")
+    parser.add_argument("--end", type=valid_date, default=default_end, help="검색 종료 날짜 (YYYY-MM-DD, 기본: 오늘)")
+    parser.add_argument("--exclude", nargs="*", default=None, help="제목·요약에 있으면 제외할 키워드 (기본: 스크립트 설정값)")
+    parser.add_argument("--include", nargs="*", default=None, help="이 중 하나 이상이 있는 기사만 사용 (기본: 스크립트 설정값)")
+    parser.add_argument("--count", type=int, default=default_count, help=f"항목별 기사 수 (기본: {default_count})")
+    parser.add_argument("--output", default=default_output, help="HTML 저장 경로")
+    parser.add_argument("--manifest", default=None,
+                        help="여러 작업(기간·호)을 한 번에 실행할 JSON 배치 파일. 각 작업에 적지 않은 값은 명령줄 값을 따름")
+    parser.add_argument("--interactive", action="store_true", help="날짜를 입력받아 실행 (기존 방식)")
+
+def check_date_range(parser, job):
+    if job.start > job.end:
+        parser.error(f"시작 날짜가 종료 날짜보다 늦습니다: {job.start} > {job.end}")
+
+def load_manifest(path):
+    """
+    배치 파일을 읽어 작업 목록을 반환합니다.
+    형식: [{"start": "2025-11-01", "end": "2025-11-07", "output": "..."}, ...]
+          또는 {"defaults": {...}, "jobs": [...]} (defaults는 모든 작업에 공통으로 적용)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if isinstance(manifest, list):
+        return manifest
+    defaults = manifest.get("defaults", {})
+    return [{**defaults, **job} for job in manifest.get("jobs", [])]
+
+def iter_jobs(parser, args):
+    """
+    명령줄 값(args)에 배치 파일의 작업별 값을 덮어쓴 작업(Namespace)을 차례로 내보냅니다.
+    배치 파일이 없으면 명령줄 값 하나만 내보냅니다.
+    출력 경로를 적지 않은 작업은 '<출력 파일 이름>_<시작>_<종료>.html'로 저장합니다.
+    """
+    if not args.manifest:
+        check_date_range(parser, args)
+        yield args
+        return
+
+    try:
+        entries = load_manifest(args.manifest)
+    except (OSError, ValueError, AttributeError) as e:
+        parser.error(f"배치 파일을 읽을 수 없습니다: {e}")
+
+    base = vars(args)
+    allowed = (set(base) | {"issue"}) - {"manifest", "interactive"}
+    for number, entry in enumerate(entries, 1):
+        entry = {key.replace("-", "_"): value for key, value in entry.items()}
+        unknown = sorted(set(entry) - allowed)
+        if unknown:
+            parser.error(f"배치 파일 {number}번째 작업에 알 수 없는 항목이 있습니다: {unknown}")
+        job = argparse.Namespace(**{**base, "manifest": None, "issue": None, **entry})
+        for key in ("start", "end"):
+            try:
+                valid_date(getattr(job, key))
+            except argparse.ArgumentTypeError as e:
+                parser.error(f"배치 파일 {number}번째 작업: {e}")
+        check_date_range(parser, job)
+        if "output" not in entry:
+            stem, extension = os.path.splitext(args.output)
+            job.output = f"{stem}_{job.start}_{job.end}{extension}"
+        yield job
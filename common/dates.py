@@ -0,0 +1,145 @@
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_tz
+from functools import lru_cache
+
+# pandas가 설치되어 있으면 많은 날짜를 한 번에 변환할 때 사용
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# -------------------- [설정값] --------------------
+KST = timezone(timedelta(hours=9), "KST")  # 뉴스레터의 날짜는 모두 한국 시간 기준
+MIN_DATETIME = datetime.min.replace(tzinfo=KST)  # 날짜가 없는 기사의 정렬 키
+VECTORIZE_MIN_SIZE = 512  # 이 개수 이상이면 pandas로 한 번에 변환
+ISO_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"  # pandas가 빠르게 읽는 형식 (목록 변환 때 pubDate를 이 형식으로 옮겨 적음)
+
+MONTHS = {name: number for number, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)}
+MONTH_DIGITS = {name.capitalize(): f"{number:02d}" for name, number in MONTHS.items()}
+UTC_ZONES = {"", "gmt", "ut", "utc", "z"}
+# 구글 뉴스 RSS pubDate 형식 (예: 'Thu, 27 Nov 2025 15:30:00 GMT')
+GMT_PUB_DATE_PATTERN = re.compile(r'[A-Z][a-z]{2}, (\d{2}) ([A-Z][a-z]{2}) (\d{4}) (\d{2}:\d{2}:\d{2}) GMT')
+# RFC 822 날짜 (예: 'Thu, 27 Nov 2025 15:30:00 GMT', '27 Nov 2025 15:30 +0900')
+RFC822_PATTERN = re.compile(
+    r'\s*(?:[A-Za-z]{3},\s*)?(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([A-Za-z]*|[+-]\d{4})\s*$'
+)
+# ISO 형식 (2024-01-15, 2024-01-15T10:30:00+09:00, 2024-01-15T01:30:00Z)
+ISO_DATE_PATTERN = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2}))?(?:\.\d+)?\s*(Z|[+-]\d{2}:?\d{2})?)?'
+)
+# 한국어 형식 (2024년 1월 15일, 2024.01.15 등, 한국 시간으로 봄)
+KOREAN_DATE_PATTERN = re.compile(r'(\d{4})[년\-\.](\d{1,2})[월\-\.](\d{1,2})')
+DATE_ONLY_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+def _offset_minutes(zone):
+    """'+0900', '-05:00', 'Z' 같은 표기를 분 단위 UTC 오프셋으로 바꿉니다."""
+    if zone.lower() in UTC_ZONES:
+        return 0
+    sign = -1 if zone[0] == "-" else 1
+    digits = zone[1:].replace(":", "")
+    return sign * (int(digits[:2]) * 60 + int(digits[2:]))
+
+def _to_kst(year, month, day, hour, minute, second, offset_minutes):
+    local = datetime(year, month, day, hour, minute, second)
+    return (local + timedelta(minutes=9 * 60 - offset_minutes)).replace(tzinfo=KST)
+
+@lru_cache(maxsize=4096)
+def parse_pub_date(text):
+    """
+    RSS pubDate(RFC 822)를 한국 시간 datetime으로 바꿉니다. 형식이 다르면 None.
+    로캘과 상관없이 월 이름 표로 읽고, 흔하지 않은 표기(EST 등)만 email.utils로 넘깁니다.
+    (같은 기사가 여러 검색 결과에 나오므로 결과를 캐시함)
+    """
+    if not text:
+        return None
+    match = RFC822_PATTERN.match(text)
+    if match:
+        day, month_name, year, hour, minute, second, zone = match.groups()
+        month = MONTHS.get(month_name.lower())
+        if month and (zone.lower() in UTC_ZONES or zone[0] in "+-"):
+            try:
+                return _to_kst(int(year), month, int(day), int(hour), int(minute), int(second or 0),
+                               _offset_minutes(zone))
+            except ValueError:
+                return None
+
+    parsed = parsedate_tz(text)
+    if parsed is None:
+        return None
+    try:
+        return _to_kst(*parsed[:6], (parsed[9] or 0) // 60)
+    except (ValueError, OverflowError):
+        return None
+
+def parse_pub_dates(texts):
+    """
+    pubDate 목록을 한 번에 변환합니다. (같은 문자열은 한 번만 변환)
+    개수가 많고 pandas가 있으면 구글 뉴스 형식(GMT)을 ISO 형식으로 옮겨 적어 열 단위로 변환하고,
+    그 형식이 아닌 값만 하나씩 변환합니다.
+    """
+    texts = list(texts)
+    unique = list(dict.fromkeys(texts))
+    if pd is None or len(unique) < VECTORIZE_MIN_SIZE:
+        parsed = {text: parse_pub_date(text) for text in unique}
+        return [parsed[text] for text in texts]
+
+    iso_texts = []
+    for text in unique:
+        match = GMT_PUB_DATE_PATTERN.fullmatch(text)
+        month = MONTH_DIGITS.get(match.group(2)) if match else None
+        iso_texts.append(f"{match.group(3)}-{month}-{match.group(1)}T{match.group(4)}" if month else None)
+    converted = pd.to_datetime(pd.Series(iso_texts, dtype=object), format=ISO_DATETIME_FORMAT,
+                               errors="coerce", utc=True).dt.tz_convert(KST)
+    missing = converted.isna().to_numpy()
+    parsed = {}
+    for text, value, is_missing in zip(unique, converted.dt.to_pydatetime(), missing):
+        parsed[text] = parse_pub_date(text) if is_missing else value
+    return [parsed[text] for text in texts]
+
+def parse_date_text(date_text):
+    """
+    기사 페이지의 날짜 문자열에서 YYYY-MM-DD(한국 시간 기준) 날짜를 찾습니다. 없으면 None.
+    ISO 형식에 시간대가 있으면 한국 시간으로 바꾼 날짜를, RFC 822 형식이면 그 날짜를 반환합니다.
+    """
+    iso_match = ISO_DATE_PATTERN.search(date_text)
+    if iso_match:
+        year, month, day, hour, minute, second, zone = iso_match.groups()
+        if zone is None:
+            return f"{year}-{month}-{day}"
+        try:
+            return date_string(_to_kst(int(year), int(month), int(day), int(hour), int(minute), int(second or 0),
+                                       _offset_minutes(zone)))
+        except ValueError:
+            return f"{year}-{month}-{day}"
+    korean_match = KOREAN_DATE_PATTERN.search(date_text)
+    if korean_match:
+        year, month, day = korean_match.groups()
+        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+    pub_date = parse_pub_date(date_text.strip())
+    return date_string(pub_date) if pub_date else None
+
+def is_date_string(text):
+    """YYYY-MM-DD 형식이면 True"""
+    return bool(text) and DATE_ONLY_PATTERN.fullmatch(text) is not None
+
+def date_string(dt):
+    """YYYY-MM-DD (정렬·기간 비교용)"""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+def month_day(dt, zero_pad=True):
+    """표에 쓰는 짧은 날짜: '11/04' (zero_pad=False면 '11/4')"""
+    if zero_pad:
+        return f"{dt.month:02d}/{dt.day:02d}"
+    return f"{dt.month}/{dt.day}"
+
+def in_date_range(dt, start_date, end_date):
+    """한국 시간 날짜가 start_date~end_date(YYYY-MM-DD, 양 끝 포함) 안이면 True. 날짜가 없으면 True."""
+    if dt is None:
+        return True
+    return start_date <= date_string(dt) <= end_date
+
+def sort_key(dt):
+    """최신순 정렬 키 (날짜가 없으면 가장 오래된 것으로 봄)"""
+    return dt or MIN_DATETIME
@@ -0,0 +1,118 @@
+import html
+import string
+
+# 여러 값을 한 번에 이스케이프할 때 쓰는 구분자 (HTML 이스케이프 대상이 아니고 본문에 나오지 않는 문자)
+BATCH_SEPARATOR = "\x00"
+SPECIAL_CHARACTERS = "&<>\"'"
+
+def escape(value):
+    """HTML 본문/속성 값에 넣을 수 있도록 &, <, >, ", ' 를 이스케이프합니다."""
+    return html.escape(str(value), quote=True)
+
+def escape_column(values):
+    """
+    값 목록을 한 번에 이스케이프합니다.
+    값마다 html.escape를 부르는 대신 구분자로 이어 붙인 문자열 하나만 검사·이스케이프하고 다시 나눕니다.
+    """
+    values = [value if type(value) is str else str(value) for value in values]
+    joined = BATCH_SEPARATOR.join(values)
+    if not any(character in joined for character in SPECIAL_CHARACTERS):
+        return values  # 이스케이프할 문자가 하나도 없으면 그대로 사용
+    escaped = escape(joined).split(BATCH_SEPARATOR)
+    if len(escaped) != len(values):  # 값 안에 구분자가 들어 있으면 하나씩 처리
+        return [escape(value) for value in values]
+    return escaped
+
+def escape_rows(records, fields):
+    """딕셔너리 목록에서 fields 값을 열 단위로 한 번에 이스케이프해 (fields 순서의) 튜플 목록으로 반환합니다."""
+    records = list(records)
+    if not fields:
+        return [() for _ in records]
+    columns = [escape_column([record[field] for record in records]) for field in fields]
+    return list(zip(*columns))
+
+def _fstring_literal(text):
+    return (text.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n").replace("\r", "\\r")
+            .replace("{", "{{").replace("}", "}}"))
+
+class Template:
+    """
+    {이름} 자리표시자가 있는 HTML 조각을 한 번만 파이썬 f-string 함수로 컴파일해 두고, 행마다 값만 끼워 넣습니다.
+    raw에 적은 이름은 코드에서 만든 값(스타일, rowspan 등)이라 이스케이프하지 않습니다.
+    args를 주면 컴파일된 함수가 그 순서로 인자를 받습니다. (템플릿에 쓰이지 않는 이름도 넣을 수 있음)
+
+    - render(값...): 값을 이스케이프해서 채움
+    - fill(값...): 이미 이스케이프한 값(escape_rows 결과 등)을 그대로 채움
+    - render_rows(행 목록): 여러 행을 열 단위로 한 번에 이스케이프해서 채움
+
+    예: ROW = Template('<td>{title}</td>')  →  ROW.render(title="A & B") == '<td>A &amp; B</td>'
+    """
+    def __init__(self, text, raw=(), args=None):
+        self.text = text
+        self.fields = []
+        self.escaped_fields = []
+        literals = []
+        for literal, field, spec, conversion in string.Formatter().parse(text):
+            literals.append(_fstring_literal(literal))
+            if field is None:
+                continue
+            if spec or conversion or not field.isidentifier():
+                raise ValueError(f"지원하지 않는 자리표시자입니다: {{{field}}}")
+            if field not in self.fields:
+                self.fields.append(field)
+                if field not in raw:
+                    self.escaped_fields.append(field)
+            literals.append((field, field in raw))
+
+        fill_body = "".join(part if isinstance(part, str) else f"{{{part[0]}}}" for part in literals)
+        render_body = "".join(
+            part if isinstance(part, str) else (f"{{{part[0]}}}" if part[1] else f"{{_escape({part[0]})}}")
+            for part in literals
+        )
+        if args is None:
+            args = self.fields
+        elif set(self.fields) - set(args):
+            raise ValueError(f"args에 없는 자리표시자가 있습니다: {sorted(set(self.fields) - set(args))}")
+        self.args = list(args)
+        arguments = ", ".join(self.args)
+        source = (
+            f"def fill({arguments}):\n    return f'{fill_body}'\n"
+            f"def render({arguments}):\n    return f'{render_body}'\n"
+        )
+        namespace = {'_escape': escape}
+        exec(compile(source, "<html_render.Template>", "exec"), namespace)
+        self.fill = namespace['fill']
+        self.render = namespace['render']
+
+    def render_rows(self, rows):
+        """딕셔너리 행 목록을 열 단위로 이스케이프한 뒤, 채운 HTML 조각을 하나씩 내어 주는 이터레이터를 반환합니다."""
+        rows = list(rows)
+        columns = []
+        for field in self.args:
+            if field not in self.fields:  # 템플릿에 쓰이지 않는 인자
+                columns.append([None] * len(rows))
+                continue
+            column = [row[field] for row in rows]
+            columns.append(escape_column(column) if field in self.escaped_fields else column)
+        fill = self.fill
+        return (fill(*values) for values in zip(*columns))
+
+def write_chunks(out, chunks):
+    """조각을 파일 핸들에 차례로 씁니다. (전체 문서를 메모리에 모으지 않음)"""
+    for chunk in chunks:
+        out.write(chunk)
+
+def render_document(chunks, out=None):
+    """out이 있으면 조각을 파일 핸들로 흘려 쓰고 None을, 없으면 한 번에 이어 붙인 문자열을 반환합니다."""
+    if out is not None:
+        write_chunks(out, chunks)
+        return None
+    return "".join(chunks)
+
+def body_fragment(document):
+    """완성된 HTML 문서에서 <body> 안쪽만 꺼냅니다. <body>가 없으면(표 조각이면) 그대로 반환합니다."""
+    start = document.find("<body>")
+    end = document.rfind("</body>")
+    if start == -1 or end == -1:
+        return document
+    return document[start + len("<body>"):end]
@@ -0,0 +1,109 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# -------------------- [설정값] --------------------
+CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "http_cache.sqlite3")
+CACHE_TTL_SECONDS = 6 * 60 * 60  # 이 시간 안에는 네트워크 요청 없이 캐시를 그대로 사용
+CACHE_MAX_BYTES = 512 * 1024 * 1024  # 캐시 최대 크기, 넘으면 오래 사용하지 않은 항목부터 삭제 (LRU)
+
+class ResponseCache:
+    """URL을 키로 응답 본문을 SQLite 파일에 저장하는 디스크 캐시입니다."""
+    def __init__(self, path=CACHE_PATH, ttl=CACHE_TTL_SECONDS, max_bytes=CACHE_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    status INTEGER,
+                    headers TEXT,
+                    content BLOB,
+                    encoding TEXT,
+                    fetched_at REAL,
+                    accessed_at REAL,
+                    size INTEGER
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+
+    def lookup(self, url):
+        """캐시된 항목을 (응답, 신선 여부) 형태로 반환합니다. 없으면 (None, False)."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT status, headers, content, encoding, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None, False
+            with self.conn:
+                self.conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+        status, headers, content, encoding, fetched_at = row
+        response = build_response(url, status, json.loads(headers), content, encoding)
+        return response, (time.time() - fetched_at) < self.ttl
+
+    def store(self, url, response):
+        """200 응답을 저장하고, 최대 크기를 넘으면 LRU 순서로 정리합니다."""
+        now = time.time()
+        content = response.content
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, response.status_code, json.dumps(dict(response.headers)), content,
+                 response.encoding, now, now, len(content))
+            )
+            self._evict()
+
+    def touch(self, url, not_modified_response=None):
+        """304 응답으로 재검증된 항목의 저장 시각을 갱신합니다."""
+        now = time.time()
+        with self.lock, self.conn:
+            if not_modified_response is not None:
+                row = self.conn.execute("SELECT headers FROM responses WHERE url = ?", (url,)).fetchone()
+                if row:
+                    headers = json.loads(row[0])
+                    for key in ('ETag', 'Last-Modified'):
+                        if key in not_modified_response.headers:
+                            headers[key] = not_modified_response.headers[key]
+                    self.conn.execute("UPDATE responses SET headers = ? WHERE url = ?", (json.dumps(headers), url))
+            self.conn.execute("UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+
+    def _evict(self):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self.conn.execute("SELECT url, size FROM responses ORDER BY accessed_at").fetchall()
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+
+def build_response(url, status, headers, content, encoding):
+    """저장된 값으로 requests.Response 객체를 다시 만듭니다."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.encoding = encoding
+    response.from_cache = True
+    return response
+
+def conditional_headers(cached_response):
+    """캐시된 응답의 ETag/Last-Modified로 조건부 요청 헤더를 만듭니다."""
+    headers = {}
+    if cached_response.headers.get('ETag'):
+        headers['If-None-Match'] = cached_response.headers['ETag']
+    if cached_response.headers.get('Last-Modified'):
+        headers['If-Modified-Since'] = cached_response.headers['Last-Modified']
+    return headers
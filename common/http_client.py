@@ -0,0 +1,138 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from common.http_cache import ResponseCache, conditional_headers
+
+# -------------------- [설정값] --------------------
+CONNECT_TIMEOUT = 3.05  # 연결 타임아웃 (초)
+READ_TIMEOUT = 10  # 응답 대기 타임아웃 (초)
+MAX_RETRIES = 3  # 429/5xx 응답 또는 네트워크 오류 시 재시도 횟수
+BACKOFF_FACTOR = 0.5  # 재시도 대기 시간 = BACKOFF_FACTOR * 2^시도횟수 (+ 지터)
+BACKOFF_MAX = 30  # 재시도 대기 시간 상한 (초)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+POOL_CONNECTIONS = 32  # 연결 풀을 유지할 호스트 수
+POOL_MAXSIZE = 32  # 호스트별로 유지할 최대 연결 수
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+_session = None
+_session_lock = threading.Lock()
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_session():
+    """keep-alive 연결 풀을 가진 공용 세션을 반환합니다."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                _session = session
+    return _session
+
+def get_cache():
+    """공용 디스크 응답 캐시를 반환합니다."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
+
+def retry_after_seconds(response):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환합니다."""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+def backoff_delay(attempt):
+    """지수 백오프에 전체 지터(full jitter)를 적용한 대기 시간을 계산합니다."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_FACTOR * (2 ** attempt)))
+
+def get(url, headers=None, timeout=None, max_retries=MAX_RETRIES, use_cache=True, rate_limiter=None, **kwargs):
+    """
+    공용 세션으로 GET 요청을 보냅니다.
+    429/5xx 응답과 연결 오류는 지수 백오프로 재시도하며, Retry-After 헤더가 있으면 그 값을 따릅니다.
+    마지막 응답을 그대로 반환하므로 상태 코드 확인은 호출한 쪽에서 raise_for_status()로 합니다.
+
+    use_cache가 True이면 디스크 캐시를 먼저 확인합니다. TTL 안의 항목은 요청 없이 반환하고,
+    만료된 항목은 ETag/Last-Modified 조건부 요청으로 재검증해 304이면 캐시를 그대로 사용합니다.
+
+    rate_limiter(TokenBucket/DomainRateLimiter)가 주어지면 캐시에서 응답할 때를 제외한
+    실제 네트워크 요청(재시도 포함)마다 acquire(url)로 요청 속도를 제한합니다.
+    """
+    if not use_cache or kwargs.get('stream'):
+        return _get_with_retry(url, headers, timeout, max_retries, rate_limiter, **kwargs)
+
+    cache = get_cache()
+    cached, fresh = cache.lookup(url)
+    if cached is not None and fresh:
+        return cached
+
+    request_headers = dict(headers or {})
+    if cached is not None:
+        request_headers.update(conditional_headers(cached))
+    response = _get_with_retry(url, request_headers, timeout, max_retries, rate_limiter, **kwargs)
+
+    if cached is not None and response.status_code == 304:
+        cache.touch(url, response)
+        return cached
+    if response.status_code == 200:
+        cache.store(url, response)
+    return response
+
+def post(url, data=None, headers=None, timeout=None, max_retries=MAX_RETRIES, rate_limiter=None, **kwargs):
+    """
+    공용 세션으로 POST 요청을 보냅니다. (폼 제출로 내려받는 파일 등, 응답 캐시는 쓰지 않음)
+    재시도와 rate_limiter는 get()과 같으므로 같은 요청을 다시 보내도 되는 경우에만 사용합니다.
+    """
+    return _request_with_retry('POST', url, headers, timeout, max_retries, rate_limiter, data=data, **kwargs)
+
+def _get_with_retry(url, headers, timeout, max_retries, rate_limiter=None, **kwargs):
+    return _request_with_retry('GET', url, headers, timeout, max_retries, rate_limiter, **kwargs)
+
+def _request_with_retry(method, url, headers, timeout, max_retries, rate_limiter=None, **kwargs):
+    session = get_session()
+    timeout = timeout or (CONNECT_TIMEOUT, READ_TIMEOUT)
+    for attempt in range(max_retries + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire(url)
+        try:
+            response = session.request(method, url, headers=headers, timeout=timeout, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt >= max_retries:
+                raise
+            time.sleep(backoff_delay(attempt))
+            continue
+
+        if response.status_code not in RETRY_STATUS_CODES or attempt >= max_retries:
+            return response
+
+        delay = retry_after_seconds(response)
+        if delay is None:
+            delay = backoff_delay(attempt)
+        response.close()
+        time.sleep(min(delay, BACKOFF_MAX))
+    return response
@@ -0,0 +1,103 @@
+import hashlib
+import random
+from functools import lru_cache
+
+# -------------------- [설정값] --------------------
+SIMILARITY_THRESHOLD = 0.5  # 단어 집합 자카드 유사도가 이 값 이상이면 중복으로 판단
+NUM_PERM = 96  # MinHash 서명 길이
+BANDS = 32  # LSH 밴드 수 (NUM_PERM = BANDS * ROWS)
+ROWS = 3  # 밴드당 행 수, 유사도 0.5인 쌍이 후보로 잡힐 확률 약 98.6%
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(20240101)  # 실행마다 같은 서명이 나오도록 고정된 시드 사용
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+
+def title_tokens(title):
+    """제목을 공백 기준 단어 집합으로 바꿉니다. (is_similar_by_words와 같은 기준)"""
+    return frozenset(title.split())
+
+def jaccard(tokens1, tokens2):
+    """두 단어 집합의 자카드 유사도를 계산합니다. 한쪽이라도 비어 있으면 0입니다."""
+    if not tokens1 or not tokens2:
+        return 0.0
+    return len(tokens1 & tokens2) / len(tokens1 | tokens2)
+
+@lru_cache(maxsize=200000)
+def _token_permutations(token):
+    """단어 하나의 순열 해시 값들 (헤드라인은 단어가 많이 겹치므로 단어별로 캐시)"""
+    h = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+    return tuple((a * h + b) % _MERSENNE_PRIME for a, b in _PERMUTATIONS)
+
+def minhash_signature(tokens):
+    """단어 집합의 MinHash 서명을 계산합니다."""
+    return tuple(map(min, zip(*[_token_permutations(token) for token in tokens])))
+
+def band_keys(signature):
+    """서명을 밴드 단위로 나눈 LSH 버킷 키 목록을 반환합니다."""
+    return [(band, signature[band * ROWS:(band + 1) * ROWS]) for band in range(BANDS)]
+
+class NearDuplicateIndex:
+    """
+    MinHash + LSH 밴딩으로 비슷한 제목을 빠르게 찾는 색인입니다.
+    LSH로 후보를 고른 뒤 실제 자카드 유사도로 다시 확인하므로,
+    중복 판정 기준은 기존 is_similar_by_words(기준값 0.5)와 같습니다.
+    """
+    def __init__(self, threshold=SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.buckets = {}
+        self.token_sets = []
+        self.keys = []
+
+    def __len__(self):
+        return len(self.token_sets)
+
+    def candidates(self, signature):
+        """같은 LSH 버킷에 들어간 항목 번호들을 반환합니다."""
+        found = set()
+        for band_key in band_keys(signature):
+            found.update(self.buckets.get(band_key, ()))
+        return found
+
+    def _find(self, tokens, signature):
+        for item_id in self.candidates(signature):
+            if jaccard(tokens, self.token_sets[item_id]) >= self.threshold:
+                return item_id
+        return None
+
+    def _insert(self, tokens, signature, key):
+        item_id = len(self.token_sets)
+        self.token_sets.append(tokens)
+        self.keys.append(key)
+        if tokens:
+            for band_key in band_keys(signature):
+                self.buckets.setdefault(band_key, []).append(item_id)
+        return item_id
+
+    def find_similar(self, title):
+        """title과 비슷한 기존 항목의 key를 반환합니다. 없으면 None."""
+        tokens = title_tokens(title)
+        if not tokens:
+            return None
+        item_id = self._find(tokens, minhash_signature(tokens))
+        return None if item_id is None else self.keys[item_id]
+
+    def is_duplicate(self, title):
+        return self.find_similar(title) is not None
+
+    def add(self, title, key=None):
+        """제목을 색인에 추가합니다. key는 find_similar에서 돌려받을 값입니다."""
+        tokens = title_tokens(title)
+        signature = minhash_signature(tokens) if tokens else None
+        return self._insert(tokens, signature, title if key is None else key)
+
+    def add_if_new(self, title, key=None):
+        """비슷한 항목이 없을 때만 추가하고, 추가했으면 True를 반환합니다."""
+        tokens = title_tokens(title)
+        if not tokens:
+            self._insert(tokens, None, title if key is None else key)
+            return True
+        signature = minhash_signature(tokens)
+        if self._find(tokens, signature) is not None:
+            return False
+        self._insert(tokens, signature, title if key is None else key)
+        return True
@@ -0,0 +1,46 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+class TokenBucket:
+    """토큰 버킷 방식으로 초당 요청 수를 제한합니다."""
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, url=None):
+        """토큰을 하나 얻을 때까지 대기합니다. (url은 DomainRateLimiter와 호출 형식을 맞추기 위한 인자)"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class DomainRateLimiter:
+    """도메인마다 별도의 토큰 버킷을 두어 언론사별로 요청 속도를 제한합니다."""
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, url):
+        domain = get_domain_key(url)
+        with self.lock:
+            bucket = self.buckets.get(domain)
+            if bucket is None:
+                bucket = self.buckets[domain] = TokenBucket(self.rate, self.capacity)
+        bucket.acquire()
+
+def get_domain_key(url):
+    """'www.' 접두어를 제외한 도메인을 반환합니다. (www.yna.co.kr → yna.co.kr)"""
+    domain = urlparse(url.strip()).netloc.lower()
+    return domain[4:] if domain.startswith('www.') else domain
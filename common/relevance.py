@@ -0,0 +1,107 @@
+import threading
+from collections import Counter, deque
+
+class AhoCorasick:
+    """
+    여러 키워드를 한 번에 찾는 Aho-Corasick 자동자입니다. (대소문자 무시)
+    키워드가 수백 개여도 본문을 한 번만 훑습니다.
+    """
+    def __init__(self, terms):
+        self.terms = []
+        self.transitions = [{}]
+        self.fail = [0]
+        self.outputs = [[]]
+        for term in terms:
+            self._insert(term.lower())
+        self._build_fail_links()
+
+    def _insert(self, term):
+        if not term:
+            return
+        node = 0
+        for character in term:
+            next_node = self.transitions[node].get(character)
+            if next_node is None:
+                next_node = len(self.transitions)
+                self.transitions[node][character] = next_node
+                self.transitions.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            node = next_node
+        self.outputs[node].append(len(self.terms))
+        self.terms.append(term)
+
+    def _build_fail_links(self):
+        queue = deque(self.transitions[0].values())
+        while queue:
+            node = queue.popleft()
+            for character, child in self.transitions[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and character not in self.transitions[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.transitions[fallback].get(character, 0)
+                # 실패 링크 쪽에서 끝나는 키워드도 함께 출력 (예: '목표주가' 안의 '주가')
+                self.outputs[child] = self.outputs[child] + self.outputs[self.fail[child]]
+
+    def find(self, text):
+        """text에 들어 있는 키워드 번호 집합을 반환합니다."""
+        found = set()
+        transitions, fail, outputs = self.transitions, self.fail, self.outputs
+        node = 0
+        for character in text.lower():
+            while node and character not in transitions[node]:
+                node = fail[node]
+            node = transitions[node].get(character, 0)
+            if outputs[node]:
+                found.update(outputs[node])
+        return found
+
+class RelevanceFilter:
+    """
+    섹션별 제외/포함 키워드로 RSS 기사를 로컬에서 거릅니다. (검색어에 -"키워드"를 붙이지 않음)
+
+    - exclude: 하나라도 들어 있으면 제외
+    - include: 비어 있지 않으면 하나 이상 들어 있어야 통과
+    - hits: 키워드별로 걸린 횟수, kept/excluded/not_included: 통과·제외 건수 (여러 스레드에서 함께 써도 됨)
+    """
+    def __init__(self, section, exclude=(), include=()):
+        self.section = section
+        self.exclude = list(dict.fromkeys(term for term in exclude if term))
+        self.include = list(dict.fromkeys(term for term in include if term))
+        self.terms = self.exclude + self.include
+        self.automaton = AhoCorasick(self.terms)
+        self.excluded_ids = set(range(len(self.exclude)))  # 자동자의 키워드 번호는 exclude, include 순서
+        self.hits = Counter()
+        self.kept = 0
+        self.excluded = 0
+        self.not_included = 0
+        self.lock = threading.Lock()
+
+    def check(self, *texts):
+        """제목·요약 등(태그·URL을 지운 글자)을 받아 통과하면 True를 반환하고 결과를 집계합니다."""
+        found = self.automaton.find(" \n ".join(text for text in texts if text))
+        excluded = found & self.excluded_ids
+        with self.lock:
+            for index in found:
+                self.hits[self.terms[index]] += 1
+            if excluded:
+                self.excluded += 1
+                return False
+            if self.include and not (found - self.excluded_ids):
+                self.not_included += 1
+                return False
+            self.kept += 1
+            return True
+
+    def summary(self, top=5):
+        top_hits = ", ".join(f"{term} {count}" for term, count in self.hits.most_common(top))
+        text = f"[{self.section}] 통과 {self.kept}건, 제외 키워드로 제외 {self.excluded}건"
+        if self.include:
+            text += f", 포함 키워드 없음 {self.not_included}건"
+        if top_hits:
+            text += f" (많이 걸린 키워드: {top_hits})"
+        return text
+
+    def report(self):
+        print(f"🔎 {self.summary()}")
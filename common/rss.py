@@ -0,0 +1,84 @@
+import html
+import re
+from xml.etree import ElementTree
+
+# -------------------- [설정값] --------------------
+FEED_CHUNK_SIZE = 16 * 1024  # 파서에 한 번에 넣는 응답 바이트 수 (필요한 항목을 다 읽으면 나머지는 파싱하지 않음)
+TAG_PATTERN = re.compile(r'<[^>]*>')
+URL_PATTERN = re.compile(r'(?:https?://|www\.)\S+')
+ITEM_FIELDS = {"title": "title", "link": "link", "source": "source", "pubDate": "pub_date", "description": "description"}
+
+class RssItem:
+    """RSS <item> 하나의 값 (없는 항목은 빈 문자열)"""
+    __slots__ = ("title", "link", "source", "pub_date", "description")
+
+    def __init__(self, title="", link="", source="", pub_date="", description=""):
+        self.title = title
+        self.link = link
+        self.source = source
+        self.pub_date = pub_date
+        self.description = description
+
+    def __repr__(self):
+        return f"RssItem(title={self.title!r}, link={self.link!r})"
+
+def plain_text(markup):
+    """
+    RSS description 같은 HTML 조각에서 태그와 URL을 지우고 보이는 글자만 남깁니다.
+    (구글 뉴스 description의 기사 링크 ID 안 글자가 키워드로 잘못 일치하지 않게 함)
+    """
+    if not markup:
+        return ""
+    text = html.unescape(TAG_PATTERN.sub(" ", markup))
+    return " ".join(URL_PATTERN.sub(" ", text).split())
+
+def _local_name(tag):
+    return tag.rsplit("}", 1)[-1] if "}" in tag else tag
+
+def _element_text(element):
+    if len(element):
+        return "".join(element.itertext())
+    return element.text or ""
+
+def _to_item(element):
+    values = {}
+    for child in element:
+        field = ITEM_FIELDS.get(_local_name(child.tag))
+        if field is not None and field not in values:
+            values[field] = _element_text(child)
+    return RssItem(**values)
+
+def iter_rss_items(content, limit=None, chunk_size=FEED_CHUNK_SIZE):
+    """
+    RSS 응답 바이트를 조금씩 파서에 넣으며 <item>을 다 읽을 때마다 RssItem을 하나씩 내어 줍니다.
+    (BeautifulSoup처럼 전체 문자열로 디코딩하거나 트리 전체를 만들지 않음)
+
+    limit개를 내보냈거나 호출한 쪽이 반복을 멈추면 남은 바이트는 파싱하지 않습니다.
+    XML이 깨져 있으면 그때까지 읽은 항목만 내보내고 멈춥니다.
+    """
+    if limit is not None and limit <= 0:
+        return
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    parser = ElementTree.XMLPullParser(events=("end",))
+    produced = 0
+    try:
+        for element in _iter_item_elements(parser, content, chunk_size):
+            yield _to_item(element)
+            element.clear()  # 읽은 항목은 바로 비워 트리가 커지지 않게 함
+            produced += 1
+            if limit is not None and produced >= limit:
+                return
+    except ElementTree.ParseError as e:
+        print(f"⚠️ RSS 응답을 끝까지 파싱하지 못했습니다 ({produced}건까지 사용): {e}")
+
+def _iter_item_elements(parser, content, chunk_size):
+    for offset in range(0, len(content), chunk_size):
+        parser.feed(content[offset:offset + chunk_size])
+        for _, element in parser.read_events():
+            if _local_name(element.tag) == "item":
+                yield element
+    parser.close()
+    for _, element in parser.read_events():
+        if _local_name(element.tag) == "item":
+            yield element
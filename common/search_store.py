@@ -0,0 +1,176 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+from common import dates
+from common.rss import RssItem
+
+# -------------------- [설정값] --------------------
+STORE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "search_store.sqlite3")
+RSS_ITEM_LIMIT = 100  # 구글 뉴스 RSS가 한 번에 돌려주는 최대 기사 수 (이만큼 받았으면 기간 전체를 받았다고 보지 않음)
+SETTLE_DAYS = 2  # 오늘부터 이 일수 안의 날짜는 기사가 더 올라올 수 있어 받은 기간으로 기록하지 않음
+RETENTION_DAYS = 120  # 이보다 오래된 날짜의 기사와 기록은 지움
+# 구간 검색어의 after:/before:는 그 날짜를 빼므로 양쪽을 넓히고, 구글 뉴스 날짜가 UTC 기준이어도
+# 한국 시간 첫날 새벽(전날 UTC 15시~)까지 들어오도록 시작 쪽을 하루 더 넓힘
+QUERY_PADDING_BEFORE = 2
+QUERY_PADDING_AFTER = 1
+SCHEMA_VERSION = 3  # 저장 형식이나 받은 구간 기록 방식이 바뀌면 올림 (이전 기록은 지우고 다시 검색)
+
+def _shift(date_str, days):
+    return dates.date_string(datetime.strptime(date_str, "%Y-%m-%d") + timedelta(days=days))
+
+def merge_ranges(ranges):
+    """(시작, 종료) 날짜 구간 목록에서 겹치거나 맞닿은 구간을 합칩니다. (양 끝 포함, YYYY-MM-DD)"""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= _shift(merged[-1][1], 1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+def subtract_ranges(start, end, covered):
+    """start~end 중 covered(합쳐진 구간 목록)에 들어 있지 않은 구간 목록을 반환합니다."""
+    missing = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            missing.append((cursor, _shift(covered_start, -1)))
+        cursor = max(cursor, _shift(covered_end, 1))
+        if cursor > end:
+            return missing
+    if cursor <= end:
+        missing.append((cursor, end))
+    return missing
+
+class SearchStore:
+    """
+    검색어별로 받은 RSS 기사와 이미 받은 날짜 구간을 기록하는 저장소입니다.
+    (member_search, keyword_news가 기간을 옮기거나 넓혀 다시 실행할 때 앞서 받은 기간은 다시 검색하지 않음)
+
+    - fetch(): 요청한 기간 중 아직 받지 않은 구간만 검색하고, 저장된 기사와 합쳐 기간 안의 기사를
+      검색 결과 순서(RSS 안의 순위)대로 반환 (순위가 같으면 최신순, 구간을 나눠 받았으면 구간별 순위가 번갈아 나옴)
+    - 저장하는 값은 필터·중복 제거 전의 원래 항목이므로 제외 키워드나 기사 수를 바꿔도 다시 검색하지 않음
+    - 날짜(한국 시간)를 알 수 없는 기사는 기간에 넣을 수 없어 저장하지 않음
+    """
+    def __init__(self, path=STORE_PATH, settle_days=SETTLE_DAYS, retention_days=RETENTION_DAYS):
+        self.settle_days = settle_days
+        self.lock = threading.Lock()
+        self.fetched_ranges = 0
+        self.reused_ranges = 0
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.conn:
+            if self.conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                self.conn.execute("DROP TABLE IF EXISTS items")
+                self.conn.execute("DROP TABLE IF EXISTS coverage")
+                self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS items (
+                    query TEXT,
+                    link TEXT,
+                    title TEXT,
+                    source TEXT,
+                    pub_date TEXT,
+                    description TEXT,
+                    published TEXT,
+                    rank INTEGER,
+                    fetched_at REAL,
+                    PRIMARY KEY (query, link)
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS items_by_date ON items (query, published)")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS coverage (
+                    query TEXT,
+                    start TEXT,
+                    end TEXT
+                )
+            """)
+            cutoff = _shift(self._today(), -retention_days)
+            self.conn.execute("DELETE FROM items WHERE published < ?", (cutoff,))
+            self.conn.execute("DELETE FROM coverage WHERE end < ?", (cutoff,))
+            self.conn.execute("UPDATE coverage SET start = ? WHERE start < ?", (cutoff, cutoff))
+
+    @staticmethod
+    def _today():
+        return dates.date_string(datetime.now(dates.KST))
+
+    def covered_ranges(self, query):
+        with self.lock:
+            rows = self.conn.execute("SELECT start, end FROM coverage WHERE query = ?", (query,)).fetchall()
+        return merge_ranges(rows)
+
+    def missing_ranges(self, query, start_date, end_date):
+        """start_date~end_date 중 아직 받지 않은 날짜 구간 목록"""
+        return subtract_ranges(start_date, end_date, self.covered_ranges(query))
+
+    @staticmethod
+    def query_bounds(start_date, end_date):
+        """start_date~end_date(한국 시간, 양 끝 포함)를 빠짐없이 덮는 검색어의 (after, before) 날짜"""
+        return _shift(start_date, -QUERY_PADDING_BEFORE), _shift(end_date, QUERY_PADDING_AFTER)
+
+    def fetch(self, query, start_date, end_date, fetch_range):
+        """
+        받지 않은 구간마다 fetch_range(after, before)로 RSS 항목을 받아 저장한 뒤,
+        저장된 기사 중 한국 시간 날짜가 start_date~end_date 안인 것을 검색 결과 순서대로 RssItem 목록으로 반환합니다.
+        after/before는 검색어의 after:/before: 값 그대로이며(둘 다 그 날짜는 빠짐) 구간보다 넓게 잡습니다.
+        넓게 받은 구간 밖의 기사도 저장하지만, 받은 구간으로 기록하는 것은 요청한 빠진 날짜들뿐입니다.
+        """
+        missing = self.missing_ranges(query, start_date, end_date)
+        if not missing:
+            with self.lock:
+                self.reused_ranges += 1
+        for range_start, range_end in missing:
+            items = list(fetch_range(*self.query_bounds(range_start, range_end)))
+            with self.lock:
+                self.fetched_ranges += 1
+                self._save(query, items)
+                if len(items) < RSS_ITEM_LIMIT:
+                    self._mark_covered(query, range_start, range_end)
+        return self.items(query, start_date, end_date)
+
+    def _save(self, query, items):
+        now = time.time()
+        rows = []
+        for rank, item in enumerate(items):
+            published = dates.parse_pub_date(item.pub_date)
+            if published is None or not item.link:
+                continue
+            rows.append((query, item.link, item.title, item.source, item.pub_date, item.description,
+                         published.strftime("%Y-%m-%d %H:%M:%S"), rank, now))
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def _mark_covered(self, query, start_date, end_date):
+        # 최근 며칠은 기사가 더 올라올 수 있으므로 다음 실행에서 다시 검색
+        end_date = min(end_date, _shift(self._today(), -self.settle_days))
+        if start_date > end_date:
+            return
+        rows = self.conn.execute("SELECT start, end FROM coverage WHERE query = ?", (query,)).fetchall()
+        merged = merge_ranges(rows + [(start_date, end_date)])
+        with self.conn:
+            self.conn.execute("DELETE FROM coverage WHERE query = ?", (query,))
+            self.conn.executemany("INSERT INTO coverage VALUES (?, ?, ?)", [(query, start, end) for start, end in merged])
+
+    def items(self, query, start_date, end_date):
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT title, link, source, pub_date, description FROM items "
+                "WHERE query = ? AND published >= ? AND published < ? ORDER BY rank, published DESC",
+                (query, start_date, _shift(end_date, 1)),
+            ).fetchall()
+        return [RssItem(*row) for row in rows]
+
+    def report(self):
+        print(f"🗂️ 검색 저장소: 새로 검색한 구간 {self.fetched_ranges}개, 검색 없이 저장된 기사만 쓴 검색어 {self.reused_ranges}개")
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,143 @@
+import base64
+import binascii
+import html
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# 기사 식별과 무관한 추적용 쿼리 파라미터 (예: 연합뉴스 ?input=1195m)
+TRACKING_PARAMS = {
+    "input", "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
+    "fbclid", "gclid", "ref", "from", "sns", "cmpid", "oc", "ocid"
+}
+
+def canonicalize_url(url):
+    """
+    같은 기사가 같은 URL을 갖도록 정규화합니다.
+    (http→https, 호스트 소문자, 기본 포트·추적 파라미터·#조각·끝의 '/' 제거)
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+    host = parts.netloc.lower()
+    if host.endswith(":443") or host.endswith(":80"):
+        host = host.rsplit(":", 1)[0]
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ])
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, query, ""))
+
+def url_key(url):
+    """중복 확인용 키. 정규화한 URL에서 'www.'까지 떼어 www 유무가 달라도 같은 기사로 봅니다."""
+    canonical = canonicalize_url(url)
+    return canonical.replace("://www.", "://", 1)
+
+# -------------------- [구글 뉴스 링크 → 언론사 원문 링크] --------------------
+RESOLUTION_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "url_resolutions.sqlite3")
+GOOGLE_NEWS_HOST = "news.google.com"
+EMBEDDED_URL_PATTERN = re.compile(rb'https?://[\x21-\x7e]+')
+PUBLISHER_URL_PATTERN = re.compile(r'data-n-au="([^"]+)"')
+
+class UrlResolutionCache:
+    """구글 뉴스 링크를 풀어낸 결과를 저장해, 같은 링크는 한 번만 따라가도록 합니다."""
+    def __init__(self, path=RESOLUTION_CACHE_PATH):
+        self.lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS resolutions (
+                    source_url TEXT PRIMARY KEY,
+                    resolved_url TEXT,
+                    resolved_at REAL
+                )
+            """)
+
+    def get(self, source_url):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT resolved_url FROM resolutions WHERE source_url = ?", (source_url,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, source_url, resolved_url):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO resolutions VALUES (?, ?, ?)", (source_url, resolved_url, time.time())
+            )
+
+_resolution_cache = None
+_resolution_cache_lock = threading.Lock()
+
+def get_resolution_cache():
+    global _resolution_cache
+    if _resolution_cache is None:
+        with _resolution_cache_lock:
+            if _resolution_cache is None:
+                _resolution_cache = UrlResolutionCache()
+    return _resolution_cache
+
+def is_google_news_url(url):
+    return urlsplit(url).netloc.lower() == GOOGLE_NEWS_HOST
+
+def decode_google_news_url(url):
+    """
+    구글 뉴스 기사 ID(base64)에 원문 URL이 들어 있는 예전 형식이면 네트워크 없이 꺼냅니다.
+    새 형식이라 들어 있지 않으면 None을 반환합니다.
+    """
+    path = urlsplit(url).path
+    if "/articles/" not in path:
+        return None
+    article_id = path.rsplit("/articles/", 1)[1].split("/")[0]
+    try:
+        decoded = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (ValueError, binascii.Error):
+        return None
+    match = EMBEDDED_URL_PATTERN.search(decoded)
+    return match.group(0).decode("ascii") if match else None
+
+def follow_google_news_url(url, rate_limiter=None):
+    """
+    리다이렉트를 따라가거나 구글 뉴스 페이지의 data-n-au 속성에서 원문 URL을 찾습니다.
+    rate_limiter가 주어지면 요청 전에 적용합니다. (RSS 검색과 같은 구글 뉴스 요청 속도 제한)
+    """
+    from common import http_client
+
+    response = http_client.get(url, use_cache=False, rate_limiter=rate_limiter)
+    response.raise_for_status()
+    if not is_google_news_url(response.url):
+        return response.url
+    match = PUBLISHER_URL_PATTERN.search(response.text)
+    return html.unescape(match.group(1)) if match else None
+
+def resolve_article_url(url, rate_limiter=None):
+    """
+    구글 뉴스 링크면 언론사 원문 URL로 바꿉니다. 결과는 디스크에 저장해 다시 요청하지 않습니다.
+    풀어내지 못하면 원래 링크를 그대로 반환합니다. rate_limiter는 네트워크 요청을 보낼 때만 씁니다.
+    """
+    if not url or not is_google_news_url(url):
+        return url
+    cache = get_resolution_cache()
+    resolved = cache.get(url)
+    if resolved:
+        return resolved
+    resolved = decode_google_news_url(url)
+    if not resolved:
+        try:
+            resolved = follow_google_news_url(url, rate_limiter)
+        except Exception as e:
+            print(f"오류: 구글 뉴스 링크를 원문 링크로 바꾸지 못했습니다: {e}")
+            return url
+    if not resolved:
+        return url
+    cache.put(url, resolved)
+    return resolved
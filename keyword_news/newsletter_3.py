@@ -1,7 +1,24 @@
 import requests
-from bs4 import BeautifulSoup
+import argparse
 import datetime
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# 공통 모듈(common) 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import cli
+from common import dates
+from common import http_client
+from common import html_render
+from common.article_registry import ArticleRegistry, issue_for
+from common.rate_limit import TokenBucket
+from common.relevance import RelevanceFilter
+from common.rss import iter_rss_items, plain_text
+from common.search_store import SearchStore
+from common.url_utils import canonicalize_url, resolve_article_url
 
 # -------------------- [설정값] --------------------
 
@@ -12,11 +29,30 @@ TOPICS = [
 ]
 
 # ✨ 추가됨: 검색에서 제외할 키워드 목록
+# (검색어에 붙이지 않고 받은 기사의 제목·요약을 로컬에서 거름, common/relevance.py)
 KEYWORDS_TO_EXCLUDE = ["투자", "MOU", "취임", "협력", "선정", "징역"]
 
+# 비어 있지 않으면 이 중 하나 이상이 들어 있는 기사만 사용
+KEYWORDS_TO_INCLUDE = []
+
 # 키워드별로 가져올 기사 수
 ARTICLES_PER_TOPIC = 1
 
+# 한 번의 RSS 검색에 OR로 묶을 키워드 수 (1이면 키워드마다 따로 검색)
+TOPICS_PER_QUERY = 5
+
+# 동시에 보낼 최대 검색 수 (묶음 검색, 보충 검색 각각, 1이면 순차 실행)
+MAX_WORKERS = 4
+
+# 구글 뉴스 요청(RSS 검색, 기사 링크 풀기) 전체 초당 요청 수 상한
+GOOGLE_NEWS_REQUESTS_PER_SECOND = 2.0
+
+# 다른 섹션·이전 호에 실린 기사 제외 (common/article_registry.py)
+USE_ARTICLE_REGISTRY = True
+
+# 앞선 실행에서 검색한 기간은 다시 검색하지 않고 저장된 기사 사용 (common/search_store.py)
+USE_SEARCH_STORE = True
+
 # 최종 저장될 HTML 파일 이름
 OUTPUT_HTML_FILENAME = "keyword_news.html"
 
@@ -34,63 +70,199 @@ def get_date_input(prompt, default):
             print("❌ 날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 다시 입력해주세요.")
 
 # -------------------- [뉴스 검색 함수 (✨수정됨)] --------------------
-def search_google_news_rss(topic, count, start_date, end_date):
-    """지정된 기간과 키워드로 구글 뉴스 RSS를 검색합니다."""
-    
-    exclude_query = " ".join([f'-"{keyword}"' for keyword in KEYWORDS_TO_EXCLUDE])
-    search_query = f'"{topic}" "기술" {exclude_query} after:{start_date} before:{end_date}'
-    
-    print(f"-> '{topic} 기술' 관련 뉴스를 검색합니다... ({start_date}~{end_date})")
-    
+def request_rss_items(search_query, rate_limiter=None):
+    """구글 뉴스 RSS를 요청해 RSS 항목 이터레이터를 반환합니다."""
     encoded_query = requests.utils.quote(search_query)
     url = f"https://news.google.com/rss/search?q={encoded_query}&hl=ko&gl=KR&ceid=KR:ko"
-    
+
+    res = http_client.get(url, rate_limiter=rate_limiter)
+    res.raise_for_status()
+    # 응답 바이트를 조금씩 파싱하며 항목을 하나씩 받음 (limit개를 채우면 나머지는 파싱하지 않음)
+    return iter_rss_items(res.content)
+
+def fetch_rss_items(topics, start_date, end_date, limit, relevance=None, store=None, rate_limiter=None):
+    """
+    키워드를 OR로 묶어 구글 뉴스 RSS를 검색해 기사 정보(제목, 링크, 언론사, 날짜, 매칭용 본문) 목록을 반환합니다.
+    relevance(RelevanceFilter)가 주어지면 걸러진 기사는 빼고 limit개까지 채웁니다.
+    한국 시간 기준 날짜가 기간 밖인 기사도 뺍니다. (구글 뉴스 기간 검색은 UTC 기준)
+    store(SearchStore)가 주어지면 앞서 검색한 기간은 저장된 기사를 쓰고 남은 기간만 검색합니다. (검색 결과 순서)
+    """
+    if store is None:
+        items = request_rss_items(build_search_query(topics, start_date, end_date), rate_limiter)
+    else:
+        def fetch_range(after, before):
+            return request_rss_items(build_search_query(topics, after, before), rate_limiter)
+        items = store.fetch(build_topic_query(topics), start_date, end_date, fetch_range)
+
+    items = (item for item in items if relevance is None or relevance.check(item.title, plain_text(item.description)))
+    if limit is None:
+        # 전체를 읽는 묶음 검색은 날짜를 한 번에 변환
+        items = list(items)
+        dated_items = zip(items, dates.parse_pub_dates(item.pub_date for item in items))
+    else:
+        dated_items = ((item, dates.parse_pub_date(item.pub_date)) for item in items)
+
     results = []
+    for item, pub_date in dated_items:
+        if limit is not None and len(results) >= limit:
+            break
+        if not dates.in_date_range(pub_date, start_date, end_date):
+            continue
+        # ✨ 수정됨: 제목에서 ' - 언론사' 부분 제거
+        raw_title = item.title or "제목 없음"
+        if ' - ' in raw_title:
+            title = raw_title.rsplit(' - ', 1)[0].strip()
+        else:
+            title = raw_title
+
+        if pub_date is not None:
+            news_date = dates.month_day(pub_date, zero_pad=False)
+        else:
+            news_date = "날짜 오류" if item.pub_date else ""
+
+        results.append({
+            "title": title,
+            "link": item.link or "#",
+            "press": item.source or "언론사 불명",
+            "date": news_date,
+            # 키워드 배정용 본문: 제목 + 태그·링크를 지운 요약 글자 (링크 ID 속 글자와 일치하지 않게 함)
+            "match_text": f"{raw_title} {plain_text(item.description)}".lower()
+        })
+    return results
+
+def build_relevance_filter(exclude_keywords=None, include_keywords=None):
+    """키워드 뉴스 섹션의 제외/포함 키워드 필터를 만듭니다. (주지 않으면 설정값 사용)"""
+    return RelevanceFilter(
+        "keyword_news",
+        KEYWORDS_TO_EXCLUDE if exclude_keywords is None else exclude_keywords,
+        KEYWORDS_TO_INCLUDE if include_keywords is None else include_keywords,
+    )
+
+def build_topic_query(topics):
+    """
+    하나 이상의 키워드를 OR로 묶은 기간 없는 검색어를 만듭니다. 예: ("반도체" OR "AI") "기술"
+    제외 키워드는 검색어에 넣지 않고 RelevanceFilter로 거르므로 검색 주소가 짧고 캐시를 함께 씁니다.
+    """
+    if len(topics) == 1:
+        topic_query = f'"{topics[0]}"'
+    else:
+        topic_query = "(" + " OR ".join(f'"{topic}"' for topic in topics) + ")"
+    return f'{topic_query} "기술"'
+
+def build_search_query(topics, start_date, end_date):
+    """기간을 붙인 검색어 예: ("반도체" OR "AI") "기술" after:... before:..."""
+    return f'{build_topic_query(topics)} after:{start_date} before:{end_date}'
+
+@lru_cache(maxsize=None)
+def topic_pattern(topic):
+    """
+    키워드 일치용 정규식. 영문·숫자로만 된 키워드(AI, ESG 등)는 앞뒤가 영문·숫자가 아니어야 일치하고
+    ('said' 안의 'ai'는 제외, 'AI반도체'는 일치), 한글이 섞인 키워드는 조사가 붙어도 되도록 부분 일치로 찾습니다.
+    """
+    escaped = re.escape(topic.lower())
+    if re.fullmatch(r'[a-z0-9]+', topic.lower()):
+        return re.compile(rf'(?<![a-z0-9]){escaped}(?![a-z0-9])')
+    return re.compile(escaped)
+
+def mentions_topic(topic, match_text):
+    """소문자로 바꾼 제목·요약(match_text)에 키워드가 있으면 True"""
+    return topic_pattern(topic).search(match_text) is not None
+
+def to_news(topic, item, rate_limiter=None):
+    """
+    검색 결과 항목을 HTML 생성에 쓰는 뉴스 형식으로 바꿉니다.
+    구글 뉴스 링크는 원문 링크로 바꾸며, 정규화한 URL은 중복 확인에만 쓰고 링크는 원문 그대로 둡니다.
+    """
+    return {
+        "topic": topic,
+        "title": item["title"],
+        "link": resolve_article_url(item["link"], rate_limiter),
+        "press": item["press"],
+        "date": item["date"]
+    }
+
+def search_google_news_rss(topic, count, start_date, end_date, relevance=None, store=None, rate_limiter=None):
+    """지정된 기간과 키워드로 구글 뉴스 RSS를 검색합니다."""
+    print(f"-> '{topic} 기술' 관련 뉴스를 검색합니다... ({start_date}~{end_date})")
+
     try:
-        res = requests.get(url, timeout=10)
-        res.raise_for_status()
-        soup = BeautifulSoup(res.text, "xml")
-        
-        items = soup.find_all("item", limit=count)
-        for item in items:
-            # ✨ 수정됨: 제목에서 ' - 언론사' 부분 제거
-            raw_title = item.title.text if item.title else "제목 없음"
-            if ' - ' in raw_title:
-                title = raw_title.rsplit(' - ', 1)[0].strip()
-            else:
-                title = raw_title
-
-            link = item.link.text if item.link else "#"
-            press = item.source.text if item.source else "언론사 불명"
-            pubdate = item.pubDate.text if item.pubDate else ""
-            
-            news_date = ""
-            if pubdate:
-                try:
-                    dt = datetime.datetime.strptime(pubdate.replace(" GMT", ""), "%a, %d %b %Y %H:%M:%S")
-                    news_date = f"{dt.month}/{dt.day}"
-                except ValueError:
-                    news_date = "날짜 오류"
-            
-            results.append({
-                "topic": topic,
-                "title": title,
-                "link": link,
-                "press": press,
-                "date": news_date
-            })
+        items = fetch_rss_items([topic], start_date, end_date, count, relevance, store, rate_limiter)
+        return [to_news(topic, item, rate_limiter) for item in items]
     except Exception as e:
         print(f"오류: '{topic}' 뉴스 검색 중 오류 발생: {e}")
+        return []
 
-    return results
+def map_in_order(func, values, max_workers=MAX_WORKERS):
+    """values마다 func를 최대 max_workers개씩 동시에 실행하고, 결과를 values 순서대로 반환합니다."""
+    if max_workers <= 1 or len(values) <= 1:
+        return [func(value) for value in values]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(values))) as executor:
+        return list(executor.map(func, values))
 
-# -------------------- [HTML 생성 함수 (최종 수정)] --------------------
-def generate_table_html(news_list):
-    """뉴스 목록으로 제목을 포함한 HTML 테이블을 생성합니다."""
+def search_topics_batched(topics, count, start_date, end_date, batch_size=TOPICS_PER_QUERY, registry=None, relevance=None,
+                          store=None, rate_limiter=None, max_workers=MAX_WORKERS):
+    """
+    여러 키워드를 OR 검색어 하나로 묶어 RSS 요청 수를 줄입니다.
+    받은 기사는 제목과 요약에 포함된 키워드로 각 키워드에 배정하고,
+    기사가 count개보다 적은 키워드만 개별 검색으로 보충합니다.
+    registry가 주어지면 이미 등록된(다른 섹션·이전 호) 기사는 건너뜁니다.
+    relevance(RelevanceFilter)로 제외 키워드가 든 기사를 거릅니다. (주지 않으면 설정값으로 만듦)
+    store(SearchStore)가 주어지면 검색어마다 앞서 검색하지 않은 기간만 검색합니다.
+    구글 뉴스 요청(검색, 링크 풀기)은 rate_limiter(없으면 GOOGLE_NEWS_REQUESTS_PER_SECOND)로 속도를 제한합니다.
+    묶음 검색과 보충 검색은 각각 최대 max_workers개씩 동시에 보내고, 기사 배정과 등록은 키워드 순서대로 하므로
+    결과는 순차 실행과 같습니다. 결과는 topics 순서대로 반환합니다.
+    """
+    if relevance is None:
+        relevance = build_relevance_filter()
+    if rate_limiter is None:
+        rate_limiter = TokenBucket(GOOGLE_NEWS_REQUESTS_PER_SECOND)
+    news_by_topic = {topic: [] for topic in topics}
+    used_links = set()
+
+    def is_new(news):
+        if canonicalize_url(news["link"]) in used_links:
+            return False
+        return registry is None or registry.claim(news["link"], news["title"])
+
+    def fetch_batch(batch):
+        print(f"-> {batch} 관련 뉴스를 한 번에 검색합니다... ({start_date}~{end_date})")
+        try:
+            return fetch_rss_items(batch, start_date, end_date, None, relevance, store, rate_limiter)
+        except Exception as e:
+            print(f"오류: {batch} 뉴스 검색 중 오류 발생: {e}")
+            return []
+
+    batches = [topics[start:start + batch_size] for start in range(0, len(topics), batch_size)]
+    batches = [batch for batch in batches if len(batch) > 1]
+    for batch, items in zip(batches, map_in_order(fetch_batch, batches, max_workers)):
+        for item in items:
+            for topic in batch:
+                if len(news_by_topic[topic]) < count and mentions_topic(topic, item["match_text"]):
+                    news = to_news(topic, item, rate_limiter)
+                    if is_new(news):
+                        news_by_topic[topic].append(news)
+                        used_links.add(canonicalize_url(news["link"]))
+                    break
+
+    # 묶음 검색으로 기사가 부족한 키워드만 개별 검색
+    short_topics = [topic for topic in topics if len(news_by_topic[topic]) < count]
+    search = lambda topic: search_google_news_rss(topic, count * 2, start_date, end_date, relevance, store, rate_limiter)
+    for topic, found in zip(short_topics, map_in_order(search, short_topics, max_workers)):
+        for news in found:
+            if len(news_by_topic[topic]) >= count:
+                break
+            if is_new(news):
+                news_by_topic[topic].append(news)
+                used_links.add(canonicalize_url(news["link"]))
 
-    # ✨ 수정됨: 제목과 전체 틀을 포함하는 외부 테이블 구조 추가
-    # --- HTML 헤더 부분 ---
-    html_content = """
+    all_news = []
+    for topic in topics:
+        all_news.extend(news_by_topic[topic])
+    return all_news
+
+# -------------------- [HTML 생성 함수 (최종 수정)] --------------------
+# 행 템플릿은 모듈을 읽을 때 한 번만 컴파일하고, 행마다 값만 이스케이프해서 끼워 넣음
+TABLE_HTML_HEADER = """
 <table width="800" border="0" cellpadding="0" cellspacing="0" align="center">
     <tbody>
         <tr>
@@ -102,72 +274,112 @@ def generate_table_html(news_list):
             <td valign="top">
                 <table border="0" cellpadding="0" cellspacing="0" width="100%" style="border-bottom:1px solid #e2e2e2">
 """
-
-    # --- HTML 본문 (뉴스 목록) 부분 ---
-    for news in news_list:
-        html_content += f"""
+NEWS_ROW = html_render.Template("""
 <tr>
     <td width="100" style="background-color: #f9f7ff;text-align: center;font-size:13px;color:#305eb3;font-weight:700;border-top:1px solid #e2e2e2; padding: 10px 0;">
-        {news['topic']}
+        {topic}
     </td>
     <td style="padding:10px;border-top:1px solid #e2e2e2">
-        <a href="{news['link']}" target="_blank" style="text-decoration: none;color:#222;font-size:13px;">{news['title']}</a>
+        <a href="{link}" target="_blank" style="text-decoration: none;color:#222;font-size:13px;">{title}</a>
     </td>
     <td width="100" style="background-color: #edfff5;text-align: center;font-size:13px;color:#222;border-top:1px solid #e2e2e2">
-        {news['press']}
+        {press}
     </td>
     <td width="60" style="background-color: #f5f5f5;color:#222222;text-align: center;font-size:13px;border-top:1px solid #e2e2e2">
-        {news['date']}
+        {date}
     </td>
 </tr>
-"""
-
-    # ✨ 수정됨: 외부 테이블 구조를 닫는 태그 추가
-    # --- HTML 푸터 부분 ---
-    html_content += """
+""")
+TABLE_HTML_FOOTER = """
                 </table>
             </td>
         </tr>
     </tbody>
 </table>
 """
-    
-    return html_content
 
-    # --- HTML 테이블 종료 ---
-    html_content += "</table>"
-    
-    return html_content
+def iter_table_html(news_list):
+    """제목 행, 뉴스 행들, 닫는 태그를 조각 단위로 차례로 만들어 냅니다."""
+    yield TABLE_HTML_HEADER
+    yield from NEWS_ROW.render_rows(news_list)
+    yield TABLE_HTML_FOOTER
+
+def generate_table_html(news_list, out=None):
+    """
+    뉴스 목록으로 제목을 포함한 HTML 테이블을 생성합니다.
+    out(파일 핸들)이 주어지면 바로 써 내려가고 None을 반환합니다.
+    """
+    return html_render.render_document(iter_table_html(news_list), out)
 
 # -------------------- [메인 실행 부분] --------------------
-def main():
-    """스크립트의 메인 실행 함수"""
-    today = datetime.date.today()
-    default_start = (today - datetime.timedelta(days=7)).strftime("%Y-%m-%d")
-    default_end = today.strftime("%Y-%m-%d")
-    
-    start_date = get_date_input("시작 날짜를 입력하세요", default_start)
-    end_date = get_date_input("종료 날짜를 입력하세요", default_end)
-    print("-" * 20)
+def collect_keyword_news(start_date, end_date, topics=None, count=ARTICLES_PER_TOPIC, exclude_keywords=None,
+                         batch_size=TOPICS_PER_QUERY, issue=None, include_keywords=None, registry=None,
+                         max_workers=MAX_WORKERS):
+    """
+    기간 안의 키워드별 기사를 검색해 뉴스 목록을 반환합니다. 기사 등록부의 호 번호는 종료 날짜 기준입니다.
+    검색은 최대 max_workers개씩 동시에 보냅니다.
+    registry를 주면 새로 열지 않고 그 등록부에 등록합니다. (다른 섹션과 함께 실행할 때)
+    끝나면 제외/포함 키워드별 집계를 출력합니다.
+    """
+    if registry is None and USE_ARTICLE_REGISTRY:
+        registry = ArticleRegistry("keyword_news", issue or issue_for(end_date))
+    store = SearchStore() if USE_SEARCH_STORE else None
+    relevance = build_relevance_filter(exclude_keywords, include_keywords)
+    try:
+        return search_topics_batched(topics or TOPICS, count, start_date, end_date, batch_size=batch_size,
+                                     registry=registry, relevance=relevance, store=store, max_workers=max_workers)
+    finally:
+        relevance.report()
+        if registry is not None:
+            registry.close()
+        if store is not None:
+            store.report()
+            store.close()
 
-    all_news = []
-    for topic in TOPICS:
-        news = search_google_news_rss(topic, ARTICLES_PER_TOPIC, start_date, end_date)
-        all_news.extend(news)
-    
-    # 최종 HTML 생성 (✨수정됨)
-    final_html_content = generate_table_html(all_news)
+def parse_args(argv=None):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="키워드로 구글 뉴스를 검색해 산업 동향 HTML 표를 만듭니다.")
+    cli.add_common_arguments(parser, os.path.join(script_dir, OUTPUT_HTML_FILENAME), ARTICLES_PER_TOPIC)
+    parser.add_argument("--topics", nargs="+", default=None, help="검색할 키워드 (기본: 스크립트 설정값)")
+    parser.add_argument("--batch-size", type=int, default=TOPICS_PER_QUERY,
+                        help=f"한 번의 검색에 OR로 묶을 키워드 수 (기본: {TOPICS_PER_QUERY})")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help=f"동시에 보낼 검색 수 (기본: {MAX_WORKERS})")
+    return parser, parser.parse_args(argv)
 
-    # 파일로 저장
+def run_job(job):
+    """작업 하나(기간, 키워드, 출력 경로 등)를 실행합니다. 성공하면 True."""
+    all_news = collect_keyword_news(
+        job.start, job.end, topics=job.topics, count=job.count, exclude_keywords=job.exclude,
+        batch_size=job.batch_size, issue=getattr(job, "issue", None), include_keywords=job.include,
+        max_workers=job.workers,
+    )
+    
+    # 최종 HTML 생성 후 파일로 저장
     try:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        output_path = os.path.join(script_dir, OUTPUT_HTML_FILENAME)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(final_html_content)
-        print(f"\n🎉 성공! '{output_path}' 파일이 생성되었습니다.")
+        os.makedirs(os.path.dirname(job.output) or ".", exist_ok=True)
+        with open(job.output, "w", encoding="utf-8") as f:
+            generate_table_html(all_news, out=f)
+        print(f"\n🎉 성공! '{job.output}' 파일이 생성되었습니다.")
+        return True
     except IOError as e:
         print(f"\n❌ 오류: HTML 파일을 저장할 수 없습니다. {e}")
+        return False
+
+def main(argv=None):
+    """
+    스크립트의 메인 실행 함수
+    명령줄 옵션으로 실행하며(--help 참고), --manifest로 여러 작업을 한 프로세스에서 차례로 실행합니다.
+    (연결 세션과 응답 캐시를 작업 사이에 그대로 재사용)
+    """
+    parser, args = parse_args(argv)
+    if args.interactive:
+        args.start = get_date_input("시작 날짜를 입력하세요", args.start)
+        args.end = get_date_input("종료 날짜를 입력하세요", args.end)
+        print("-" * 20)
+
+    results = [run_job(job) for job in cli.iter_jobs(parser, args)]
+    return 0 if all(results) else 1
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,147 @@
+import os
+import re
+import json
+import hashlib
+
+import openpyxl
+
+from common.relevance import AhoCorasick
+
+# -------------------- [설정값] --------------------
+ROSTER_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "member_roster.json")
+CATEGORY_COLUMN = 1  # B열: 구분 (회장사, 정회원사 등)
+NAME_COLUMN = 2  # C열: 회원사명
+ALIAS_COLUMN = 3  # D열(선택): 영문명·별칭, 쉼표로 구분
+HEADER_NAME = "회원사명"
+ALIAS_SEPARATOR_PATTERN = re.compile(r'[,;/]')
+# 법인 형태 표기: (주), ㈜, 주식회사, (유), 유한회사, (사)/(재), Co., Ltd., Inc., Corp. 등
+LEGAL_SUFFIX_PATTERN = re.compile(
+    r'\(\s*[주유사재]\s*\)|[㈜㈲]|주식회사|유한회사|사단법인|재단법인'
+    r'|\b(?:co\.?\s*,?\s*ltd|corporation|corp|inc|ltd|llc|plc|gmbh)\b\.?',
+    re.IGNORECASE,
+)
+
+def strip_legal_suffix(name):
+    """회사명에서 법인 형태 표기를 지우고 공백·구두점을 정리합니다. 예: '(주)LG전자' → 'LG전자', 'Samsung Electronics Co., Ltd.' → 'Samsung Electronics'"""
+    name = LEGAL_SUFFIX_PATTERN.sub(" ", name)
+    return re.sub(r'\s+', ' ', name).strip(" ,.")
+
+def alias_key(text):
+    """별칭 비교용 키: 소문자로 바꾸고 공백을 모두 지움 ('LG 전자'와 'LG전자'를 같게 봄)"""
+    return re.sub(r'\s+', '', text).lower()
+
+def search_aliases(name, extra_aliases=()):
+    """회사명과 영문명·별칭에서 법인 표기를 지운 검색용 별칭 목록을 반환합니다. (첫 번째가 대표 이름)"""
+    aliases = []
+    seen = set()
+    for alias in [name, *extra_aliases]:
+        alias = strip_legal_suffix(str(alias))
+        key = alias_key(alias)
+        if key and key not in seen:
+            seen.add(key)
+            aliases.append(alias)
+    return aliases
+
+class MemberRoster:
+    """
+    회원사 목록 엑셀을 읽기 전용(스트리밍) 모드로 읽고, 파싱 결과를 파일 수정 시각·해시 기준으로 캐시합니다.
+
+    - names: 엑셀 행 순서의 회원사명
+    - aliases: {회원사명: 검색용 별칭 목록} (법인 표기 제거, D열 영문명·별칭 포함)
+    - alias_index: {별칭 키: (회원사명, ...)} (별칭 → 회원사, 같은 별칭을 쓰는 회원사가 여럿일 수 있음)
+    - companies_in(text): 색인의 모든 별칭을 한 번에 찾는 자동자로 text가 언급하는 회원사를 찾음
+    """
+    def __init__(self, members):
+        self.members = members
+        self.names = [member["name"] for member in members]
+        self.aliases = {member["name"]: member["aliases"] for member in members}
+        index = {}
+        for member in members:
+            for alias in member["aliases"]:
+                companies = index.setdefault(alias_key(alias), [])
+                if member["name"] not in companies:
+                    companies.append(member["name"])
+        self.alias_index = {key: tuple(companies) for key, companies in index.items()}
+        self.alias_keys = list(self.alias_index)
+        self.matcher = AhoCorasick(self.alias_keys)
+
+    @classmethod
+    def from_names(cls, names):
+        """엑셀 없이 회원사명 목록으로 만듭니다. (--companies로 일부만 검색할 때)"""
+        return cls([{"name": name, "category": "", "aliases": search_aliases(name)} for name in names])
+
+    @classmethod
+    def load(cls, path, cache_path=ROSTER_CACHE_PATH):
+        """
+        캐시에 기록된 수정 시각·크기가 같으면 파일을 열지 않고 캐시를 쓰고,
+        다르면 내용 해시를 비교해 실제로 바뀐 경우에만 엑셀을 다시 읽습니다.
+        """
+        stat = os.stat(path)
+        cache = cls._read_cache(cache_path)
+        source = os.path.abspath(path)
+        if cache and cache["source"] == source and cache["mtime"] == stat.st_mtime and cache["size"] == stat.st_size:
+            return cls(cache["members"])
+
+        with open(path, "rb") as file:
+            digest = hashlib.sha256(file.read()).hexdigest()
+        if cache and cache["source"] == source and cache["sha256"] == digest:
+            members = cache["members"]
+        else:
+            members = read_members(path)
+        cls._write_cache(cache_path, {
+            "source": source, "mtime": stat.st_mtime, "size": stat.st_size, "sha256": digest, "members": members,
+        })
+        return cls(members)
+
+    @staticmethod
+    def _read_cache(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_cache(cache_path, cache):
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = cache_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(cache, file, ensure_ascii=False)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️ 회원사 목록 캐시를 저장하지 못했습니다: {e}")
+
+    def aliases_for(self, company_name):
+        """회원사의 검색용 별칭 목록 (목록에 없는 이름이면 그 이름에서 만든 별칭)"""
+        return self.aliases.get(company_name) or search_aliases(company_name)
+
+    def companies_in(self, text):
+        """text(기사 제목 등)에 별칭이 들어 있는 회원사명 집합 (공백·대소문자 무시)"""
+        companies = set()
+        for index in self.matcher.find(alias_key(text)):
+            companies.update(self.alias_index[self.alias_keys[index]])
+        return companies
+
+def read_members(path):
+    """엑셀에서 구분(B열)과 회원사명(C열)이 모두 있는 행을 읽습니다. (읽기 전용 모드, 값만)"""
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        members = []
+        for row in workbook.active.iter_rows(min_row=2, max_col=ALIAS_COLUMN + 1, values_only=True):
+            if len(row) <= NAME_COLUMN or not row[NAME_COLUMN] or not row[CATEGORY_COLUMN]:
+                continue
+            name = str(row[NAME_COLUMN]).strip()
+            if name == HEADER_NAME:
+                continue
+            extra = row[ALIAS_COLUMN] if len(row) > ALIAS_COLUMN and row[ALIAS_COLUMN] else ""
+            # 'Co., Ltd.'의 쉼표로 나뉘지 않도록 법인 표기를 먼저 지우고 별칭을 나눔
+            extra = LEGAL_SUFFIX_PATTERN.sub(" ", str(extra))
+            members.append({
+                "name": name,
+                "category": str(row[CATEGORY_COLUMN]).strip(),
+                "aliases": search_aliases(name, ALIAS_SEPARATOR_PATTERN.split(extra)),
+            })
+        return members
+    finally:
+        workbook.close()
@@ -1,16 +1,38 @@
+import argparse
 import os
+import sys
 import requests
-from bs4 import BeautifulSoup
-import openpyxl
-from datetime import datetime, timedelta
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher # ✨ 추가됨: 유사도 측정을 위한 라이브러리
 
+# 공통 모듈(common) 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import cli
+from common import dates
+from common import http_client
+from common import html_render
+from common.article_registry import ArticleRegistry, issue_for
+from common.near_dup import NearDuplicateIndex
+from common.rate_limit import TokenBucket
+from common.relevance import RelevanceFilter
+from common.rss import iter_rss_items, plain_text
+from common.search_store import SearchStore
+from common.url_utils import canonicalize_url, resolve_article_url
+from member_roster import MemberRoster
+
 # -------------------- [설정값] --------------------
 
 MEMBER_XLSX_FILENAME = "memberlist.xlsx"
 MAX_NEWS_PER_COMPANY = 5
+# 제목·요약에 들어 있으면 제외할 키워드 (검색어에 붙이지 않고 받은 기사를 로컬에서 거름, common/relevance.py)
 STOCK_KEYWORDS_TO_EXCLUDE = ["주가", "증시", "코스피", "코스닥", "목표주가", "투자의견", "매수", "매도", "상한가", "하한가", "특징주", "증권"]
+KEYWORDS_TO_INCLUDE = []  # 비어 있지 않으면 이 중 하나 이상이 들어 있는 기사만 사용
 OUTPUT_HTML_FILENAME = "member_news.html"
+MAX_WORKERS = 8  # 동시에 검색할 최대 회원사 수 (1이면 순차 실행)
+GOOGLE_NEWS_REQUESTS_PER_SECOND = 2.0  # 구글 뉴스 RSS 전체 초당 요청 수 상한
+USE_ARTICLE_REGISTRY = True  # 다른 섹션·이전 호에 실린 기사 제외 (common/article_registry.py)
+USE_SEARCH_STORE = True  # 앞선 실행에서 검색한 기간은 다시 검색하지 않고 저장된 기사 사용 (common/search_store.py)
 
 # -------------------- [✨ 새로운 제목 유사도 비교 함수] --------------------
 def is_similar_by_words(title1, title2, threshold=0.5):
@@ -42,14 +64,15 @@ def get_date_input(prompt, default_date):
             print("❌ 날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 다시 입력해주세요.")
 
 # -------------------- [1단계: 엑셀에서 회원사 이름 읽기] --------------------
-def get_member_names(filename):
-    """지정된 엑셀 파일의 C열에서 회원사 목록을 읽어옵니다."""
+def load_member_roster(filename):
+    """
+    회원사 목록 엑셀을 읽기 전용 모드로 읽습니다. (파일이 바뀌지 않았으면 .cache의 파싱 결과 사용)
+    실패하면 None.
+    """
     try:
-        workbook = openpyxl.load_workbook(filename)
-        sheet = workbook.active
-        names = [row[2].value for row in sheet.iter_rows(min_row=2) if row[2].value and row[1].value]
-        print(f"✅ 엑셀 파일에서 총 {len(names)}개의 회원사를 찾았습니다.")
-        return names
+        roster = MemberRoster.load(filename)
+        print(f"✅ 엑셀 파일에서 총 {len(roster.names)}개의 회원사를 찾았습니다.")
+        return roster
     except FileNotFoundError:
         print(f"❌ 오류: '{filename}'을 찾을 수 없습니다. 파이썬 파일과 같은 폴더에 있는지 확인하세요.")
         return None
@@ -57,63 +80,121 @@ def get_member_names(filename):
         print(f"❌ 엑셀 파일 처리 중 오류 발생: {e}")
         return None
 
+def get_member_names(filename):
+    """지정된 엑셀 파일의 C열에서 회원사 목록을 읽어옵니다."""
+    roster = load_member_roster(filename)
+    return roster.names if roster is not None else None
+
 # -------------------- [2단계: 회사 이름으로 구글 뉴스 검색 (✨수정됨)] --------------------
-def search_google_news(company_name, count, start_date, end_date):
-    """뉴스 검색 후, 핵심 단어 기반으로 중복을 제거하고 최신순으로 정렬합니다."""
-    print(f"-> '{company_name}' 관련 뉴스를 검색합니다... ({start_date}~{end_date})")
-    
-    exclude_query = " ".join([f'-"{keyword}"' for keyword in STOCK_KEYWORDS_TO_EXCLUDE])
-    search_query = f'"{company_name}" {exclude_query} after:{start_date} before:{end_date}'
+def build_company_query(aliases):
+    """별칭이 하나면 "이름", 여러 개면 ("이름" OR "English Name") 형태의 검색어를 만듭니다."""
+    if len(aliases) == 1:
+        return f'"{aliases[0]}"'
+    return "(" + " OR ".join(f'"{alias}"' for alias in aliases) + ")"
+
+def build_relevance_filter(exclude_keywords=None, include_keywords=None):
+    """회원사 섹션의 제외/포함 키워드 필터를 만듭니다. (주지 않으면 설정값 사용)"""
+    return RelevanceFilter(
+        "member_search",
+        STOCK_KEYWORDS_TO_EXCLUDE if exclude_keywords is None else exclude_keywords,
+        KEYWORDS_TO_INCLUDE if include_keywords is None else include_keywords,
+    )
+
+def fetch_company_items(company_query, start_date, end_date, rate_limiter=None):
+    """회원사 검색어로 구글 뉴스 RSS를 요청해 RSS 항목 이터레이터를 반환합니다."""
+    # 제외 키워드는 검색어에 넣지 않으므로 검색 주소가 짧고, 제외 키워드를 바꿔도 응답 캐시를 그대로 씀
+    search_query = f'{company_query} after:{start_date} before:{end_date}'
     encoded_query = requests.utils.quote(search_query)
     url = f"https://news.google.com/rss/search?q={encoded_query}&hl=ko&gl=KR&ceid=KR:ko"
+    response = http_client.get(url, rate_limiter=rate_limiter)
+    response.raise_for_status()
+    # 응답 바이트를 조금씩 파싱하며 항목을 하나씩 받음 (후보를 다 모으면 나머지는 파싱하지 않음)
+    return iter_rss_items(response.content)
+
+def search_google_news(company_name, count, start_date, end_date, rate_limiter=None, registry=None, relevance=None, roster=None,
+                       store=None):
+    """
+    뉴스 검색 후, 핵심 단어 기반으로 중복을 제거하고 최신순으로 정렬합니다.
+    registry가 주어지면 이미 등록된(다른 회원사·섹션·이전 호) 기사는 후보에서 제외하고, 고른 기사는 바로 등록하며
+    등록하지 못한 기사 자리는 다음 후보로 채웁니다.
+    relevance(RelevanceFilter)로 제외 키워드가 든 기사를 로컬에서 거릅니다. (주지 않으면 설정값으로 만듦)
+    roster(MemberRoster)의 별칭(법인 표기를 뺀 이름, 영문명 등)을 OR로 묶어 검색하고,
+    별칭 색인으로 찾은 제목 속 회원사가 이 회원사인 기사를 먼저 고릅니다.
+    store(SearchStore)가 주어지면 앞서 검색한 기간은 저장된 기사를 쓰고 남은 기간만 검색합니다. (후보는 검색 결과 순서)
+    """
+    print(f"-> '{company_name}' 관련 뉴스를 검색합니다... ({start_date}~{end_date})")
+    
+    if relevance is None:
+        relevance = build_relevance_filter()
+    if roster is None:
+        roster = MemberRoster.from_names([company_name])
+    company_query = build_company_query(roster.aliases_for(company_name))
     
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "xml")
-        items = soup.find_all("item", limit=count * 3) # 중복 제거를 위해 3배수 검색
+        if store is None:
+            items = fetch_company_items(company_query, start_date, end_date, rate_limiter)
+        else:
+            def fetch_range(after, before):
+                return fetch_company_items(company_query, after, before, rate_limiter)
+            items = store.fetch(company_query, start_date, end_date, fetch_range)
         
         candidate_news = []
         for item in items:
-            raw_title = item.title.text if item.title else ""
+            if len(candidate_news) >= count * 3: # 중복 제거를 위해 3배수까지 후보 수집
+                break
+            raw_title = item.title
             title = raw_title.rsplit(' - ', 1)[0].strip() if ' - ' in raw_title else raw_title
             if not title: continue
+            if not relevance.check(raw_title, plain_text(item.description)):
+                continue
 
-            link = item.link.text if item.link else "#"
-            press = item.source.text if item.source else "언론사 불명"
-            pub_date_str = item.pubDate.text if item.pubDate else ""
-            
-            dt_obj = None
-            if pub_date_str:
-                try:
-                    dt_obj = datetime.strptime(pub_date_str.replace(" GMT", ""), "%a, %d %b %Y %H:%M:%S")
-                    date_formatted = dt_obj.strftime("%m/%d")
-                except ValueError:
-                    date_formatted = "날짜 오류"
+            link = item.link or "#"
+            if registry is not None and registry.is_seen(link, title):
+                continue
+            press = item.source or "언론사 불명"
+
+            # 날짜는 한국 시간으로 바꿔 표시하고, 한국 시간으로 기간 밖이면 제외 (구글 뉴스 기간 검색은 UTC 기준)
+            dt_obj = dates.parse_pub_date(item.pub_date)
+            if not dates.in_date_range(dt_obj, start_date, end_date):
+                continue
+            if dt_obj is not None:
+                date_formatted = dates.month_day(dt_obj)
+            else:
+                date_formatted = "날짜 오류" if item.pub_date else ""
             
             candidate_news.append({
                 "title": title, "link": link, "press": press,
                 "date": date_formatted, "datetime_obj": dt_obj
             })
         
-        # ✨ 수정됨: 새로운 중복 제거 로직
+        # 제목에 이 회원사의 별칭이 들어간 기사를 먼저 (같은 조건끼리는 검색 결과 순서 유지)
+        candidate_news.sort(key=lambda news_item: company_name not in roster.companies_in(news_item["title"]))
+
+        # ✨ 수정됨: MinHash/LSH 색인으로 비슷한 제목 중복 제거 (자카드 유사도 0.5 기준)
+        # 남길 기사만 구글 뉴스 링크를 원문 링크로 바꾸고, 정규화한 원문 링크가 같은 기사도 중복으로 제거
+        # (정규화한 URL은 중복 확인에만 쓰고 링크는 원문 그대로 둠)
         unique_news = []
+        unique_links = set()
+        title_index = NearDuplicateIndex()
         for news_item in candidate_news:
-            is_duplicate = False
-            # 이미 추가된 уникальный 기사들과 제목 비교
-            for unique_item in unique_news:
-                if is_similar_by_words(news_item["title"], unique_item["title"]):
-                    is_duplicate = True
-                    break
-            if not is_duplicate:
-                unique_news.append(news_item)
+            if title_index.is_duplicate(news_item["title"]):
+                continue
+            news_item["link"] = resolve_article_url(news_item["link"], rate_limiter)
+            link_key = canonicalize_url(news_item["link"])
+            if link_key in unique_links:
+                continue
+            # 개수를 세기 전에 등록해, 다른 회원사·섹션이 먼저 실은 기사 자리는 다음 후보로 채움
+            if registry is not None and not registry.claim(news_item["link"], news_item["title"]):
+                continue
+            title_index.add(news_item["title"])
+            unique_links.add(link_key)
+            unique_news.append(news_item)
             
             if len(unique_news) >= count:
                 break
         
         # 날짜 최신순으로 최종 정렬
-        unique_news.sort(key=lambda x: x["datetime_obj"] or datetime.min, reverse=True)
+        unique_news.sort(key=lambda x: dates.sort_key(x["datetime_obj"]), reverse=True)
         return unique_news
         
     except requests.exceptions.RequestException as e:
@@ -123,10 +204,39 @@ def search_google_news(company_name, count, start_date, end_date):
         print(f"오류: '{company_name}' 뉴스 파싱 중 오류 발생: {e}")
         return []
 
+# -------------------- [2-1단계: 여러 회원사 병렬 검색] --------------------
+def search_all_companies(company_names, count, start_date, end_date, max_workers=MAX_WORKERS, registry=None,
+                         exclude_keywords=None, roster=None, include_keywords=None, store=None):
+    """
+    회원사 뉴스를 최대 max_workers개씩 동시에 검색합니다. roster(MemberRoster)는 별칭과 별칭 색인을 제공합니다.
+    구글 뉴스 RSS 요청은 전체 초당 요청 수 상한을 공유하며, 결과는 엑셀 행 순서대로 담깁니다.
+    registry가 주어지면 회원사마다 고른 기사를 검색하면서 바로 등록합니다. (먼저 등록한 회원사에 실림)
+    제외/포함 키워드 필터는 모든 회원사가 함께 쓰며, 끝나면 키워드별 집계를 출력합니다.
+    store(SearchStore)가 주어지면 회원사마다 앞서 검색하지 않은 기간만 검색합니다.
+    """
+    rate_limiter = TokenBucket(GOOGLE_NEWS_REQUESTS_PER_SECOND)
+    relevance = build_relevance_filter(exclude_keywords, include_keywords)
+    if roster is None:
+        roster = MemberRoster.from_names(company_names)
+
+    def search(name):
+        return search_google_news(name, count, start_date, end_date, rate_limiter, registry, relevance,
+                                  roster, store)
+
+    if max_workers <= 1:
+        results = [search(name) for name in company_names]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(search, company_names))
+    relevance.report()
+    if store is not None:
+        store.report()
+
+    return dict(zip(company_names, results))
+
 # -------------------- [3단계: HTML 테이블 생성] --------------------
-def generate_member_news_html(all_news_data):
-    """전체 뉴스 데이터를 받아 동적 rowspan을 적용한 HTML 테이블을 생성합니다."""
-    html_content = f"""
+# 행 템플릿은 모듈을 읽을 때 한 번만 컴파일하고, 행마다 값만 이스케이프해서 끼워 넣음
+MEMBER_HTML_HEADER = """
 <!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -145,42 +255,42 @@ def generate_member_news_html(all_news_data):
             <td colspan="4" valign="top">
                 <table border="0" cellpadding="0" cellspacing="0" width="100%" style="border-bottom:1px solid #e2e2e2">
     """
-
-    for company_name, articles in all_news_data.items():
-        if not articles:
-            articles = [{"title": "해당 기간에 관련 기사가 없습니다.", "link": "#", "press": "", "date": ""}]
-        
-        rowspan = len(articles)
-        
-        for i, article in enumerate(articles):
-            html_content += "<tr>\n"
-            if i == 0:
-                html_content += f'''
+COMPANY_CELL_HTML = '''
     <td rowspan="{rowspan}" style="background-color: #f9f7ff;text-align: center;font-size:13px;color:#305eb3;font-weight:700;border-top:1px solid #e2e2e2" width="120" valign="middle">
         {company_name}
     </td>
 '''
-            if "관련 기사가 없습니다" in article["title"]:
-                 html_content += f'''
+NO_ARTICLE_CELL_HTML = '''
     <td colspan="3" style="padding:10px;border-top:1px solid #e2e2e2;color:#777;font-size:13px;">
-        {article["title"]}
+        {title}
     </td>
 '''
-            else:
-                html_content += f'''
+ARTICLE_CELLS_HTML = '''
     <td style="padding:10px;border-top:1px solid #e2e2e2">
-        <a href="{article["link"]}" target="_blank" style="text-decoration: none;color:#222;font-size:13px;">{article["title"]}</a>
+        <a href="{link}" target="_blank" style="text-decoration: none;color:#222;font-size:13px;">{title}</a>
     </td>
     <td width="100" style="background-color: #f5f5f5;text-align: center;font-size:13px;color:#222;border-top:1px solid #e2e2e2">
-        {article["press"]}
+        {press}
     </td>
     <td width="60" style="background-color: #f5f5f5;color:#222222;text-align: center;font-size:13px;border-top:1px solid #e2e2e2">
-        {article["date"]}
+        {date}
     </td>
 '''
-            html_content += "</tr>\n"
-            
-    html_content += """
+ARTICLE_FIELDS = ('title', 'link', 'press', 'date')
+# (회사의 첫 행인지, 기사가 있는 행인지) → 한 행 전체 템플릿 (모두 같은 순서로 인자를 받음)
+ROW_TEMPLATES = {
+    (is_first, has_article): html_render.Template(
+        "<tr>\n"
+        + (COMPANY_CELL_HTML if is_first else "")
+        + (ARTICLE_CELLS_HTML if has_article else NO_ARTICLE_CELL_HTML)
+        + "</tr>\n",
+        raw=('rowspan',),
+        args=('rowspan', 'company_name') + ARTICLE_FIELDS,
+    )
+    for is_first in (True, False)
+    for has_article in (True, False)
+}
+MEMBER_HTML_FOOTER = """
                 </table>
             </td>
         </tr>
@@ -189,43 +299,111 @@ def generate_member_news_html(all_news_data):
 </body>
 </html>
     """
-    return html_content
+
+def iter_member_news_html(all_news_data):
+    """HTML 문서를 행 단위로 차례로 만들어 냅니다. (회사명과 기사 값은 미리 한 번에 이스케이프)"""
+    yield MEMBER_HTML_HEADER
+    companies = [
+        (company_name, articles or [{"title": "해당 기간에 관련 기사가 없습니다.", "link": "#", "press": "", "date": ""}])
+        for company_name, articles in all_news_data.items()
+    ]
+    safe_names = html_render.escape_column([company_name for company_name, _ in companies])
+    safe_articles = iter(html_render.escape_rows(
+        (article for _, articles in companies for article in articles), ARTICLE_FIELDS
+    ))
+
+    for safe_name, (company_name, articles) in zip(safe_names, companies):
+        rowspan = len(articles)
+        
+        for i, article in enumerate(articles):
+            template = ROW_TEMPLATES[i == 0, "관련 기사가 없습니다" not in article["title"]]
+            yield template.fill(rowspan, safe_name, *next(safe_articles))
+    yield MEMBER_HTML_FOOTER
+
+def generate_member_news_html(all_news_data, out=None):
+    """
+    전체 뉴스 데이터를 받아 동적 rowspan을 적용한 HTML 테이블을 생성합니다.
+    out(파일 핸들)이 주어지면 바로 써 내려가고 None을 반환합니다.
+    """
+    return html_render.render_document(iter_member_news_html(all_news_data), out)
 
 # -------------------- [메인 실행 부분] --------------------
-def main():
-    """스크립트의 메인 실행 함수"""
-    today = datetime.now().date()
-    default_start_date = (today - timedelta(days=7)).strftime("%Y-%m-%d")
-    default_end_date = today.strftime("%Y-%m-%d")
+def collect_member_news(start_date, end_date, count=MAX_NEWS_PER_COMPANY, exclude_keywords=None,
+                        member_xlsx_path=None, company_names=None, max_workers=MAX_WORKERS, issue=None,
+                        include_keywords=None, registry=None):
+    """
+    기간 안의 회원사 기사를 검색해 {회사명: 기사 목록}을 반환합니다. 회원사 목록을 읽지 못하면 None.
+    company_names를 주면 엑셀 대신 그 목록을 검색합니다. 기사 등록부의 호 번호는 종료 날짜 기준입니다.
+    registry를 주면 새로 열지 않고 그 등록부에 등록합니다. (다른 섹션과 함께 실행할 때)
+    """
+    if company_names is None:
+        if member_xlsx_path is None:
+            member_xlsx_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), MEMBER_XLSX_FILENAME)
+        roster = load_member_roster(member_xlsx_path)
+        if roster is None:
+            return None
+        company_names = roster.names
+    else:
+        roster = MemberRoster.from_names(company_names)
 
-    print("--- 뉴스 검색 기간 설정 ---")
-    start_date = get_date_input("시작 날짜를 입력하세요", default_start_date)
-    end_date = get_date_input("종료 날짜를 입력하세요", default_end_date)
-    print("--------------------------\n")
+    if registry is None and USE_ARTICLE_REGISTRY:
+        registry = ArticleRegistry("member_search", issue or issue_for(end_date))
+    store = SearchStore() if USE_SEARCH_STORE else None
+    try:
+        return search_all_companies(company_names, count, start_date, end_date, max_workers=max_workers,
+                                    registry=registry, exclude_keywords=exclude_keywords, roster=roster,
+                                    include_keywords=include_keywords, store=store)
+    finally:
+        if registry is not None:
+            registry.close()
+        if store is not None:
+            store.close()
 
+def parse_args(argv=None):
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    member_xlsx_path = os.path.join(script_dir, MEMBER_XLSX_FILENAME)
-    
-    company_names = get_member_names(member_xlsx_path)
-    
-    if company_names is None:
+    parser = argparse.ArgumentParser(description="회원사 이름으로 구글 뉴스를 검색해 회원사 이슈 HTML을 만듭니다.")
+    cli.add_common_arguments(parser, os.path.join(script_dir, OUTPUT_HTML_FILENAME), MAX_NEWS_PER_COMPANY)
+    parser.add_argument("--members", default=os.path.join(script_dir, MEMBER_XLSX_FILENAME), help="회원사 목록 엑셀 파일")
+    parser.add_argument("--companies", nargs="+", default=None, help="엑셀 대신 검색할 회원사 이름")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help=f"동시에 검색할 회원사 수 (기본: {MAX_WORKERS})")
+    return parser, parser.parse_args(argv)
+
+def run_job(job):
+    """작업 하나(기간, 제외 키워드, 출력 경로 등)를 실행합니다. 성공하면 True."""
+    all_news_data = collect_member_news(
+        job.start, job.end, count=job.count, exclude_keywords=job.exclude, member_xlsx_path=job.members,
+        company_names=job.companies, max_workers=job.workers, issue=getattr(job, "issue", None),
+        include_keywords=job.include,
+    )
+    if all_news_data is None:
         print("프로세스를 종료합니다.")
-        return
+        return False
 
-    all_news_data = {}
-    for name in company_names:
-        news = search_google_news(name, MAX_NEWS_PER_COMPANY, start_date, end_date)
-        all_news_data[name] = news
-        
-    final_html = generate_member_news_html(all_news_data)
-    
     try:
-        output_path = os.path.join(script_dir, OUTPUT_HTML_FILENAME)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(final_html)
-        print(f"\n🎉 성공! '{output_path}' 파일이 생성되었습니다.")
+        os.makedirs(os.path.dirname(job.output) or ".", exist_ok=True)
+        with open(job.output, "w", encoding="utf-8") as f:
+            generate_member_news_html(all_news_data, out=f)
+        print(f"\n🎉 성공! '{job.output}' 파일이 생성되었습니다.")
+        return True
     except IOError as e:
         print(f"\n❌ 오류: HTML 파일을 저장할 수 없습니다. {e}")
+        return False
+
+def main(argv=None):
+    """
+    스크립트의 메인 실행 함수
+    명령줄 옵션으로 실행하며(--help 참고), --manifest로 여러 작업을 한 프로세스에서 차례로 실행합니다.
+    (연결 세션과 응답 캐시를 작업 사이에 그대로 재사용)
+    """
+    parser, args = parse_args(argv)
+    if args.interactive:
+        print("--- 뉴스 검색 기간 설정 ---")
+        args.start = get_date_input("시작 날짜를 입력하세요", args.start)
+        args.end = get_date_input("종료 날짜를 입력하세요", args.end)
+        print("--------------------------\n")
+
+    results = [run_job(job) for job in cli.iter_jobs(parser, args)]
+    return 0 if all(results) else 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
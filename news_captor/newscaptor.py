@@ -1,133 +1,611 @@
-import requests
 from bs4 import BeautifulSoup
-import pandas as pd
+import openpyxl
 from urllib.parse import urlparse
 import re
-from datetime import datetime
-import time
+import json
+import hashlib
+import sqlite3
+import tempfile
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import os
+import sys
+import codecs
+from html.parser import HTMLParser
 
-def extract_news_info(url):
+# 공통 모듈(common) 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import dates
+from common import http_client
+from common.article_registry import ArticleRegistry
+from common.http_cache import build_response
+from common.rate_limit import DomainRateLimiter, get_domain_key
+from common.url_utils import url_key
+
+# -------------------- [설정값] --------------------
+MAX_WORKERS = 16  # 동시에 처리할 최대 요청 수
+DOMAIN_REQUESTS_PER_SECOND = 1.0  # 도메인(언론사)별 초당 요청 수
+DOMAIN_BURST = 2  # 도메인별로 연달아 보낼 수 있는 최대 요청 수
+USE_ARTICLE_REGISTRY = True  # 다른 섹션·이전 호에 실린 기사는 가져오지 않음 (common/article_registry.py)
+HEAD_ONLY_FETCH = True  # 제목·언론사·날짜를 찾으면 기사 본문을 끝까지 받지 않음
+HEAD_FETCH_BYTE_BUDGET = 64 * 1024  # 앞부분만 받을 때 최대 바이트 수, 넘으면 전체 페이지를 받음
+HEAD_FETCH_CHUNK_SIZE = 8 * 1024
+OUTPUT_COLUMNS = ['링크', '기사제목', '기사날짜', '언론사명']
+CHECKPOINT_SUFFIX = ".checkpoint.jsonl"  # 처리 중간 결과를 한 줄씩 기록하는 파일 (출력 파일 이름 + 접미사)
+LINK_READ_CHUNK_SIZE = 64 * 1024  # 링크 파일을 한 번에 읽는 크기
+LINK_SEPARATOR_PATTERN = re.compile(r'[,\r\n]+')  # 링크 구분자 (쉼표, 줄바꿈)
+DEDUP_MEMORY_LIMIT = 200000  # 중복 확인용 키를 메모리에 두는 최대 개수, 넘으면 임시 파일로 옮김
+INTERLEAVE_WINDOW = 256  # 읽어 들인 링크를 이 개수만큼 모아 도메인별로 섞어서 처리
+
+# -------------------- [링크 파일 읽기] --------------------
+def iter_links(txt_file_path, chunk_size=LINK_READ_CHUNK_SIZE):
+    """링크 파일을 chunk_size씩 읽으며 쉼표·줄바꿈으로 구분된 링크를 하나씩 내보냅니다."""
+    with open(txt_file_path, 'r', encoding='utf-8') as file:
+        rest = ''
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            parts = LINK_SEPARATOR_PATTERN.split(rest + chunk)
+            rest = parts.pop()
+            for part in parts:
+                link = part.strip()
+                if link:
+                    yield link
+        link = rest.strip()
+        if link:
+            yield link
+
+class SpillableSet:
+    """
+    중복 확인용 집합. 키는 16바이트 해시로 저장하며, 메모리에 memory_limit개가 넘으면
+    임시 SQLite 파일로 옮겨 메모리 사용량을 일정하게 유지합니다.
+    """
+    def __init__(self, memory_limit=DEDUP_MEMORY_LIMIT):
+        self.memory_limit = memory_limit
+        self.memory = set()
+        self.conn = None
+        self.spill_path = None
+
+    def _spill(self):
+        if self.conn is None:
+            handle, self.spill_path = tempfile.mkstemp(suffix='.sqlite3')
+            os.close(handle)
+            self.conn = sqlite3.connect(self.spill_path)
+            self.conn.execute("CREATE TABLE keys (key BLOB PRIMARY KEY)")
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO keys VALUES (?)", ((key,) for key in self.memory))
+        self.memory.clear()
+
+    def add(self, value):
+        """처음 보는 값이면 추가하고 True, 이미 있으면 False를 반환합니다."""
+        key = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        if key in self.memory:
+            return False
+        if self.conn is not None and self.conn.execute("SELECT 1 FROM keys WHERE key = ?", (key,)).fetchone():
+            return False
+        self.memory.add(key)
+        if len(self.memory) >= self.memory_limit:
+            self._spill()
+        return True
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            os.remove(self.spill_path)
+            self.conn = None
+
+def iter_unique_links(txt_file_path):
+    """링크 파일에서 (입력 순번, URL)을 읽어 오며, 정규화한 URL이 같은 링크는 한 번만 내보냅니다."""
+    seen = SpillableSet()
+    try:
+        for position, url in enumerate(iter_links(txt_file_path)):
+            if seen.add(url_key(url)):
+                yield position, url
+    finally:
+        seen.close()
+
+# -------------------- [동시 처리] --------------------
+def interleave_by_domain(urls):
+    """한 도메인의 링크가 작업자를 독점하지 않도록 도메인별로 번갈아 가며 순서를 정합니다."""
+    groups = {}
+    for index, url in enumerate(urls):
+        groups.setdefault(get_domain_key(url), []).append(index)
+    order = []
+    queues = list(groups.values())
+    position = 0
+    while queues:
+        queues = [q for q in queues if len(q) > position]
+        order.extend(q[position] for q in queues)
+        position += 1
+    return order
+
+def iter_news_info(links, max_workers=MAX_WORKERS, rate_limiter=None, window=INTERLEAVE_WINDOW):
+    """
+    (순번, URL)을 읽어 오는 대로 기사 정보를 동시에 추출하며, 끝나는 순서대로 (순번, 정보)를 내보냅니다.
+    링크는 window개씩 모아 도메인별로 섞어서 제출하고, 처리 중인 작업이 window개를 넘으면
+    링크를 더 읽지 않고 기다립니다.
+    """
+    rate_limiter = rate_limiter or DomainRateLimiter(DOMAIN_REQUESTS_PER_SECOND, DOMAIN_BURST)
+
+    def worker(position, url):
+        return position, url, extract_news_info(url, rate_limiter)
+
+    done_count = 0
+    in_flight = set()
+    batch = []
+
+    def submit_batch():
+        for index in interleave_by_domain([url for _, url in batch]):
+            in_flight.add(executor.submit(worker, *batch[index]))
+        batch.clear()
+
+    def collect(futures):
+        nonlocal done_count
+        for future in futures:
+            position, url, info = future.result()
+            done_count += 1
+            print(f"처리 완료... ({done_count}) {url[:50]}...")
+            yield position, info
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for link in links:
+            batch.append(link)
+            if len(batch) >= window or (not in_flight and len(batch) >= max_workers):
+                submit_batch()
+            while len(in_flight) >= window:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                yield from collect(finished)
+        submit_batch()
+        while in_flight:
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            yield from collect(finished)
+
+# -------------------- [중간 저장 및 엑셀 출력] --------------------
+def is_error_row(info):
+    """기사 정보를 가져오지 못해 제목 자리에 오류를 적은 행이면 True"""
+    return (info.get('title') or '').startswith("오류:")
+
+def load_checkpoint(checkpoint_path):
+    """
+    이전 실행에서 처리를 마친 기사들을 {URL: 행}으로 읽습니다.
+    마지막 줄이 끊겨 있으면 잘라내고, 오류 행은 다시 처리하도록 파일에서 지웁니다.
+    """
+    done_rows = {}
+    if not os.path.exists(checkpoint_path):
+        return done_rows
+    kept_lines = []
+    dropped = False
+    with open(checkpoint_path, 'rb') as file:
+        for line in file:
+            if not line.endswith(b'\n'):
+                dropped = True
+                break
+            try:
+                row = json.loads(line)
+                url = row['url']
+            except (ValueError, KeyError):
+                dropped = True
+                break
+            if is_error_row(row):
+                dropped = True
+                continue
+            done_rows[url] = row
+            kept_lines.append(line)
+    if dropped:
+        with open(checkpoint_path, 'wb') as file:
+            file.writelines(kept_lines)
+    return done_rows
+
+def append_checkpoint(file, index, info):
+    """처리한 기사 한 건을 중간 저장 파일에 추가하고 바로 디스크에 씁니다."""
+    row = {'index': index, 'url': info['url'], 'title': info['title'], 'date': info['date'], 'press': info['press']}
+    file.write(json.dumps(row, ensure_ascii=False) + '\n')
+    file.flush()
+
+def date_sort_key(date_str):
+    """정렬을 위한 날짜 키 (날짜가 없거나 YYYY-MM-DD 형식이 아니면 가장 앞)"""
+    return date_str if dates.is_date_string(date_str) else ""
+
+def write_sorted_excel(checkpoint_path, output_excel_path, preview_count=5):
+    """
+    중간 저장 파일을 날짜순(오래된 순서부터)으로 정렬해 엑셀로 저장합니다.
+    정렬은 (날짜, 입력 순번, 파일 위치) 키만 메모리에 올려 수행하고,
+    행은 파일에서 하나씩 다시 읽어 write-only 워크북에 씁니다.
+    저장한 행 수와 미리보기용 앞부분 행들을 반환합니다.
+    """
+    keys = []
+    with open(checkpoint_path, 'rb') as file:
+        offset = 0
+        for line in file:
+            row = json.loads(line)
+            keys.append((date_sort_key(row['date']), row['index'], offset))
+            offset += len(line)
+    keys.sort()
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet('Sheet1')
+    sheet.append(OUTPUT_COLUMNS)
+    preview = []
+    with open(checkpoint_path, 'rb') as file:
+        for _, _, offset in keys:
+            file.seek(offset)
+            row = json.loads(file.readline())
+            values = [row['url'], row['title'], row['date'], row['press']]
+            sheet.append(values)
+            if len(preview) < preview_count:
+                preview.append(values)
+    workbook.save(output_excel_path)
+    return len(keys), preview
+
+# -------------------- [기사 정보 추출 규칙] --------------------
+# lxml이 설치되어 있으면 더 빠른 lxml 파서 사용
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# 도메인별 규칙이 없거나 규칙으로 찾지 못했을 때 쓰는 공통 선택자
+# 제목 추출 (여러 패턴을 앞에서부터 시도)
+TITLE_SELECTORS = [
+    'h1.headline',  # 일반적인 헤드라인
+    'h1.title',
+    'h1',
+    '.article-head h1',
+    '.article-title',
+    'title',
+    'meta[property="og:title"]'
+]
+# 앞부분만 받은 문서의 제목 선택자: 본문(h1 등)이 잘렸을 수 있으므로 og:title을 클래스 없는 h1과 <title>보다 먼저 확인
+HEAD_TITLE_SELECTORS = ['h1.headline', 'h1.title', 'meta[property="og:title"]', 'h1', '.article-head h1', '.article-title', 'title']
+# 앞부분만 받을 때 이 선택자(또는 도메인 규칙의 제목 선택자, og:title)가 나와야 제목을 찾았다고 봄
+# (클래스 없는 h1은 로고인 경우가 많아 기다리지 않음)
+HEADLINE_SELECTORS = ['h1.headline', 'h1.title']
+
+# 메타 태그 등에서 언론사 정보 추출
+PRESS_SELECTORS = [
+    'meta[property="og:site_name"]',
+    'meta[name="author"]',
+    '.press',
+    '.source',
+    '.media'
+]
+
+DATE_SELECTORS = [
+    'meta[property="article:published_time"]',
+    'meta[name="article:published_time"]',
+    'time',
+    '.date',
+    '.publish-date',
+    '.article-date'
+]
+
+SIMPLE_SELECTOR_PATTERN = re.compile(r'^([\w-]+)?(?:\.([\w-]+))?(?:\[([\w:-]+)="([^"]*)"\])?$')
+
+@lru_cache(maxsize=None)
+def compile_selector(selector):
+    """
+    'h1', 'h1.title', '.date', 'meta[property="og:site_name"]', '.article-head h1' 형태의
+    간단한 CSS 선택자를 요소 판별 함수로 바꿉니다.
+    """
+    parts = selector.split()
+    if len(parts) == 2:
+        ancestor = compile_selector(parts[0])
+        target = compile_selector(parts[1])
+        return lambda element: target(element) and any(ancestor(parent) for parent in element.parents if parent.name)
+
+    match = SIMPLE_SELECTOR_PATTERN.match(selector)
+    if not match:
+        raise ValueError(f"지원하지 않는 선택자입니다: {selector}")
+    tag_name, class_name, attr_name, attr_value = match.groups()
+
+    def matches(element):
+        if tag_name and element.name != tag_name:
+            return False
+        if class_name and class_name not in (element.get('class') or ()):
+            return False
+        if attr_name and element.get(attr_name) != attr_value:
+            return False
+        return True
+    return matches
+
+def find_first_matches(soup, selectors):
+    """
+    문서를 한 번만 순회하며 selectors 각각에 처음 일치하는 요소를 찾습니다.
+    (선택자마다 soup.select_one으로 전체 트리를 다시 훑는 것과 결과가 같습니다.)
+    모든 선택자를 찾으면 남은 문서는 보지 않습니다.
+    """
+    selectors = list(dict.fromkeys(selectors))
+    compiled = [(selector, compile_selector(selector)) for selector in selectors]
+    found = {}
+    for element in soup.descendants:
+        if element.name is None:
+            continue
+        for selector, matches in compiled:
+            if selector not in found and matches(element):
+                found[selector] = element
+        if len(found) == len(compiled):
+            break
+    return found
+
+# -------------------- [도메인별 추출 규칙 레지스트리] --------------------
+EXTRACTION_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "extraction_rules.json")
+LEARNED_SELECTORS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "learned_selectors.json")
+
+class ExtractionRuleRegistry:
+    """
+    도메인별 추출 규칙(extraction_rules.json)과, 규칙이 없는 도메인에서 실제로 성공한
+    공통 선택자 기록을 관리합니다. 기록된 선택자는 다음 기사에서 가장 먼저 시도합니다.
+    """
+    def __init__(self, rules_path=EXTRACTION_RULES_PATH, learned_path=LEARNED_SELECTORS_PATH):
+        self.learned_path = learned_path
+        self.lock = threading.Lock()
+        with open(rules_path, 'r', encoding='utf-8') as file:
+            self.rules = json.load(file)
+        self.learned = {}
+        if learned_path and os.path.exists(learned_path):
+            try:
+                with open(learned_path, 'r', encoding='utf-8') as file:
+                    self.learned = json.load(file)
+            except (OSError, ValueError):
+                self.learned = {}
+        # 앞부분만 받은 문서에서 로고 h1을 제목으로 배운 기록이 있을 수 있어 클래스 없는 h1 기록은 버리고
+        # 공통 선택자 순서로 다시 찾음
+        for selectors in self.learned.values():
+            if selectors.get('title') == 'h1':
+                del selectors['title']
+
+    def rule_for(self, domain):
+        """도메인 규칙을 찾습니다. 하위 도메인은 상위 도메인 규칙을 씁니다. (m.yna.co.kr → yna.co.kr)"""
+        parts = domain.split('.')
+        for i in range(len(parts) - 1):
+            rule = self.rules.get('.'.join(parts[i:]))
+            if rule:
+                return rule
+        return None
+
+    def press_for(self, domain):
+        rule = self.rule_for(domain)
+        return rule.get('press') if rule else None
+
+    def preferred_selectors(self, domain, field):
+        """도메인 규칙 또는 기록된 선택자 중 field(title/press/date)에 먼저 시도할 선택자 목록"""
+        rule = self.rule_for(domain)
+        if rule and rule.get(field):
+            return list(rule[field])
+        learned = self.learned.get(domain, {}).get(field)
+        return [learned] if learned else []
+
+    def learn(self, domain, field, selector):
+        if self.rule_for(domain):
+            return
+        with self.lock:
+            self.learned.setdefault(domain, {})[field] = selector
+
+    def save(self):
+        """기록된 선택자를 파일로 저장합니다."""
+        if not self.learned_path:
+            return
+        os.makedirs(os.path.dirname(self.learned_path), exist_ok=True)
+        with self.lock:
+            with open(self.learned_path, 'w', encoding='utf-8') as file:
+                json.dump(self.learned, file, ensure_ascii=False, indent=2)
+
+EXTRACTION_RULES = ExtractionRuleRegistry()
+
+GENERIC_SELECTORS = {'title': TITLE_SELECTORS, 'press': PRESS_SELECTORS, 'date': DATE_SELECTORS}
+
+def element_value(element, field):
+    """요소에서 field 값을 꺼냅니다. (meta는 content, time은 datetime 속성 우선)"""
+    if element.name == 'meta':
+        text = element.get('content', '')
+    elif field == 'date' and element.name == 'time':
+        text = element.get('datetime', '') or element.get_text()
+    else:
+        text = element.get_text()
+
+    if field == 'date':
+        return dates.parse_date_text(text) if text else None
+    return text.strip()
+
+def resolve_fields(found, selectors_by_field, require_value):
+    """
+    필드별로 선택자를 순서대로 확인해 값을 정합니다. {field: (값, 선택자)}를 반환합니다.
+    require_value가 False이면 제목은 처음 일치한 요소의 값이 비어 있어도 그대로 씁니다. (기존 동작)
+    """
+    resolved = {}
+    for field, selectors in selectors_by_field.items():
+        for selector in selectors:
+            element = found.get(selector)
+            if element is None:
+                continue
+            value = element_value(element, field)
+            if value or (field == 'title' and not require_value):
+                resolved[field] = (value, selector)
+                break
+    return resolved
+
+def parse_news_page(content, url, rules=EXTRACTION_RULES, complete=True):
+    """
+    기사 HTML에서 제목, 날짜, 언론사 정보를 추출합니다.
+    도메인 규칙(또는 기록된 선택자)으로 먼저 찾고, 못 찾은 필드만 공통 선택자로 찾습니다.
+    complete가 False(앞부분만 받은 문서)이면 제목은 HEAD_TITLE_SELECTORS 순서로 찾고,
+    뒤에 더 맞는 요소가 있을 수 있으므로 선택자를 기록하지 않습니다.
+    """
+    soup = BeautifulSoup(content, HTML_PARSER)
+    netloc = urlparse(url).netloc
+    domain = get_domain_key(url)
+
+    # 도메인 기반으로 언론사 추출
+    press = rules.press_for(domain)
+    fields = ['title', 'date'] if press else ['title', 'press', 'date']
+
+    # 1) 도메인 규칙 / 기록된 선택자
+    values = {}
+    preferred = {field: rules.preferred_selectors(domain, field) for field in fields}
+    preferred = {field: selectors for field, selectors in preferred.items() if selectors}
+    if preferred:
+        found = find_first_matches(soup, [s for selectors in preferred.values() for s in selectors])
+        for field, (value, _) in resolve_fields(found, preferred, require_value=True).items():
+            values[field] = value
+
+    # 2) 남은 필드는 공통 선택자로 찾고, 성공한 선택자를 기록
+    generic = {field: GENERIC_SELECTORS[field] for field in fields if field not in values}
+    if not complete and 'title' in generic:
+        generic['title'] = HEAD_TITLE_SELECTORS
+    if generic:
+        found = find_first_matches(soup, [s for selectors in generic.values() for s in selectors])
+        for field, (value, selector) in resolve_fields(found, generic, require_value=False).items():
+            values[field] = value
+            if value and complete:
+                rules.learn(domain, field, selector)
+
+    title = values.get('title')
+    if not title:
+        title = soup.title.string if soup.title else "제목 없음"
+
+    press = press or values.get('press') or netloc
+
+    date = values.get('date') or "날짜 없음"
+
+    return {
+        'url': url.strip(),
+        'title': title,
+        'date': date,
+        'press': press
+    }
+
+class ScannedElement:
+    """HeadScanner가 읽은 시작 태그 (compile_selector의 판별 함수에 넘길 수 있는 최소한의 요소)"""
+    __slots__ = ('name', 'attrs', 'parents')
+
+    def __init__(self, name, attrs, parents):
+        self.name = name
+        self.attrs = attrs
+        self.parents = parents
+
+    def get(self, key, default=None):
+        if key == 'class':
+            return (self.attrs.get('class') or '').split() or default
+        return self.attrs.get(key, default)
+
+class HeadScanner(HTMLParser):
+    """
+    스트리밍으로 받는 HTML에서 제목·언론사·날짜 단서가 모두 나왔는지 확인하는 증분 파서입니다.
+    제목은 og:title이나 title_selectors(도메인 규칙, 클래스가 붙은 헤드라인)에 맞는 요소가
+    내용과 함께 닫혔을 때만 찾았다고 봅니다.
+    """
+    VOID_TAGS = frozenset(['area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'])
+
+    def __init__(self, press_known=False, title_selectors=HEADLINE_SELECTORS):
+        super().__init__(convert_charrefs=True)
+        self.has_title = False
+        self.has_press = press_known
+        self.has_date = False
+        self.title_matchers = [compile_selector(selector) for selector in title_selectors]
+        self.open_elements = []
+        self.title_depth = None  # 제목 후보 요소가 열려 있으면 그 요소까지의 깊이
+        self.title_text = []
+
+    @property
+    def resolved(self):
+        return self.has_title and self.has_press and self.has_date
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'meta':
+            key = attrs.get('property') or attrs.get('name')
+            content = (attrs.get('content') or '').strip()
+            if key in ('og:site_name', 'author') and content:
+                self.has_press = True
+            elif key == 'og:title' and content:
+                self.has_title = True
+            elif key == 'article:published_time' and dates.parse_date_text(content):
+                self.has_date = True
+        elif tag == 'time' and dates.parse_date_text(attrs.get('datetime') or ''):
+            self.has_date = True
+
+        if tag in self.VOID_TAGS:
+            return
+        element = ScannedElement(tag, attrs, self.open_elements[::-1])
+        self.open_elements.append(element)
+        if not self.has_title and self.title_depth is None and any(matches(element) for matches in self.title_matchers):
+            self.title_depth = len(self.open_elements)
+            self.title_text = []
+
+    def handle_data(self, data):
+        if self.title_depth is not None:
+            self.title_text.append(data)
+
+    def handle_endtag(self, tag):
+        # 닫는 태그가 빠진 요소는 바깥 요소가 닫힐 때 함께 닫음
+        for depth in range(len(self.open_elements), 0, -1):
+            if self.open_elements[depth - 1].name == tag:
+                del self.open_elements[depth - 1:]
+                break
+        if self.title_depth is not None and len(self.open_elements) < self.title_depth:
+            self.title_depth = None
+            if ''.join(self.title_text).strip():
+                self.has_title = True
+
+def fetch_page_head(url, rate_limiter=None):
+    """
+    기사 페이지를 스트리밍으로 받으면서 증분 파서로 살펴보고,
+    제목·언론사·날짜가 모두 나오면 그때까지 받은 앞부분만 반환합니다.
+    HEAD_FETCH_BYTE_BUDGET 안에 다 나오지 않으면 전체 페이지를 받습니다.
+    앞부분은 '{url}#head' 키로, 전체 페이지는 url 키로 응답 캐시에 저장합니다.
+    (내용, 전체 페이지 여부)를 반환합니다.
+    """
+    cache = http_client.get_cache()
+    head_key = f"{url}#head"
+    for key in (url, head_key):
+        cached, fresh = cache.lookup(key)
+        if cached is not None and fresh:
+            return cached.content, key == url
+
+    response = http_client.get(url, rate_limiter=rate_limiter, stream=True)
+    try:
+        response.raise_for_status()
+        domain = get_domain_key(url)
+        rule = EXTRACTION_RULES.rule_for(domain) or {}
+        scanner = HeadScanner(press_known=rule.get('press') is not None,
+                              title_selectors=list(rule.get('title') or []) + HEADLINE_SELECTORS)
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        chunks = []
+        received = 0
+        for chunk in response.iter_content(HEAD_FETCH_CHUNK_SIZE):
+            chunks.append(chunk)
+            received += len(chunk)
+            if received <= HEAD_FETCH_BYTE_BUDGET:
+                scanner.feed(decoder.decode(chunk))
+                if scanner.resolved:
+                    head = b''.join(chunks)
+                    cache.store(head_key, build_response(head_key, response.status_code, dict(response.headers), head, response.encoding))
+                    return head, False
+        content = b''.join(chunks)
+        cache.store(url, build_response(url, response.status_code, dict(response.headers), content, response.encoding))
+        return content, True
+    finally:
+        response.close()
+
+def extract_news_info(url, rate_limiter=None):
     """
     뉴스 기사 URL에서 제목, 날짜, 언론사 정보를 추출합니다.
+    rate_limiter가 주어지면 실제 네트워크 요청 전에 도메인별 요청 속도 제한을 적용합니다.
     """
     try:
-        # User-Agent 헤더 추가 (일부 사이트에서 봇 차단 방지)
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url.strip(), headers=headers, timeout=10)
+        # 공용 세션 사용 (User-Agent 헤더, 연결 재사용, 재시도 포함)
+        if HEAD_ONLY_FETCH:
+            content, complete = fetch_page_head(url.strip(), rate_limiter)
+            return parse_news_page(content, url, complete=complete)
+        response = http_client.get(url.strip(), rate_limiter=rate_limiter)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # 제목 추출 (여러 패턴 시도)
-        title = None
-        title_selectors = [
-            'h1.headline',  # 일반적인 헤드라인
-            'h1.title',
-            'h1',
-            '.article-head h1',
-            '.article-title',
-            'title'
-        ]
-        
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element:
-                title = element.get_text().strip()
-                break
-        
-        if not title:
-            title = soup.title.string if soup.title else "제목 없음"
-        
-        # 언론사 추출
-        press = None
-        
-        # 도메인 기반으로 언론사 추출
-        domain = urlparse(url).netloc
-        domain_to_press = {
-            'news.naver.com': '네이버뉴스',
-            'www.chosun.com': '조선일보',
-            'www.donga.com': '동아일보',
-            'www.joongang.co.kr': '중앙일보',
-            'www.hani.co.kr': '한겨레',
-            'www.khan.co.kr': '경향신문',
-            'www.yna.co.kr': '연합뉴스',
-            'news.kbs.co.kr': 'KBS',
-            'imnews.imbc.com': 'MBC',
-            'news.sbs.co.kr': 'SBS'
-        }
-        
-        press = domain_to_press.get(domain)
-        
-        # 메타 태그에서 언론사 정보 추출
-        if not press:
-            press_selectors = [
-                'meta[property="og:site_name"]',
-                'meta[name="author"]',
-                '.press',
-                '.source',
-                '.media'
-            ]
-            
-            for selector in press_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    if element.name == 'meta':
-                        press = element.get('content', '').strip()
-                    else:
-                        press = element.get_text().strip()
-                    if press:
-                        break
-        
-        if not press:
-            press = domain
-        
-        # 날짜 추출
-        date = None
-        date_selectors = [
-            'meta[property="article:published_time"]',
-            'meta[name="article:published_time"]',
-            'time',
-            '.date',
-            '.publish-date',
-            '.article-date'
-        ]
-        
-        for selector in date_selectors:
-            element = soup.select_one(selector)
-            if element:
-                if element.name == 'meta':
-                    date_text = element.get('content', '')
-                elif element.name == 'time':
-                    date_text = element.get('datetime', '') or element.get_text()
-                else:
-                    date_text = element.get_text()
-                
-                # 날짜 형식 파싱
-                if date_text:
-                    # ISO 형식 (2024-01-15T10:30:00+09:00)
-                    iso_match = re.search(r'(\d{4}-\d{2}-\d{2})', date_text)
-                    if iso_match:
-                        date = iso_match.group(1)
-                        break
-                    
-                    # 한국어 형식 (2024년 1월 15일, 2024.01.15 등)
-                    korean_match = re.search(r'(\d{4})[년\-\.](\d{1,2})[월\-\.](\d{1,2})', date_text)
-                    if korean_match:
-                        year, month, day = korean_match.groups()
-                        date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                        break
-        
-        if not date:
-            date = "날짜 없음"
-        
-        return {
-            'url': url.strip(),
-            'title': title,
-            'date': date,
-            'press': press
-        }
+        return parse_news_page(response.content, url)
     
     except Exception as e:
         print(f"Error processing {url}: {str(e)}")
@@ -138,100 +616,121 @@ def extract_news_info(url):
             'press': "언론사 없음"
         }
 
-def process_news_links(txt_file_path, output_excel_path):
+def process_news_links(txt_file_path, output_excel_path, registry=None):
     """
     TXT 파일에서 뉴스 링크를 읽어와 정보를 추출하고 엑셀 파일로 저장합니다.
+    처리한 기사는 바로 중간 저장 파일(출력 파일 + CHECKPOINT_SUFFIX)에 기록하므로,
+    도중에 실패해도 다시 실행하면 끝난 URL은 건너뛰고 이어서 처리합니다.
+    저장한 기사 수를 반환합니다.
+    registry를 주면 새로 열지 않고 그 등록부에 등록합니다. (다른 섹션과 함께 실행할 때)
     """
     try:
-        # TXT 파일 읽기
-        with open(txt_file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # 쉼표로 구분된 URL들 추출
-        urls = [url.strip() for url in content.split(',') if url.strip()]
+        # 이전 실행에서 끝난 URL은 건너뛰고 이어서 처리 (오류가 났던 URL은 다시 처리)
+        checkpoint_path = output_excel_path + CHECKPOINT_SUFFIX
+        done_urls = load_checkpoint(checkpoint_path)
+        if done_urls:
+            print(f"이전 실행에서 처리한 {len(done_urls)}개의 URL을 건너뜁니다.")
+
+        if registry is None and USE_ARTICLE_REGISTRY:
+            registry = ArticleRegistry("news_captor")
+        if registry is not None:
+            # 등록부는 이 섹션의 이번 호 기록을 지우고 시작하므로, 이미 처리한 기사는 다시 등록
+            for url, row in done_urls.items():
+                registry.claim(url, row['title'])
+        counts = {'links': 0, 'registered': 0}
+
+        def pending_links():
+            """링크 파일을 읽는 대로 (입력 순번, URL)을 내보냅니다. 순번은 같은 날짜 기사의 정렬에 사용합니다."""
+            for position, url in iter_unique_links(txt_file_path):
+                counts['links'] += 1
+                if url in done_urls:
+                    continue
+                # 이미 실린 기사는 요청을 보내기 전에 제외
+                if registry is not None and not registry.claim(url):
+                    counts['registered'] += 1
+                    continue
+                yield position, url
+
+        print("링크 파일을 읽으면서 바로 처리합니다...")
         
-        if not urls:
+        # 각 URL에서 정보 추출 (서버 부하 방지를 위해 도메인별로 요청 속도 제한)
+        # 끝나는 대로 중간 저장 파일에 한 줄씩 기록
+        with open(checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+            for position, info in iter_news_info(pending_links()):
+                append_checkpoint(checkpoint, position, info)
+                if registry is not None and info['title'] and not is_error_row(info):
+                    registry.set_title(info['url'], info['title'])
+
+        if counts['registered']:
+            print(f"이미 실린 기사 {counts['registered']}개를 건너뛰었습니다.")
+        if counts['links'] == 0:
             print("유효한 URL이 없습니다.")
+            os.remove(checkpoint_path)
+            if registry is not None:
+                registry.close()
             return
+        EXTRACTION_RULES.save()
+        if registry is not None:
+            registry.close()
         
-        print(f"총 {len(urls)}개의 URL을 처리합니다...")
-        
-        # 각 URL에서 정보 추출
-        news_data = []
-        for i, url in enumerate(urls, 1):
-            print(f"처리 중... ({i}/{len(urls)}) {url[:50]}...")
-            
-            info = extract_news_info(url)
-            news_data.append(info)
-            
-            # 서버 부하 방지를 위한 딜레이
-            time.sleep(1)
-        
-        # DataFrame 생성
-        df = pd.DataFrame(news_data, columns=['url', 'title', 'date', 'press'])
-        df.columns = ['링크', '기사제목', '기사날짜', '언론사명']
-        
-        # 날짜순 정렬 (오래된 순서부터)
-        def parse_date_for_sorting(date_str):
-            """정렬을 위한 날짜 파싱"""
-            if date_str == "날짜 없음" or not date_str:
-                return datetime.min
-            try:
-                # YYYY-MM-DD 형식 파싱
-                return datetime.strptime(date_str, '%Y-%m-%d')
-            except:
-                return datetime.min
-        
-        df['정렬용_날짜'] = df['기사날짜'].apply(parse_date_for_sorting)
-        df = df.sort_values('정렬용_날짜').drop('정렬용_날짜', axis=1)
-        df = df.reset_index(drop=True)
-        
-        # 엑셀 파일로 저장
-        df.to_excel(output_excel_path, index=False, engine='openpyxl')
+        # 날짜순 정렬 (오래된 순서부터) 후 엑셀 파일로 저장
+        row_count, preview = write_sorted_excel(checkpoint_path, output_excel_path)
+        os.remove(checkpoint_path)
         print(f"\n완료! 결과가 '{output_excel_path}' 파일로 저장되었습니다.")
         
         # 결과 미리보기
         print("\n=== 추출된 데이터 미리보기 ===")
-        print(df.head())
+        print(" | ".join(OUTPUT_COLUMNS))
+        for values in preview:
+            print(" | ".join(str(value) for value in values))
         
-        return df
+        return row_count
     
     except Exception as e:
         print(f"파일 처리 중 오류 발생: {str(e)}")
         return None
 
-# 사용 예시
-if __name__ == "__main__":
-    import os
-    
-    # 현재 스크립트 파일이 있는 디렉토리 가져오기
+def default_paths():
+    """스크립트와 같은 폴더의 (news_link.txt, news_data.xlsx) 경로를 반환합니다."""
     script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(script_dir, "news_link.txt"), os.path.join(script_dir, "news_data.xlsx")
+
+def locate_link_file(txt_file):
+    """
+    링크 파일이 없으면 같은 폴더의 txt 파일 목록을 보여 주고,
+    txt 파일이 하나뿐이면 그 파일을 대신 사용합니다. 찾지 못하면 None.
+    """
+    if os.path.exists(txt_file):
+        return txt_file
+
+    script_dir = os.path.dirname(txt_file)
+    print(f"파일을 찾을 수 없습니다: {txt_file}")
+    print("현재 디렉토리의 txt 파일들:")
+    txt_files = [f for f in os.listdir(script_dir) if f.endswith('.txt')]
+    for file in txt_files:
+        print(f"  - {file}")
     
+    # txt 파일이 하나만 있다면 자동으로 사용
+    if len(txt_files) == 1:
+        print(f"자동으로 선택된 파일: {txt_files[0]}")
+        return os.path.join(script_dir, txt_files[0])
+    return None
+
+# 사용 예시
+if __name__ == "__main__":
     # 파일 경로 설정 (스크립트와 같은 폴더)
-    txt_file = os.path.join(script_dir, "news_link.txt")  # 입력 TXT 파일 경로
-    excel_file = os.path.join(script_dir, "news_data.xlsx")  # 출력 엑셀 파일 경로
+    txt_file, excel_file = default_paths()  # 입력 TXT 파일, 출력 엑셀 파일 경로
     
     # 파일 존재 확인
-    if not os.path.exists(txt_file):
-        print(f"파일을 찾을 수 없습니다: {txt_file}")
-        print("현재 디렉토리의 txt 파일들:")
-        for file in os.listdir(script_dir):
-            if file.endswith('.txt'):
-                print(f"  - {file}")
-        
-        # txt 파일이 하나만 있다면 자동으로 사용
-        txt_files = [f for f in os.listdir(script_dir) if f.endswith('.txt')]
-        if len(txt_files) == 1:
-            txt_file = os.path.join(script_dir, txt_files[0])
-            print(f"자동으로 선택된 파일: {txt_files[0]}")
-        else:
-            exit()
+    txt_file = locate_link_file(txt_file)
+    if txt_file is None:
+        exit()
     
     # 뉴스 링크 처리 실행
     result = process_news_links(txt_file, excel_file)
     
     if result is not None:
-        print(f"\n총 {len(result)}개의 기사 정보가 추출되었습니다.")
+        print(f"\n총 {result}개의 기사 정보가 추출되었습니다.")
     
     # 단일 URL 테스트용 함수
     def test_single_url(url):
@@ -0,0 +1,169 @@
+"""
+뉴스레터 한 호를 한 번에 만드는 실행 파일입니다.
+
+ntis(국가R&D 공고), member_search(회원사 이슈), keyword_news(키워드 뉴스), news_captor(기사 링크 → 엑셀)
+네 단계는 서로 독립적인 네트워크 작업이므로 동시에 실행하고, HTML 세 섹션은 하나의 문서로 합칩니다.
+기사를 싣는 세 단계는 기사 등록부 하나를 함께 써서 한 섹션에 실린 기사를 다른 섹션에서 제외합니다.
+
+실행 예: python newsletter.py --start 2025-11-20 --end 2025-11-27
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+for folder in ("ntis", "member_search", "keyword_news", "news_captor"):
+    sys.path.append(os.path.join(ROOT_DIR, folder))
+
+from common import cli
+from common import html_render
+from common.article_registry import ArticleRegistry, issue_for
+import newscaptor
+import newsletter_2 as member_search
+import newsletter_3 as keyword_news
+import ntis_newsletter as ntis
+
+# -------------------- [설정값] --------------------
+OUTPUT_HTML_FILENAME = "newsletter.html"
+ISSUE_TITLE = "뉴스레터"
+SECTION_SEPARATOR = "\n<br>\n"  # 섹션 표 사이 간격
+STAGES = ("ntis", "member", "keyword", "captor")
+# 기사 등록부를 함께 쓰는 단계와 등록부에 기록하는 섹션 이름
+REGISTRY_SECTIONS = {"member": "member_search", "keyword": "keyword_news", "captor": "news_captor"}
+
+ISSUE_HTML_HEADER = html_render.Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+</head>
+<body>
+""")
+ISSUE_HTML_FOOTER = """
+</body>
+</html>
+"""
+
+# -------------------- [단계별 실행 함수] --------------------
+def run_ntis(start_date, end_date, ntis_limit=None, **_):
+    """NTIS 공고 섹션 (공고 목록은 기간과 관계없이 마감일 기준으로 고름)"""
+    document = ntis.build_ntis_html(ntis_limit, issue=issue_for(end_date))
+    return html_render.body_fragment(document) if document else None
+
+def run_member(start_date, end_date, registry=None, **_):
+    all_news_data = member_search.collect_member_news(start_date, end_date, registry=registry)
+    if all_news_data is None:
+        return None
+    return html_render.body_fragment(member_search.generate_member_news_html(all_news_data))
+
+def run_keyword(start_date, end_date, registry=None, **_):
+    return keyword_news.generate_table_html(keyword_news.collect_keyword_news(start_date, end_date, registry=registry))
+
+def run_captor(start_date, end_date, registry=None, **_):
+    """기사 링크 파일을 엑셀로 정리합니다. (HTML 섹션은 만들지 않음)"""
+    txt_file, excel_file = newscaptor.default_paths()
+    txt_file = newscaptor.locate_link_file(txt_file)
+    if txt_file is None:
+        return None
+    newscaptor.process_news_links(txt_file, excel_file, registry=registry)
+    return None
+
+STAGE_FUNCTIONS = {
+    "ntis": run_ntis,
+    "member": run_member,
+    "keyword": run_keyword,
+    "captor": run_captor,
+}
+
+def run_stage(name, start_date, end_date, ntis_limit, registry=None):
+    """한 단계를 실행하고 (HTML 조각, 걸린 시간, 오류)를 반환합니다. 한 단계가 실패해도 나머지는 계속합니다."""
+    started = time.perf_counter()
+    try:
+        fragment = STAGE_FUNCTIONS[name](start_date, end_date, ntis_limit=ntis_limit, registry=registry)
+        return fragment, time.perf_counter() - started, None
+    except Exception as e:
+        return None, time.perf_counter() - started, e
+
+def build_issue(start_date, end_date, stages=STAGES, ntis_limit=None):
+    """
+    단계들을 동시에 실행하고 {단계: (HTML 조각, 걸린 시간, 오류)}와 전체 걸린 시간을 반환합니다.
+    전체 시간은 네 단계의 합이 아니라 가장 오래 걸린 단계에 가깝습니다.
+    기사를 싣는 단계들은 종료 날짜 기준 호의 기사 등록부 하나를 섹션별로 나눠 씁니다.
+    """
+    started = time.perf_counter()
+    sections = [REGISTRY_SECTIONS[name] for name in stages if name in REGISTRY_SECTIONS]
+    registry = ArticleRegistry(sections[0], issue_for(end_date), sections=sections) if sections else None
+    try:
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = {
+                name: executor.submit(run_stage, name, start_date, end_date, ntis_limit,
+                                      registry.for_section(REGISTRY_SECTIONS[name]) if name in REGISTRY_SECTIONS else None)
+                for name in stages
+            }
+            results = {name: future.result() for name, future in futures.items()}
+    finally:
+        if registry is not None:
+            registry.close()
+    return results, time.perf_counter() - started
+
+def write_issue(output_path, fragments, title=ISSUE_TITLE):
+    """섹션 조각들을 하나의 HTML 문서로 흘려 씁니다."""
+    def chunks():
+        yield ISSUE_HTML_HEADER.render(title=title)
+        for i, fragment in enumerate(fragments):
+            if i:
+                yield SECTION_SEPARATOR
+            yield fragment
+        yield ISSUE_HTML_FOOTER
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        html_render.render_document(chunks(), out=f)
+
+def print_timings(results, total_seconds):
+    print("\n=== 단계별 실행 시간 ===")
+    for name, (fragment, seconds, error) in results.items():
+        status = f"❌ 실패: {error}" if error else ("✅" if fragment else "✅ (HTML 섹션 없음)")
+        print(f"  {name:<8} {seconds:7.1f}초  {status}")
+    slowest = max((seconds for _, seconds, _ in results.values()), default=0)
+    print(f"  전체      {total_seconds:7.1f}초  (가장 느린 단계 {slowest:.1f}초, 단계 합계 {sum(seconds for _, seconds, _ in results.values()):.1f}초)")
+
+# -------------------- [메인 실행 부분] --------------------
+def parse_args(argv=None):
+    default_start, default_end = cli.default_date_range()
+    parser = argparse.ArgumentParser(description="뉴스레터 한 호의 네 섹션을 동시에 만들어 하나의 HTML로 합칩니다.")
+    parser.add_argument("--start", type=cli.valid_date, default=default_start,
+                        help="뉴스 검색 시작 날짜 (YYYY-MM-DD, 기본: 7일 전)")
+    parser.add_argument("--end", type=cli.valid_date, default=default_end,
+                        help="뉴스 검색 종료 날짜 (YYYY-MM-DD, 기본: 오늘)")
+    parser.add_argument("--output", default=os.path.join(ROOT_DIR, OUTPUT_HTML_FILENAME), help="합친 HTML 저장 경로")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES), help="실행할 단계 (기본: 전체)")
+    parser.add_argument("--ntis-limit", type=int, default=None, help="NTIS 부처별 최대 공고 수 (기본: 전체)")
+    args = parser.parse_args(argv)
+    cli.check_date_range(parser, args)
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(f"📰 {args.start} ~ {args.end} 뉴스레터를 만듭니다. (단계: {', '.join(args.stages)})")
+
+    results, total_seconds = build_issue(args.start, args.end, args.stages, args.ntis_limit)
+    print_timings(results, total_seconds)
+
+    # 섹션 순서는 실행이 끝난 순서가 아니라 STAGES 순서
+    fragments = [results[name][0] for name in STAGES if name in results and results[name][0]]
+    if not fragments:
+        print("\n❌ 만들어진 HTML 섹션이 없어 뉴스레터를 저장하지 않습니다.")
+        return 1
+    try:
+        write_issue(args.output, fragments)
+        print(f"\n🎉 성공! '{args.output}' 파일이 생성되었습니다.")
+    except IOError as e:
+        print(f"\n❌ 오류: HTML 파일을 저장할 수 없습니다. {e}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
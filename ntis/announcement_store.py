@@ -0,0 +1,142 @@
+import hashlib
+import os
+import sqlite3
+import time
+
+import pandas as pd
+
+# -------------------- [설정값] --------------------
+STORE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "ntis_announcements.sqlite3")
+
+class AnnouncementStore:
+    """
+    이전 실행에서 본 NTIS 공고를 URL 기준으로 기록하는 저장소입니다.
+
+    - sync(): 이번 목록과 비교해 새 공고 / 마감일·제목이 바뀐 공고 / 목록에서 빠진 공고만 반영하고,
+      이번 호(issue)에서 목록을 마지막으로 확인한 시각을 기록합니다.
+    - new_since_previous_issue(): 이전 호가 마지막으로 확인한 뒤 처음 본 공고를 반환합니다.
+      (같은 호를 다시 실행해도 비교 기준이 같으므로 같은 공고가 나옴)
+    - render_block(): 부처 블록 HTML을 그 부처 공고 행의 내용 해시와 함께 저장해 두고,
+      공고가 바뀌지 않은 부처는 저장된 HTML을 그대로 씁니다.
+    """
+    def __init__(self, path=STORE_PATH):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS announcements (
+                    url TEXT PRIMARY KEY,
+                    department TEXT,
+                    title TEXT,
+                    deadline TEXT,
+                    first_seen REAL,
+                    last_seen REAL,
+                    removed_at REAL
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS issues (
+                    issue TEXT PRIMARY KEY,
+                    synced_at REAL
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS blocks (
+                    alias TEXT PRIMARY KEY,
+                    fingerprint TEXT,
+                    html TEXT
+                )
+            """)
+        self.rebuilt_blocks = 0
+        self.reused_blocks = 0
+
+    def sync(self, df, departments, issue=None):
+        """
+        공고 목록 DataFrame을 저장소에 반영하고 (새 공고, 바뀐 공고, 빠진 공고) URL 집합을 반환합니다.
+        (새 공고는 지난 실행 이후 처음 본 공고) 저장소에는 달라진 행만 씁니다.
+        issue가 주어지면 그 호에서 목록을 확인한 시각을 기록합니다.
+        """
+        now = time.time()
+        mask = df['부처명'].isin(departments) & df['공고문 바로가기(URL)'].notna()
+        current = pd.DataFrame({
+            'url': df['공고문 바로가기(URL)'][mask].astype(str),
+            'department': df['부처명'][mask],
+            'title': df['공고명'][mask].astype(str),
+            'deadline': pd.to_datetime(df['마감일'][mask], errors='coerce').dt.strftime('%Y-%m-%d').fillna(''),
+        }).drop_duplicates('url', keep='last')
+
+        stored = pd.read_sql_query(
+            "SELECT url, title AS old_title, deadline AS old_deadline, removed_at FROM announcements", self.conn
+        )
+        merged = current.merge(stored, on='url', how='left')
+        is_new = merged['old_title'].isna() | merged['removed_at'].notna()
+        is_changed = ~is_new & ((merged['title'] != merged['old_title']) | (merged['deadline'] != merged['old_deadline']))
+
+        active = stored['url'][stored['removed_at'].isna()]
+        removed = set(active[~active.isin(current['url'])])
+
+        new_rows = merged[is_new]
+        changed_rows = merged[is_changed]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO announcements VALUES (?, ?, ?, ?, ?, ?, NULL)",
+                [(r.url, r.department, r.title, r.deadline, now, now) for r in new_rows.itertuples(index=False)],
+            )
+            self.conn.executemany(
+                "UPDATE announcements SET title = ?, deadline = ?, last_seen = ? WHERE url = ?",
+                [(r.title, r.deadline, now, r.url) for r in changed_rows.itertuples(index=False)],
+            )
+            self.conn.executemany(
+                "UPDATE announcements SET removed_at = ? WHERE url = ?",
+                [(now, url) for url in removed],
+            )
+            if issue:
+                self.conn.execute("INSERT OR REPLACE INTO issues VALUES (?, ?)", (issue, now))
+
+        new_urls, changed_urls = set(new_rows['url']), set(changed_rows['url'])
+        print(f"🔄 공고 동기화: 새 공고 {len(new_urls)}건, 변경 {len(changed_urls)}건, 종료/삭제 {len(removed)}건")
+        return new_urls, changed_urls, removed
+
+    def previous_issue_cutoff(self, issue):
+        """issue보다 앞선 호들 중 가장 마지막으로 목록을 확인한 시각. 이전 호 기록이 없으면 None."""
+        row = self.conn.execute("SELECT MAX(synced_at) FROM issues WHERE issue < ?", (issue,)).fetchone()
+        return row[0]
+
+    def new_since_previous_issue(self, issue):
+        """
+        이전 호가 마지막으로 목록을 확인한 뒤 처음 본(지금 목록에 있는) 공고 URL 집합을 반환합니다.
+        이전 호 기록이 없으면 지금 목록의 모든 공고가 새 공고입니다.
+        """
+        cutoff = self.previous_issue_cutoff(issue)
+        rows = self.conn.execute(
+            "SELECT url FROM announcements WHERE removed_at IS NULL AND first_seen > ?",
+            (cutoff if cutoff is not None else float('-inf'),),
+        )
+        return {url for (url,) in rows}
+
+    def render_block(self, alias, posts, is_first, render, fields):
+        """
+        부처 블록의 공고 행(fields 값)이 지난번과 같으면 저장된 HTML을, 다르면 render()로 새로 만들어 저장한 HTML을 반환합니다.
+        """
+        fingerprint = block_fingerprint(alias, posts, is_first, fields)
+        row = self.conn.execute("SELECT fingerprint, html FROM blocks WHERE alias = ?", (alias,)).fetchone()
+        if row and row[0] == fingerprint:
+            self.reused_blocks += 1
+            return row[1]
+
+        html = render(alias, posts, is_first)
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO blocks VALUES (?, ?, ?)", (alias, fingerprint, html))
+        self.rebuilt_blocks += 1
+        return html
+
+    def close(self):
+        self.conn.close()
+
+def block_fingerprint(alias, posts, is_first, fields):
+    """부처 블록 내용 해시. 블록에 들어가는 값(부처명, 첫 부처 여부, 공고 행의 fields 값)만 이어 붙여 해시함"""
+    digest = hashlib.sha1(f"{alias}\x1d{int(is_first)}".encode('utf-8'))
+    for post in posts:
+        digest.update(("\x1e" + "\x1f".join(str(post[field]) for field in fields)).encode('utf-8'))
+    return digest.hexdigest()
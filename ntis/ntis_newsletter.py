@@ -0,0 +1,526 @@
+import io
+import os
+import sys
+import time
+import hashlib
+import datetime
+from html.parser import HTMLParser
+import pandas as pd
+
+# 공통 모듈(common) 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import http_client
+from common import html_render
+from common.article_registry import current_issue
+from announcement_store import AnnouncementStore
+
+# -------------------- [설정값] --------------------
+# 1. 크롤링 관련 설정
+NTIS_URL = "https://www.ntis.go.kr/rndgate/eg/un/ra/mng.do"
+# '리스트 다운로드' 버튼은 목록 페이지(NTIS_URL)의 검색 폼을 목록 내보내기 주소로 제출합니다.
+# 직접 다운로드도 같은 모양으로 요청: 목록 페이지를 GET으로 받아(세션 쿠키 포함) 검색 폼의 입력값을 모두 읽고,
+# NTIS_EXPORT_PARAMS로 덮어쓴 폼 값을 NTIS_EXPORT_METHOD(POST, application/x-www-form-urlencoded)로 보냄
+# (사이트 개편 시 브라우저 개발자 도구 네트워크 탭에서 버튼을 눌렀을 때의 요청을 확인 후 수정)
+# 이 주소와 폼 구성은 로컬 테스트 서버로만 검증되어 있음. 실제 사이트 확인: NTIS_LIVE_TEST=1 python -m pytest tests/test_ntis_export.py
+NTIS_EXPORT_URL = "https://www.ntis.go.kr/rndgate/eg/un/ra/excelDownload.do"
+NTIS_EXPORT_METHOD = "POST"
+NTIS_SEARCH_FORM = "searchForm"  # 검색 폼의 id 또는 name (찾지 못하면 페이지의 첫 번째 폼)
+NTIS_EXPORT_PARAMS = {}  # 폼 값 대신 보낼 값 (비워 두면 목록 페이지의 기본 검색 조건 그대로)
+USE_DIRECT_DOWNLOAD = True  # HTTP로 목록을 직접 받고, 실패하면 브라우저(Selenium)로 내려받음
+REQUIRE_DIRECT_DOWNLOAD = False  # True면 직접 다운로드가 실패했을 때 브라우저로 넘어가지 않고 중단 (내보내기 주소 점검용)
+HEADLESS_BROWSER = True  # 브라우저를 쓸 때 창 없이 실행
+DOWNLOAD_TIMEOUT_SECONDS = 60
+DOWNLOAD_POLL_INITIAL_SECONDS = 0.2  # 브라우저 다운로드 완료 확인 첫 간격 (확인할 때마다 두 배로 늘림)
+DOWNLOAD_POLL_MAX_SECONDS = 2.0  # 브라우저 다운로드 완료 확인 최대 간격
+REQUIRED_COLUMNS = ['부처명', '공고명', '공고문 바로가기(URL)', '마감일']
+TEXT_COLUMNS = ['부처명', '공고명', '공고문 바로가기(URL)']
+DEADLINE_FORMAT = "%Y-%m-%d"  # NTIS 목록의 마감일 형식 (이 형식이 아닌 값만 일반 날짜 해석으로 다시 처리)
+TARGET_DEPARTMENTS = ["산업통상자원부", "과학기술정보통신부", "중소벤처기업부"]
+DEPT_ALIAS = {
+    "산업통상자원부": "산업부",
+    "과학기술정보통신부": "과기부",
+    "중소벤처기업부": "중기부"
+}
+DEADLINE_THRESHOLD_DAYS = 7
+ORDERED_ALIASES = ["산업부", "과기부", "중기부"]
+
+# 2. 파일 경로 설정
+DOWNLOAD_DIR = r"다운로드 파일을 저장할 폴더 경로"
+EXCEL_FILENAME = "공고목록.xls"
+EXCEL_FILE_PATH = os.path.join(DOWNLOAD_DIR, EXCEL_FILENAME)
+
+OUTPUT_HTML_FILENAME = "ntis_projects.html"
+OUTPUT_DIR = r"html 파일을 저장할 경로로"
+FULL_OUTPUT_PATH = os.path.join(OUTPUT_DIR, OUTPUT_HTML_FILENAME)
+
+# 3. 파싱 결과 캐시 설정
+USE_TABLE_CACHE = True  # 같은 목록 파일(내용 해시 기준)은 다시 파싱하지 않고 캐시에서 읽음
+TABLE_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "ntis_tables")
+
+try:
+    import pyarrow  # noqa: F401
+    TABLE_CACHE_FORMAT = 'parquet'
+except ImportError:
+    TABLE_CACHE_FORMAT = 'pickle'
+
+# 4. 증분 처리 설정
+USE_ANNOUNCEMENT_STORE = True  # 이전 실행에서 본 공고와 호(주)별 확인 시각을 기록하고, 공고가 바뀐 부처 블록만 다시 만듦
+WRITE_NEW_SINCE_LAST_ISSUE = True  # 지난 호 이후 새로 올라온 공고만 모은 HTML도 함께 출력 (같은 호를 다시 실행해도 같은 목록)
+OUTPUT_NEW_HTML_FILENAME = "ntis_new_projects.html"
+NEW_OUTPUT_PATH = os.path.join(OUTPUT_DIR, OUTPUT_NEW_HTML_FILENAME)
+
+# -------------------- [1단계: 공고 목록 내려받기] --------------------
+def parse_announcement_table(content):
+    """내려받은 공고 목록을 메모리에서 DataFrame으로 읽습니다. (xls 또는 xls 확장자로 내려오는 HTML 표)"""
+    if content.lstrip()[:1] == b'<':
+        try:
+            text = content.decode('utf-8')
+        except UnicodeDecodeError:
+            text = content.decode('cp949', errors='replace')
+        return pd.read_html(io.StringIO(text))[0]
+    return pd.read_excel(
+        io.BytesIO(content),
+        usecols=lambda column: column in REQUIRED_COLUMNS,
+        dtype={column: str for column in TEXT_COLUMNS},
+    )
+
+def normalize_announcement_table(df):
+    """필요한 열만 남기고 문자열 열과 마감일(datetime) 열의 형식을 고정합니다."""
+    df = df[[column for column in REQUIRED_COLUMNS if column in df.columns]].copy()
+    for column in TEXT_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('string')
+
+    if '마감일' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['마감일']):
+        raw = df['마감일'].astype('string').str.strip()
+        deadlines = pd.to_datetime(raw, format=DEADLINE_FORMAT, errors='coerce')
+        # 정해진 형식으로 읽히지 않은 값만 일반 날짜 해석으로 다시 시도
+        retry = deadlines.isna() & raw.notna()
+        if retry.any():
+            deadlines[retry] = pd.to_datetime(raw[retry], errors='coerce')
+        df['마감일'] = deadlines
+    return df
+
+def table_cache_path(content):
+    digest = hashlib.sha256(content).hexdigest()
+    extension = 'parquet' if TABLE_CACHE_FORMAT == 'parquet' else 'pkl'
+    return os.path.join(TABLE_CACHE_DIR, f"{digest}.{extension}")
+
+def read_announcement_table(content):
+    """
+    공고 목록을 필요한 열만 정해진 형식으로 읽습니다.
+    같은 내용의 목록은 파일 해시로 찾은 캐시(parquet, 없으면 pickle)에서 바로 읽습니다.
+    """
+    path = table_cache_path(content) if USE_TABLE_CACHE else None
+    if path and os.path.exists(path):
+        try:
+            return pd.read_parquet(path) if TABLE_CACHE_FORMAT == 'parquet' else pd.read_pickle(path)
+        except Exception as e:
+            print(f"⚠️ 캐시를 읽지 못해 다시 파싱합니다: {e}")
+
+    df = normalize_announcement_table(parse_announcement_table(content))
+    if path:
+        try:
+            os.makedirs(TABLE_CACHE_DIR, exist_ok=True)
+            if TABLE_CACHE_FORMAT == 'parquet':
+                df.to_parquet(path, index=False)
+            else:
+                df.to_pickle(path)
+        except Exception as e:
+            print(f"⚠️ 파싱 결과를 캐시에 저장하지 못했습니다: {e}")
+    return df
+
+class FormFieldParser(HTMLParser):
+    """페이지의 폼별 입력값을 읽습니다. forms는 [(id 또는 name 목록, [(이름, 값), ...]), ...]입니다."""
+    SKIPPED_INPUT_TYPES = {'submit', 'button', 'image', 'reset', 'file'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.forms = []
+        self.fields = None
+        self.select_name = None
+        self.select_value = None
+        self.textarea_name = None
+        self.textarea_text = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'form':
+            self.fields = []
+            self.forms.append(([attrs.get('id'), attrs.get('name')], self.fields))
+        elif self.fields is None:
+            return
+        elif tag == 'input':
+            input_type = (attrs.get('type') or 'text').lower()
+            if not attrs.get('name') or input_type in self.SKIPPED_INPUT_TYPES:
+                return
+            if input_type in ('checkbox', 'radio') and 'checked' not in attrs:
+                return
+            self.fields.append((attrs['name'], attrs.get('value') or ('on' if input_type == 'checkbox' else '')))
+        elif tag == 'select':
+            self.select_name, self.select_value = attrs.get('name'), None
+        elif tag == 'option' and self.select_name:
+            # 선택된 항목, 없으면 첫 항목 (브라우저와 같음)
+            if self.select_value is None or 'selected' in attrs:
+                self.select_value = attrs.get('value', '')
+        elif tag == 'textarea':
+            self.textarea_name, self.textarea_text = attrs.get('name'), []
+
+    def handle_data(self, data):
+        if self.textarea_name:
+            self.textarea_text.append(data)
+
+    def handle_endtag(self, tag):
+        if self.fields is None:
+            return
+        if tag == 'select' and self.select_name:
+            if self.select_value is not None:
+                self.fields.append((self.select_name, self.select_value))
+            self.select_name = None
+        elif tag == 'textarea' and self.textarea_name:
+            self.fields.append((self.textarea_name, ''.join(self.textarea_text)))
+            self.textarea_name = None
+        elif tag == 'form':
+            self.fields = None
+
+def export_form_data(page_html, form_name=NTIS_SEARCH_FORM, overrides=None):
+    """목록 페이지에서 검색 폼의 입력값을 읽고 overrides로 덮어쓴 [(이름, 값), ...]을 반환합니다."""
+    parser = FormFieldParser()
+    parser.feed(page_html)
+    parser.close()
+    if not parser.forms:
+        raise ValueError("목록 페이지에서 검색 폼을 찾지 못했습니다.")
+    fields = next((fields for names, fields in parser.forms if form_name in names), parser.forms[0][1])
+    overrides = overrides or {}
+    data = [(name, value) for name, value in fields if name not in overrides]
+    return data + list(overrides.items())
+
+def request_export():
+    """'리스트 다운로드' 버튼과 같은 모양으로 목록 내보내기를 요청해 응답을 반환합니다."""
+    page = http_client.get(NTIS_URL, use_cache=False)
+    page.raise_for_status()
+    data = export_form_data(page.text, NTIS_SEARCH_FORM, NTIS_EXPORT_PARAMS)
+    headers = {'Referer': NTIS_URL}
+    if NTIS_EXPORT_METHOD.upper() == "POST":
+        return http_client.post(NTIS_EXPORT_URL, data=data, headers=headers)
+    return http_client.get(NTIS_EXPORT_URL, params=data, headers=headers, use_cache=False)
+
+def download_list_direct():
+    """브라우저 없이 목록 내보내기 주소를 HTTP로 호출해 공고 목록 DataFrame을 반환합니다. 실패하면 None."""
+    print("1단계: 공고 목록을 HTTP로 직접 내려받습니다...")
+    try:
+        response = request_export()
+        response.raise_for_status()
+        df = read_announcement_table(response.content)
+    except Exception as e:
+        print(f"❌ 직접 다운로드 실패: {e}")
+        return None
+
+    missing = [column for column in REQUIRED_COLUMNS if column not in df.columns]
+    if missing:
+        print(f"❌ 직접 다운로드한 목록에 필요한 열이 없습니다: {missing}")
+        return None
+    print(f"✅ 공고 목록 {len(df)}건을 내려받았습니다.")
+    return df
+
+def is_download_complete(path):
+    """크롬은 내려받는 동안 '.crdownload' 임시 파일에 쓰고, 끝나면 최종 파일 이름으로 바꿉니다."""
+    return os.path.exists(path) and not os.path.exists(path + ".crdownload")
+
+def wait_for_download(path, timeout=DOWNLOAD_TIMEOUT_SECONDS):
+    """
+    다운로드가 끝날 때까지 기다립니다. 확인 간격을 DOWNLOAD_POLL_INITIAL_SECONDS에서 두 배씩
+    DOWNLOAD_POLL_MAX_SECONDS까지 늘려 가며 파일만 확인합니다. timeout초 안에 끝나지 않으면 False.
+    """
+    deadline = time.monotonic() + timeout
+    interval = DOWNLOAD_POLL_INITIAL_SECONDS
+    while not is_download_complete(path):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, DOWNLOAD_POLL_MAX_SECONDS)
+    return True
+
+def download_excel_file():
+    """브라우저로 NTIS 페이지의 '리스트 다운로드' 버튼을 눌러 엑셀 파일을 내려받습니다. (직접 다운로드 실패 시 사용)"""
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+
+    print("1단계: 엑셀 파일 다운로드를 시작합니다...")
+    
+    options = webdriver.ChromeOptions()
+    if HEADLESS_BROWSER:
+        options.add_argument("--headless=new")
+    prefs = {"download.default_directory": DOWNLOAD_DIR}
+    options.add_experimental_option("prefs", prefs)
+    options.add_experimental_option('excludeSwitches', ['enable-logging'])
+
+    try:
+        driver = webdriver.Chrome(options=options)
+    except Exception as e:
+        print(f"❌ 크롬 드라이버 실행 오류: {e}")
+        return False
+
+    try:
+        if os.path.exists(EXCEL_FILE_PATH):
+            os.remove(EXCEL_FILE_PATH)
+            print(f"기존 '{EXCEL_FILENAME}' 파일을 삭제했습니다.")
+
+        driver.get(NTIS_URL)
+
+        try:
+            close_button = WebDriverWait(driver, 5).until(
+                EC.element_to_be_clickable((By.XPATH, "//div[@class='popup_footer']//button[text()='닫기']"))
+            )
+            close_button.click()
+            print("팝업창 '닫기' 버튼을 클릭했습니다.")
+        except TimeoutException:
+            print("팝업창이 발견되지 않았습니다.")
+
+        download_button = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), '리스트 다운로드')]"))
+        )
+        download_button.click()
+        print("'리스트 다운로드' 버튼을 클릭했습니다.")
+
+        # 파일이 최종 이름으로 바뀌는 순간(다운로드 완료)을 점점 긴 간격으로 확인
+        if not wait_for_download(EXCEL_FILE_PATH):
+            print(f"❌ 오류: {DOWNLOAD_TIMEOUT_SECONDS}초 내에 파일 다운로드가 완료되지 않았습니다.")
+            return False
+
+        print(f"✅ '{EXCEL_FILENAME}' 다운로드 완료!")
+        return True
+
+    finally:
+        driver.quit()
+
+# -------------------- [2단계: 엑셀 파일 분석 함수 (정렬 기능 추가)] --------------------
+def build_announcements(df, limit=None, today=None):
+    """
+    공고 목록 DataFrame을 부처별 공고 목록 딕셔너리로 바꿉니다. (행 단위 반복 없이 열 단위 연산)
+    limit이 주어지면 부처별로 마감이 가장 임박한 limit개만 남깁니다.
+    각 부처의 공고는 마감일이 많이 남은 순서로 정렬됩니다.
+    """
+    today = today or datetime.datetime.now()
+
+    # 날짜 형식 변환
+    deadlines = pd.to_datetime(df['마감일'], errors='coerce')
+
+    # 1. 부처명으로 필터링, 2. 마감일로 필터링 (DEADLINE_THRESHOLD_DAYS일 이상 남은 공고만)
+    mask = df['부처명'].isin(TARGET_DEPARTMENTS) & (deadlines >= today + datetime.timedelta(days=DEADLINE_THRESHOLD_DAYS))
+    filtered_df = pd.DataFrame({
+        '부처명': df['부처명'][mask],
+        'title': df['공고명'][mask],
+        'link': df['공고문 바로가기(URL)'][mask],
+        '마감일': deadlines[mask],
+    })
+
+    # 3. (limit이 있으면) 부처별로 가장 임박한 limit개만 선택
+    if limit is not None:
+        filtered_df = filtered_df.sort_values(by='마감일', kind='stable').groupby('부처명', sort=False).head(limit)
+
+    # 4. 마감일 기준으로 내림차순 정렬 (많이 남은 순)
+    filtered_df = filtered_df.sort_values(by='마감일', ascending=False, kind='stable')
+
+    print(f"총 {len(filtered_df)}개의 유효한 공고를 찾았습니다.")
+
+    # HTML 생성을 위해 데이터 형식 맞추기
+    filtered_df['alias'] = filtered_df['부처명'].map(DEPT_ALIAS).fillna(filtered_df['부처명'])
+    filtered_df['deadline'] = "~" + filtered_df['마감일'].dt.strftime('%m/%d')
+
+    all_announcements = {alias: [] for alias in DEPT_ALIAS.values()}
+    for alias, group in filtered_df.groupby('alias', sort=False):
+        all_announcements[alias] = group[['title', 'link', 'deadline']].to_dict('records')
+    return all_announcements
+
+def read_excel_file():
+    """브라우저로 내려받은 엑셀 파일을 읽습니다. 파일이 없으면 None."""
+    try:
+        with open(EXCEL_FILE_PATH, 'rb') as file:
+            return read_announcement_table(file.read())
+    except FileNotFoundError:
+        print(f"❌ 오류: '{EXCEL_FILE_PATH}' 파일을 찾을 수 없습니다.")
+        return None
+
+def load_announcement_list():
+    """HTTP 직접 다운로드를 먼저 시도하고, 실패하면 브라우저로 내려받은 파일을 읽습니다."""
+    df = download_list_direct() if USE_DIRECT_DOWNLOAD else None
+    if df is None and USE_DIRECT_DOWNLOAD:
+        # 내보내기 주소가 바뀌면 매번 조용히 브라우저로 넘어가게 되므로 주소 점검 방법을 함께 알림
+        print(f"⚠️ 직접 다운로드({NTIS_EXPORT_URL})에 실패했습니다. 주소나 검색 폼이 바뀌었는지 확인하세요. "
+              "(NTIS_LIVE_TEST=1 python -m pytest tests/test_ntis_export.py)")
+        if REQUIRE_DIRECT_DOWNLOAD:
+            print("❌ REQUIRE_DIRECT_DOWNLOAD 설정으로 브라우저 다운로드로 넘어가지 않습니다.")
+            return None
+    if df is None:
+        if not download_excel_file():
+            return None
+        df = read_excel_file()
+    return df
+
+# -------------------- [HTML 생성 함수 (수정됨)] --------------------
+# 행 템플릿은 모듈을 읽을 때 한 번만 컴파일하고, 행마다 값만 이스케이프해서 끼워 넣음
+NTIS_HTML_HEADER = """
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <title>신규 정부과제 안내</title>
+</head>
+<body>
+<table width="800" border="0" cellpadding="0" cellspacing="0" align="center">
+    <tbody>
+        <tr>
+            <td rowspan="2" valign="top" style="background-color:#634abb;"></td>
+            <td colspan="8" height="50" style="background-color: #634abb;color:#fff;font-size:16px;font-weight: 700; padding-left:15px;">
+                신규 정부과제 안내
+            </td>
+            <td rowspan="2" valign="top" style="background-color:#634abb;"></td>
+        </tr>
+        <tr>
+            <td colspan="8" valign="top">
+                <table border="0" cellpadding="0" cellspacing="0" width="100%" style="background-color: #fff;">
+    """
+DEPARTMENT_CELLS_HTML = '''
+    <td rowspan="{rowspan}" style="background-color: #f0f0f0;color:#305eb3;text-align: center;font-size:13px;font-weight:700;padding:10px 0;{border_style}" width="75" valign="top">
+        [{alias}]
+    </td>
+    <td rowspan="{rowspan}" style="background-color: #fdfff4;color:#305eb3;text-align: center;font-size:13px;font-weight:700;padding:10px 0;{border_style}" width="63" valign="top">
+        본공고
+    </td>
+'''
+POST_CELLS_HTML = '''
+    <td style="padding:10px;{border_style}">
+        <a href="{link}" target="_blank" style="text-decoration: none;color:#222;font-size:13px;">{title}</a>
+    </td>
+    <td style="background-color: #f5f5f5;color:#222222;text-align: center;font-size:13px;{border_style}" width="75">{deadline}</td>
+'''
+POST_FIELDS = ('link', 'title', 'deadline')
+# 부처의 첫 행(부처명·'본공고' 셀 포함, 상단 테두리 적용)과 나머지 행 템플릿
+FIRST_POST_ROW = html_render.Template(
+    "<tr>\n" + DEPARTMENT_CELLS_HTML + POST_CELLS_HTML + "</tr>\n",
+    raw=('rowspan', 'border_style'),
+    args=('rowspan', 'border_style', 'alias') + POST_FIELDS,
+)
+POST_ROW = html_render.Template(
+    "<tr>\n" + POST_CELLS_HTML + "</tr>\n",
+    raw=('border_style',),
+    args=('border_style',) + POST_FIELDS,
+)
+NTIS_HTML_FOOTER = """
+                    <tr>
+                        <td height="29" style="background-color: #634abb;border-top:1px solid #e2e2e2;" colspan="4"></td>
+                    </tr>
+                </table>
+            </td>
+        </tr>
+    </tbody>
+</table>
+</body>
+</html>
+    """
+
+def iter_department_block(alias, dept_posts, is_first_department):
+    """한 부처의 공고 행들을 행 단위로 차례로 만들어 냅니다. (공고 값은 미리 한 번에 이스케이프)"""
+    if not dept_posts:
+        return
+    rowspan = len(dept_posts)
+    border_style = "" if is_first_department else 'border-top:1px solid #e2e2e2;'
+    safe_posts = html_render.escape_rows(dept_posts, POST_FIELDS)
+
+    # 첫 번째 행에만 부처명과 '본공고' 셀(rowspan 적용)과 상단 테두리 스타일을 넣음
+    yield FIRST_POST_ROW.fill(rowspan, border_style, html_render.escape(alias), *safe_posts[0])
+    for safe in safe_posts[1:]:
+        yield POST_ROW.fill("", *safe)
+
+def render_department_block(alias, dept_posts, is_first_department):
+    """한 부처의 공고 행들(HTML)을 만듭니다."""
+    return "".join(iter_department_block(alias, dept_posts, is_first_department))
+
+def iter_html_file(all_data, block_cache=None):
+    """HTML 문서를 조각 단위로 차례로 만들어 냅니다."""
+    yield NTIS_HTML_HEADER
+
+    # 루프를 도는 순서를 지정
+    is_first_department = True
+
+    for alias in ORDERED_ALIASES:
+        # all_data 딕셔너리에서 현재 부처(alias)의 공고 목록을 가져옴
+        dept_posts = all_data.get(alias, [])
+        
+        # 공고가 없으면 다음 부처로 넘어감
+        if not dept_posts:
+            continue
+        
+        if block_cache is None:
+            yield from iter_department_block(alias, dept_posts, is_first_department)
+        else:
+            yield block_cache.render_block(alias, dept_posts, is_first_department, render_department_block, POST_FIELDS)
+        
+        is_first_department = False
+
+    yield NTIS_HTML_FOOTER
+
+def generate_html_file(all_data, block_cache=None, out=None):
+    """
+    부처별 공고 목록으로 HTML을 만듭니다.
+    block_cache(AnnouncementStore)가 주어지면 공고가 바뀌지 않은 부처 블록은 저장된 HTML을 그대로 씁니다.
+    out(파일 핸들)이 주어지면 바로 써 내려가고 None을 반환합니다.
+    """
+    return html_render.render_document(iter_html_file(all_data, block_cache), out)
+
+# -------------------- [메인 실행 부분] --------------------
+def write_html(path, html):
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+        print(f"\n✅ 최종 HTML 파일 생성 완료! '{path}'")
+    except IOError as e:
+        print(f"\n❌ 오류: HTML 파일을 저장할 수 없습니다. {e}")
+
+def build_ntis_html(limit=None, issue=None):
+    """
+    공고 목록을 내려받아 분석하고 최종 HTML 문자열을 반환합니다. 목록을 받지 못하면 None.
+    (WRITE_NEW_SINCE_LAST_ISSUE이면 새 공고 HTML은 여기서 저장)
+    issue는 뉴스레터 호 번호이며 주지 않으면 이번 주입니다. 새 공고는 이전 호 이후 처음 본 공고입니다.
+    """
+    df = load_announcement_list()
+    if df is None:
+        return None
+
+    issue = issue or current_issue()
+    store = AnnouncementStore() if USE_ANNOUNCEMENT_STORE else None
+    try:
+        if store:
+            store.sync(df, TARGET_DEPARTMENTS, issue)
+
+        print("\n2단계: 공고 목록 분석을 시작합니다...")
+        all_data = build_announcements(df, limit)
+        final_html = generate_html_file(all_data, block_cache=store)
+        if store:
+            print(f"🧱 부처 블록: 새로 생성 {store.rebuilt_blocks}개, 재사용 {store.reused_blocks}개")
+
+        if store and WRITE_NEW_SINCE_LAST_ISSUE:
+            print(f"\n지난 호 이후 새로 올라온 공고를 정리합니다... ({issue})")
+            # 새 공고만 모은 보기는 전체 목록과 부처 블록 내용이 다르므로 블록 캐시를 쓰지 않음
+            new_urls = store.new_since_previous_issue(issue)
+            new_df = df[df['공고문 바로가기(URL)'].astype(str).isin(new_urls)]
+            write_html(NEW_OUTPUT_PATH, generate_html_file(build_announcements(new_df)))
+        return final_html
+    finally:
+        if store:
+            store.close()
+
+def main(limit=None):
+    """limit=None이면 조건에 맞는 공고 전체, limit=5이면 부처별로 마감이 임박한 5개만 출력합니다."""
+    final_html = build_ntis_html(limit)
+    if final_html is not None:
+        write_html(FULL_OUTPUT_PATH, final_html)
+
+if __name__ == "__main__":
+    main()
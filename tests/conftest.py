@@ -0,0 +1,6 @@
+import os
+import sys
+
+# 스크립트들과 같은 방식으로 공통 모듈(common)을 찾도록 저장소 루트를 경로에 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
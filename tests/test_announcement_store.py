@@ -0,0 +1,72 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ntis"))
+
+from announcement_store import AnnouncementStore
+
+DEPARTMENTS = ["산업통상자원부"]
+
+def announcements(*numbers):
+    return pd.DataFrame({
+        '부처명': ["산업통상자원부"] * len(numbers),
+        '공고명': [f"공고 {number}" for number in numbers],
+        '공고문 바로가기(URL)': [f"https://www.ntis.go.kr/ra/{number}" for number in numbers],
+        '마감일': ["2025-12-31"] * len(numbers),
+    })
+
+def urls(*numbers):
+    return {f"https://www.ntis.go.kr/ra/{number}" for number in numbers}
+
+def test_rerunning_an_issue_keeps_the_same_new_announcements(tmp_path):
+    store = AnnouncementStore(str(tmp_path / "store.sqlite3"))
+    try:
+        store.sync(announcements(1, 2), DEPARTMENTS, "2025-W36")
+        assert store.new_since_previous_issue("2025-W36") == urls(1, 2)
+
+        store.sync(announcements(1, 2, 3), DEPARTMENTS, "2025-W37")
+        assert store.new_since_previous_issue("2025-W37") == urls(3)
+
+        # 같은 호를 다시 실행하면 지난 실행이 아니라 지난 호와 비교
+        store.sync(announcements(1, 2, 3, 4), DEPARTMENTS, "2025-W37")
+        assert store.new_since_previous_issue("2025-W37") == urls(3, 4)
+
+        # 목록에서 빠진 공고는 새 공고에서도 빠짐
+        store.sync(announcements(1, 2, 4), DEPARTMENTS, "2025-W37")
+        assert store.new_since_previous_issue("2025-W37") == urls(4)
+
+        store.sync(announcements(1, 2, 4), DEPARTMENTS, "2025-W38")
+        assert store.new_since_previous_issue("2025-W38") == set()
+    finally:
+        store.close()
+
+def test_only_changed_department_blocks_are_rebuilt(tmp_path):
+    fields = ('link', 'title', 'deadline')
+    rendered = []
+
+    def render(alias, posts, is_first):
+        rendered.append(alias)
+        return f"<{alias}:{is_first}:{','.join(post['title'] for post in posts)}>"
+
+    def render_all(store, data):
+        return [store.render_block(alias, posts, index == 0, render, fields) for index, (alias, posts) in enumerate(data.items())]
+
+    posts = lambda *numbers: [{'link': f"https://www.ntis.go.kr/ra/{n}", 'title': f"공고 {n}", 'deadline': "~12/31"} for n in numbers]
+    store = AnnouncementStore(str(tmp_path / "store.sqlite3"))
+    try:
+        first = render_all(store, {"산업부": posts(1, 2), "과기부": posts(3)})
+        assert rendered == ["산업부", "과기부"]
+
+        rendered.clear()
+        assert render_all(store, {"산업부": posts(1, 2), "과기부": posts(3)}) == first
+        assert rendered == []
+
+        # 과기부 공고만 바뀌면 과기부 블록만 다시 만듦
+        blocks = render_all(store, {"산업부": posts(1, 2), "과기부": posts(3, 4)})
+        assert rendered == ["과기부"]
+        assert blocks == [first[0], "<과기부:False:공고 3,공고 4>"]
+        assert (store.rebuilt_blocks, store.reused_blocks) == (3, 3)
+    finally:
+        store.close()
@@ -0,0 +1,58 @@
+import threading
+
+from common.article_registry import ArticleRegistry
+
+ISSUE = "2025-W36"
+SECTIONS = ["member_search", "keyword_news", "news_captor"]
+
+def open_shared(path):
+    registry = ArticleRegistry(SECTIONS[0], ISSUE, path=path, sections=SECTIONS)
+    return registry, {section: registry.for_section(section) for section in SECTIONS}
+
+def test_sections_sharing_a_registry_see_each_others_claims(tmp_path):
+    registry, sections = open_shared(str(tmp_path / "registry.sqlite3"))
+    try:
+        assert sections["member_search"].claim("https://example.com/a", "삼성전자 반도체 투자 확대")
+        assert not sections["keyword_news"].claim("https://example.com/a?utm_source=x", "다른 제목")
+        assert not sections["news_captor"].is_seen("https://example.com/b")
+        rows = registry.conn.execute("SELECT section FROM articles").fetchall()
+        assert rows == [("member_search",)]
+    finally:
+        for section in sections.values():
+            section.close()
+        registry.close()
+
+def test_concurrent_claims_register_each_article_once(tmp_path):
+    registry, sections = open_shared(str(tmp_path / "registry.sqlite3"))
+    won = []
+    barrier = threading.Barrier(len(SECTIONS))
+
+    def claim(section):
+        barrier.wait()
+        for number in range(50):
+            if sections[section].claim(f"https://example.com/{number}"):
+                won.append(number)
+
+    threads = [threading.Thread(target=claim, args=(section,)) for section in SECTIONS]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    registry.close()
+    assert sorted(won) == list(range(50))
+
+def test_rerun_clears_only_the_listed_sections(tmp_path):
+    path = str(tmp_path / "registry.sqlite3")
+    registry, sections = open_shared(path)
+    sections["member_search"].claim("https://example.com/member")
+    registry.close()
+    other = ArticleRegistry("weekly_digest", ISSUE, path=path)
+    other.claim("https://example.com/digest")
+    other.close()
+
+    registry, sections = open_shared(path)
+    try:
+        assert sections["keyword_news"].claim("https://example.com/member")
+        assert not sections["keyword_news"].claim("https://example.com/digest")
+    finally:
+        registry.close()
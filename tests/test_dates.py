@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import pytest
+
+from common import dates
+
+@pytest.mark.parametrize("pub_date, expected", [
+    # 한국 시간 자정 경계: UTC 14:59:59는 같은 날 23:59:59, 15:00:00은 다음 날 00:00
+    ("Sun, 07 Sep 2025 14:59:59 GMT", "2025-09-07 23:59:59"),
+    ("Sun, 07 Sep 2025 15:00:00 GMT", "2025-09-08 00:00:00"),
+    ("Wed, 31 Dec 2025 15:00:00 GMT", "2026-01-01 00:00:00"),
+    ("Sat, 28 Feb 2026 15:30:00 +0000", "2026-03-01 00:30:00"),
+    ("08 Sep 2025 00:00 +0900", "2025-09-08 00:00:00"),
+    ("Sun, 07 Sep 2025 10:00:00 -0500", "2025-09-08 00:00:00"),
+    ("Sun, 07 Sep 2025 10:00:00 EST", "2025-09-08 00:00:00"),
+])
+def test_pub_dates_are_converted_to_kst(pub_date, expected):
+    parsed = dates.parse_pub_date(pub_date)
+    assert parsed.tzinfo == dates.KST
+    assert parsed.strftime("%Y-%m-%d %H:%M:%S") == expected
+
+@pytest.mark.parametrize("pub_date", ["", "어제", "Sun, 31 Sep 2025 10:00:00 GMT", "Sun, 07 Foo 2025 10:00:00 GMT"])
+def test_invalid_pub_dates_are_none(pub_date):
+    assert dates.parse_pub_date(pub_date) is None
+
+def test_vectorized_conversion_matches_one_by_one(monkeypatch):
+    monkeypatch.setattr(dates, "VECTORIZE_MIN_SIZE", 1)
+    texts = ["Sun, 07 Sep 2025 14:59:59 GMT", "Sun, 07 Sep 2025 15:00:00 GMT", "08 Sep 2025 00:00 +0900", "", "어제",
+             "Sun, 07 Sep 2025 15:00:00 GMT"]
+    assert dates.parse_pub_dates(texts) == [dates.parse_pub_date(text) for text in texts]
+
+def test_date_range_uses_the_kst_date_inclusively():
+    last_minute = dates.parse_pub_date("Sun, 07 Sep 2025 14:59:59 GMT")
+    next_day = dates.parse_pub_date("Sun, 07 Sep 2025 15:00:00 GMT")
+    assert dates.in_date_range(last_minute, "2025-09-01", "2025-09-07")
+    assert not dates.in_date_range(next_day, "2025-09-01", "2025-09-07")
+    assert dates.in_date_range(next_day, "2025-09-08", "2025-09-08")
+    assert dates.in_date_range(None, "2025-09-01", "2025-09-07")
+
+@pytest.mark.parametrize("text, expected", [
+    ("2025-09-07T15:00:00Z", "2025-09-08"),
+    ("2025-09-07T23:30:00+09:00", "2025-09-07"),
+    ("2025-09-07 14:59:59+0000", "2025-09-07"),
+    ("2025-09-07", "2025-09-07"),
+    ("입력 2025.9.7 오후 11:59", "2025-09-07"),
+    ("2025년12월31일 09:00", "2025-12-31"),
+    ("Sun, 07 Sep 2025 15:00:00 GMT", "2025-09-08"),
+    ("날짜 없음", None),
+])
+def test_page_date_text_is_normalized(text, expected):
+    assert dates.parse_date_text(text) == expected
+
+def test_short_formats_and_sort_key():
+    dt = datetime(2025, 9, 8, tzinfo=dates.KST)
+    assert (dates.date_string(dt), dates.month_day(dt), dates.month_day(dt, zero_pad=False)) == ("2025-09-08", "09/08", "9/8")
+    assert sorted([None, dt], key=dates.sort_key, reverse=True) == [dt, None]
+    assert dates.is_date_string("2025-09-08") and not dates.is_date_string("2025-9-8")
@@ -0,0 +1,44 @@
+import html
+
+import pytest
+
+from common import html_render
+
+ROW = html_render.Template(
+    '<tr style="{style}"><td><a href="{link}">{title}</a></td><td>{date}</td></tr>\n',
+    raw=("style",),
+    args=("style", "link", "title", "date"),
+)
+HOSTILE = [
+    {"link": "https://example.com/?a=1&b=\"2\"", "title": "<script>alert('x')</script> & 반도체", "date": "09/07"},
+    {"link": "javascript:'\"><img>", "title": "R&D {title} \\n 백슬래시\\", "date": 7},
+    {"link": "https://example.com/\x00null", "title": "구분자\x00포함", "date": "09/08"},
+    {"link": "https://example.com/plain", "title": "이스케이프할 문자 없음", "date": "09/09"},
+]
+
+def reference(style, link, title, date):
+    return (f'<tr style="{style}"><td><a href="{html.escape(str(link))}">{html.escape(str(title))}</a></td>'
+            f'<td>{html.escape(str(date))}</td></tr>\n')
+
+@pytest.mark.parametrize("row", HOSTILE)
+def test_render_escapes_every_non_raw_value(row):
+    assert ROW.render("color:#222;", row["link"], row["title"], row["date"]) == reference("color:#222;", **row)
+
+def test_render_rows_and_escape_rows_match_render():
+    expected = [ROW.render(None, row["link"], row["title"], row["date"]) for row in HOSTILE]
+    assert list(ROW.render_rows(dict(row, style=None) for row in HOSTILE)) == expected
+
+    safe_rows = html_render.escape_rows(HOSTILE, ("link", "title", "date"))
+    assert [ROW.fill(None, *safe) for safe in safe_rows] == expected
+
+def test_raw_values_and_template_text_are_kept_as_is():
+    template = html_render.Template("<td style='{style}'>{{literal}} \\d '따옴표'\n{value}</td>", raw=("style",))
+    assert template.render(style="a:'b'", value="<b>") == "<td style='a:'b''>{literal} \\d '따옴표'\n&lt;b&gt;</td>"
+
+def test_unsupported_placeholders_are_rejected():
+    with pytest.raises(ValueError):
+        html_render.Template("<td>{title!r}</td>")
+    with pytest.raises(ValueError):
+        html_render.Template("<td>{row[0]}</td>")
+    with pytest.raises(ValueError):
+        html_render.Template("<td>{title}</td>", args=("link",))
@@ -0,0 +1,96 @@
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from common import http_client
+
+class ScriptedHandler(BaseHTTPRequestHandler):
+    """경로별로 정해 둔 (상태 코드, 헤더) 순서대로 응답하고, 요청마다 클라이언트 포트를 기록하는 keep-alive 서버"""
+    protocol_version = "HTTP/1.1"
+    scripts = {}
+    requests = []
+
+    def do_GET(self):
+        self.requests.append((self.path, self.client_address[1]))
+        script = self.scripts.get(self.path, [])
+        status, headers = script.pop(0) if script else (200, {})
+        body = f"{status} {self.path}".encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class RecordingLimiter:
+    def __init__(self):
+        self.count = 0
+
+    def acquire(self, url=None):
+        self.count += 1
+
+@pytest.fixture
+def server(monkeypatch):
+    ScriptedHandler.scripts = {}
+    ScriptedHandler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ScriptedHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    # 테스트마다 새 공용 세션을 쓰고, 재시도 대기는 실제로 기다리지 않고 기록만 함
+    monkeypatch.setattr(http_client, "_session", None)
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    yield f"http://127.0.0.1:{httpd.server_port}", sleeps
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_requests_reuse_one_keep_alive_connection(server):
+    base, _ = server
+    for i in range(3):
+        assert http_client.get(f"{base}/page/{i}", use_cache=False).status_code == 200
+    ports = {port for _, port in ScriptedHandler.requests}
+    assert len(ScriptedHandler.requests) == 3 and len(ports) == 1
+
+def test_429_waits_for_retry_after_seconds(server):
+    base, sleeps = server
+    ScriptedHandler.scripts["/limited"] = [(429, {"Retry-After": "2"})]
+    limiter = RecordingLimiter()
+    response = http_client.get(f"{base}/limited", use_cache=False, rate_limiter=limiter)
+    assert response.status_code == 200
+    assert sleeps == [2.0]
+    assert limiter.count == 2  # 재시도도 요청 속도 제한을 거침
+
+def test_retry_after_http_date_is_capped(server):
+    base, sleeps = server
+    later = formatdate(timeval=time.time() + 3600, usegmt=True)
+    ScriptedHandler.scripts["/later"] = [(503, {"Retry-After": later})]
+    assert http_client.get(f"{base}/later", use_cache=False).status_code == 200
+    assert sleeps == [http_client.BACKOFF_MAX]
+
+def test_5xx_is_retried_with_backoff(server):
+    base, sleeps = server
+    ScriptedHandler.scripts["/flaky"] = [(503, {}), (502, {})]
+    assert http_client.get(f"{base}/flaky", use_cache=False).status_code == 200
+    assert [path for path, _ in ScriptedHandler.requests] == ["/flaky"] * 3
+    assert len(sleeps) == 2
+    for attempt, delay in enumerate(sleeps):
+        assert 0 <= delay <= http_client.BACKOFF_FACTOR * 2 ** attempt
+
+def test_last_response_is_returned_when_retries_run_out(server):
+    base, sleeps = server
+    ScriptedHandler.scripts["/down"] = [(500, {})] * 5
+    response = http_client.get(f"{base}/down", use_cache=False, max_retries=2)
+    assert response.status_code == 500
+    assert len(ScriptedHandler.requests) == 3 and len(sleeps) == 2
+
+def test_client_errors_are_not_retried(server):
+    base, sleeps = server
+    ScriptedHandler.scripts["/missing"] = [(404, {})]
+    assert http_client.get(f"{base}/missing", use_cache=False).status_code == 404
+    assert len(ScriptedHandler.requests) == 1 and sleeps == []
@@ -0,0 +1,71 @@
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "keyword_news"))
+
+import newsletter_3 as keyword_news
+from common.rss import RssItem
+
+class RecordingLimiter:
+    def __init__(self):
+        self.urls = []
+
+    def acquire(self, url=None):
+        self.urls.append(url)
+
+def rss_item(number, link):
+    return RssItem(f"반도체 기술 동향 {number}번째 소식 - 예제뉴스", link, "예제뉴스", "Fri, 05 Sep 2025 03:00:00 GMT", "")
+
+def test_google_links_are_resolved_through_the_limiter_and_kept_as_is(monkeypatch):
+    limiter = RecordingLimiter()
+    resolved = {"https://news.google.com/rss/articles/A": "http://www.example.com/news/1?ref=rss"}
+    monkeypatch.setattr(keyword_news, "resolve_article_url",
+                        lambda url, rate_limiter=None: (rate_limiter.acquire(url), resolved.get(url, url))[1])
+    monkeypatch.setattr(keyword_news, "request_rss_items", lambda query, rate_limiter=None: iter([
+        rss_item(1, "https://news.google.com/rss/articles/A"),
+        rss_item(2, "https://www.example.com/news/1"),  # 정규화하면 1번과 같은 기사
+        rss_item(3, "https://www.example.com/news/3"),
+    ]))
+
+    news = keyword_news.search_topics_batched(["반도체"], 2, "2025-09-01", "2025-09-07", batch_size=1,
+                                              relevance=keyword_news.build_relevance_filter([], []),
+                                              rate_limiter=limiter)
+    assert [item["link"] for item in news] == ["http://www.example.com/news/1?ref=rss", "https://www.example.com/news/3"]
+    assert "https://news.google.com/rss/articles/A" in limiter.urls
+
+def test_parallel_batches_keep_the_sequential_selection(monkeypatch):
+    # 두 묶음에 함께 걸리는 기사(반도체·로봇)는 앞 묶음의 키워드에 배정되어야 함
+    feeds = {
+        "반도체": [("반도체 로봇 공정 자동화", "shared"), ("반도체 수출 증가", "chip")],
+        "로봇": [("반도체 로봇 공정 자동화", "shared"), ("협동 로봇 출시", "robot")],
+    }
+    in_flight, overlaps = [0], []
+    lock = threading.Lock()
+
+    def fake_request(query, rate_limiter=None):
+        topic = next((topic for topic in feeds if topic in query), None)
+        if topic is None:  # 보충 검색(AI, 센서)은 결과 없음
+            return iter([])
+        with lock:
+            in_flight[0] += 1
+            overlaps.append(in_flight[0])
+        time.sleep(0.2 if topic == "반도체" else 0.01)  # 앞 묶음이 더 늦게 끝남
+        with lock:
+            in_flight[0] -= 1
+        return iter([RssItem(f"{title} - 예제뉴스", f"https://www.example.com/{slug}", "예제뉴스",
+                             "Fri, 05 Sep 2025 03:00:00 GMT", "") for title, slug in feeds[topic]])
+
+    monkeypatch.setattr(keyword_news, "request_rss_items", fake_request)
+    monkeypatch.setattr(keyword_news, "resolve_article_url", lambda url, rate_limiter=None: url)
+    search = lambda workers: [(item["topic"], item["link"]) for item in keyword_news.search_topics_batched(
+        ["반도체", "AI", "로봇", "센서"], 1, "2025-09-01", "2025-09-07", batch_size=2,
+        relevance=keyword_news.build_relevance_filter([], []), rate_limiter=RecordingLimiter(), max_workers=workers)]
+
+    sequential = search(1)
+    overlaps.clear()
+    assert search(4) == sequential
+    assert max(overlaps) >= 2  # 묶음 검색을 동시에 보냄
+    assert ("반도체", "https://www.example.com/shared") in sequential
+    assert ("로봇", "https://www.example.com/robot") in sequential
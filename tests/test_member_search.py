@@ -0,0 +1,51 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "member_search"))
+
+import newsletter_2 as member_search
+from common.article_registry import ArticleRegistry
+from common.rss import RssItem
+from common.search_store import SearchStore
+
+SHARED = RssItem("삼성전자·LG전자 차세대 배터리 공동 연구 협약 - 예제뉴스", "https://www.example.com/shared", "예제뉴스",
+                 "Fri, 05 Sep 2025 03:00:00 GMT", "")
+
+def own_items(company, topics):
+    return [RssItem(f"{company} {topic} - 예제뉴스", f"https://www.example.com/{company}/{number}", "예제뉴스",
+                    f"Thu, 04 Sep 2025 0{number}:00:00 GMT", "") for number, topic in enumerate(topics)]
+
+FEEDS = {
+    '"삼성전자"': [SHARED] + own_items("삼성전자", ["파운드리 신규 고객 확보", "스마트폰 신제품 공개", "반도체 공장 증설 착수"]),
+    '"LG전자"': [SHARED] + own_items("LG전자", ["가전 구독 서비스 확대", "전장 사업 수주 증가", "로봇 사업부 신설 발표"]),
+}
+
+def test_companies_sharing_an_article_both_get_count_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(member_search, "fetch_company_items", lambda query, *args: list(FEEDS[query]))
+    registry = ArticleRegistry("member_search", "2025-W36", path=str(tmp_path / "registry.sqlite3"))
+    try:
+        news = member_search.search_all_companies(["삼성전자", "LG전자"], 2, "2025-09-01", "2025-09-07",
+                                                  max_workers=1, registry=registry)
+    finally:
+        registry.close()
+
+    assert [len(news[name]) for name in ("삼성전자", "LG전자")] == [2, 2]
+    links = [item["link"] for items in news.values() for item in items]
+    assert len(links) == len(set(links))
+    assert links.count(SHARED.link) == 1
+
+def test_store_keeps_the_same_selection_as_a_fresh_search(tmp_path, monkeypatch):
+    # 관련도순 결과에서 앞쪽 기사가 더 오래된 경우
+    feed = own_items("삼성전자", ["파운드리 신규 고객 확보", "스마트폰 신제품 공개", "반도체 공장 증설 착수"])
+    monkeypatch.setattr(member_search, "fetch_company_items", lambda query, *args: list(feed))
+    fresh = member_search.search_google_news("삼성전자", 2, "2025-09-01", "2025-09-07")
+
+    store = SearchStore(str(tmp_path / "store.sqlite3"), settle_days=0, retention_days=100000)
+    try:
+        first = member_search.search_google_news("삼성전자", 2, "2025-09-01", "2025-09-07", store=store)
+        monkeypatch.setattr(member_search, "fetch_company_items", lambda *args: [])  # 이제 저장된 기사만 씀
+        second = member_search.search_google_news("삼성전자", 2, "2025-09-01", "2025-09-07", store=store)
+    finally:
+        store.close()
+    links = lambda news: [item["link"] for item in news]
+    assert links(first) == links(second) == links(fresh)
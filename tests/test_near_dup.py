@@ -0,0 +1,50 @@
+from common import near_dup
+from common.near_dup import NearDuplicateIndex
+
+def words(prefix, count):
+    return [f"{prefix}{number}" for number in range(count)]
+
+def test_titles_at_the_threshold_are_duplicates():
+    index = NearDuplicateIndex()
+    index.add("삼성전자 2분기 반도체 영업이익 증가", key="first")
+    # 공통 4단어 / 전체 8단어 = 0.5 → 중복
+    assert index.find_similar("삼성전자 2분기 반도체 영업이익 감소 전망 발표") == "first"
+    # 공통 3단어 / 전체 7단어 ≈ 0.43 → 중복 아님
+    assert index.find_similar("삼성전자 2분기 반도체 매출 감소") is None
+
+def test_empty_titles_are_never_duplicates():
+    index = NearDuplicateIndex()
+    assert index.add_if_new("")
+    assert index.add_if_new("   ")
+    assert not index.is_duplicate("")
+    assert len(index) == 2
+
+def test_add_if_new_keeps_the_first_of_similar_titles():
+    index = NearDuplicateIndex()
+    titles = ["LG전자 로봇 사업부 신설", "LG전자 로봇 사업부 신설 발표", "현대차 전기차 공장 착공"]
+    assert [index.add_if_new(title) for title in titles] == [True, False, True]
+    assert index.keys == ["LG전자 로봇 사업부 신설", "현대차 전기차 공장 착공"]
+
+def test_lsh_recall_at_the_threshold_with_32_bands_of_3_rows():
+    assert (near_dup.BANDS, near_dup.ROWS) == (32, 3)
+    assert near_dup.BANDS * near_dup.ROWS == near_dup.NUM_PERM
+    # 자카드 유사도가 정확히 0.5인 쌍(공통 6단어 + 각자 3단어)이 같은 버킷에 들어가는 비율
+    # 이론값 1 - (1 - 0.5 ** 3) ** 32 ≈ 98.6%
+    pairs = 300
+    found = 0
+    for number in range(pairs):
+        shared = words(f"공통{number}-", 6)
+        tokens1 = frozenset(shared + words(f"가{number}-", 3))
+        tokens2 = frozenset(shared + words(f"나{number}-", 3))
+        assert near_dup.jaccard(tokens1, tokens2) == 0.5
+        index = NearDuplicateIndex()
+        index.add(" ".join(sorted(tokens1)))
+        found += bool(index.candidates(near_dup.minhash_signature(tokens2)))
+    assert found / pairs >= 0.95
+
+def test_unrelated_titles_rarely_share_a_bucket():
+    index = NearDuplicateIndex()
+    for number in range(200):
+        index.add(" ".join(words(f"기사{number}-", 8)))
+    probe = frozenset(words("다른기사-", 8))
+    assert len(index.candidates(near_dup.minhash_signature(probe))) <= 5
@@ -0,0 +1,67 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "news_captor"))
+
+import newscaptor
+
+URL = "https://www.example-news.com/article/123"
+NAV = "".join(f'<li><a href="/section/{i}">메뉴 {i}</a></li>' for i in range(250))  # 약 10KB
+HEAD = ('<html><head><title>예제뉴스</title><meta property="og:site_name" content="예제뉴스">'
+        '<meta property="article:published_time" content="2025-09-05T10:30:00+09:00"></head>')
+LOGO_PAGE = (f'{HEAD}<body><h1 class="logo"><a href="/">예제뉴스</a></h1><ul class="nav">{NAV}</ul>'
+             '<h1 class="title">반도체 수출 역대 최대</h1><p>본문</p></body></html>')
+
+def scan_until_resolved(page, chunk_size=1024, **kwargs):
+    """page를 chunk_size씩 넣으며 스캐너가 멈추는 지점까지의 앞부분을 반환합니다."""
+    scanner = newscaptor.HeadScanner(**kwargs)
+    for end in range(chunk_size, len(page) + chunk_size, chunk_size):
+        scanner.feed(page[end - chunk_size:end])
+        if scanner.resolved:
+            return page[:end]
+    return None
+
+def make_rules(tmp_path):
+    rules = newscaptor.ExtractionRuleRegistry(learned_path=str(tmp_path / "learned.json"))
+    rules.rules = {}
+    return rules
+
+def test_logo_h1_does_not_stop_the_scan():
+    head = scan_until_resolved(LOGO_PAGE)
+    assert head is not None and '<h1 class="title">반도체 수출 역대 최대</h1>' in head
+
+def test_og_title_stops_the_scan_before_the_body():
+    page = LOGO_PAGE.replace("</head>", '<meta property="og:title" content="반도체 수출 역대 최대"></head>')
+    head = scan_until_resolved(page)
+    assert head is not None and "메뉴 100" not in head
+
+def test_domain_rule_selector_resolves_title():
+    page = LOGO_PAGE.replace('<h1 class="title">', '<div class="article-head"><h2>').replace("역대 최대</h1>", "역대 최대</h2></div>")
+    assert scan_until_resolved(page) is None
+    assert scan_until_resolved(page, title_selectors=[".article-head h2"]) is not None
+
+def test_empty_headline_does_not_resolve_title():
+    page = LOGO_PAGE.replace("반도체 수출 역대 최대", " ")
+    assert scan_until_resolved(page) is None
+
+def test_truncated_document_is_parsed_without_learning(tmp_path):
+    rules = make_rules(tmp_path)
+    head = scan_until_resolved(LOGO_PAGE).encode("utf-8")
+    info = newscaptor.parse_news_page(head, URL, rules=rules, complete=False)
+    assert info["title"] == "반도체 수출 역대 최대"
+    assert rules.learned == {}
+
+    newscaptor.parse_news_page(LOGO_PAGE.encode("utf-8"), URL, rules=rules)
+    assert rules.learned["example-news.com"]["title"] == "h1.title"
+
+def test_og_title_is_preferred_over_a_bare_logo_h1(tmp_path):
+    head = HEAD.replace("</head>", '<meta property="og:title" content="반도체 수출 역대 최대"></head>')
+    page = f'{head}<body><h1><a href="/">예제뉴스</a></h1></body></html>'
+    info = newscaptor.parse_news_page(page.encode("utf-8"), URL, rules=make_rules(tmp_path), complete=False)
+    assert info["title"] == "반도체 수출 역대 최대"
+
+def test_full_page_keeps_the_original_title_priority(tmp_path):
+    head = HEAD.replace("</head>", '<meta property="og:title" content="반도체 수출 역대 최대 - 예제뉴스"></head>')
+    page = f'{head}<body><h1>반도체 수출 역대 최대</h1></body></html>'
+    info = newscaptor.parse_news_page(page.encode("utf-8"), URL, rules=make_rules(tmp_path))
+    assert info["title"] == "반도체 수출 역대 최대"
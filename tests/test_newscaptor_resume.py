@@ -0,0 +1,44 @@
+import json
+import os
+import sys
+
+import openpyxl
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "news_captor"))
+
+import newscaptor
+from common.article_registry import ArticleRegistry
+
+LINKS = ["https://www.example.com/a", "https://www.example.com/b", "https://www.example.com/c"]
+
+def row(index, url, title):
+    return {'index': index, 'url': url, 'title': title, 'date': "2025-09-05", 'press': "예제"}
+
+def test_resume_reclaims_done_rows_and_retries_errors(tmp_path, monkeypatch):
+    txt_file = tmp_path / "news_link.txt"
+    txt_file.write_text("\n".join(LINKS), encoding="utf-8")
+    excel_file = str(tmp_path / "news_data.xlsx")
+    with open(excel_file + newscaptor.CHECKPOINT_SUFFIX, "w", encoding="utf-8") as file:
+        file.write(json.dumps(row(0, LINKS[0], "처리된 기사"), ensure_ascii=False) + "\n")
+        file.write(json.dumps(row(1, LINKS[1], "오류: 연결 시간 초과"), ensure_ascii=False) + "\n")
+        file.write('{"index": 2, "url": "https://www.exa')  # 끊긴 마지막 줄
+
+    fetched = []
+
+    def fake_extract(url, rate_limiter=None):
+        fetched.append(url)
+        return row(None, url, f"기사 {url[-1]}")
+
+    monkeypatch.setattr(newscaptor, "extract_news_info", fake_extract)
+    monkeypatch.setattr(newscaptor.EXTRACTION_RULES, "learned_path", None)
+    registry = ArticleRegistry("news_captor", "2025-W36", path=str(tmp_path / "registry.sqlite3"))
+    try:
+        assert newscaptor.process_news_links(str(txt_file), excel_file, registry=registry) == 3
+        assert sorted(fetched) == LINKS[1:]
+        assert all(registry.is_seen(url) for url in LINKS)
+    finally:
+        registry.close()
+
+    sheet = openpyxl.load_workbook(excel_file).active
+    titles = sorted(values[1] for values in sheet.iter_rows(min_row=2, values_only=True))
+    assert titles == ["기사 b", "기사 c", "처리된 기사"]
@@ -0,0 +1,125 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ntis"))
+
+import ntis_newsletter as ntis
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as file:
+        return file.read()
+
+class NtisHandler(BaseHTTPRequestHandler):
+    """목록 페이지(GET)와 목록 내보내기(POST)를 흉내 내는 로컬 서버"""
+    export_name = None
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(("GET", self.path, None))
+        body = read_fixture("ntis_list_page.html")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=UTF-8")
+        self.send_header("Set-Cookie", "JSESSIONID=test-session; Path=/")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qsl(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+        self.requests.append(("POST", self.path, (form, self.headers.get("Cookie"), self.headers.get("Content-Type"))))
+        body = read_fixture(self.export_name)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/vnd.ms-excel")
+        self.send_header("Content-Disposition", f"attachment; filename={self.export_name}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def ntis_server(monkeypatch):
+    NtisHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), NtisHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    monkeypatch.setattr(ntis, "NTIS_URL", f"{base}/rndgate/eg/un/ra/mng.do")
+    monkeypatch.setattr(ntis, "NTIS_EXPORT_URL", f"{base}/rndgate/eg/un/ra/excelDownload.do")
+    monkeypatch.setattr(ntis, "USE_TABLE_CACHE", False)
+    yield NtisHandler
+    server.shutdown()
+    server.server_close()
+
+def test_export_form_data_reads_the_search_form():
+    page = read_fixture("ntis_list_page.html").decode("utf-8")
+    assert ntis.export_form_data(page, overrides={"pageIndex": "2"}) == [
+        ("searchType", "ALL"), ("searchWord", ""), ("pageUnit", "100"), ("roStatus", "P"), ("pageIndex", "2"),
+    ]
+
+@pytest.mark.parametrize("export_name", ["ntis_export.xlsx", "ntis_export.xls"])
+def test_download_list_direct_posts_the_search_form(ntis_server, export_name):
+    ntis_server.export_name = export_name
+    df = ntis.download_list_direct()
+
+    assert df is not None
+    assert list(df.columns) == ntis.REQUIRED_COLUMNS
+    assert len(df) == 4
+    assert df["부처명"].iloc[0] == "산업통상자원부"
+    assert str(df["마감일"].iloc[2].date()) == "2025-11-03"
+
+    (get_method, get_path, _), (post_method, post_path, (form, cookie, content_type)) = ntis_server.requests
+    assert (get_method, get_path) == ("GET", "/rndgate/eg/un/ra/mng.do")
+    assert (post_method, post_path) == ("POST", "/rndgate/eg/un/ra/excelDownload.do")
+    assert content_type == "application/x-www-form-urlencoded"
+    assert "JSESSIONID=test-session" in cookie
+    assert form == [("pageIndex", "1"), ("searchType", "ALL"), ("searchWord", ""), ("pageUnit", "100"), ("roStatus", "P")]
+
+def test_wait_for_download_backs_off_until_the_file_is_renamed(tmp_path, monkeypatch):
+    path = tmp_path / "공고목록.xls"
+    partial = tmp_path / "공고목록.xls.crdownload"
+    partial.write_bytes(b"")
+    clock = [0.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+        if len(sleeps) == 6:  # 크롬이 다운로드를 마치고 최종 이름으로 바꿈
+            partial.rename(path)
+
+    monkeypatch.setattr(ntis.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(ntis.time, "sleep", fake_sleep)
+    assert ntis.wait_for_download(str(path), timeout=60)
+    assert sleeps == [0.2, 0.4, 0.8, 1.6, 2.0, 2.0]
+
+def test_wait_for_download_gives_up_at_the_timeout(tmp_path, monkeypatch):
+    clock = [0.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(ntis.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(ntis.time, "sleep", fake_sleep)
+    assert not ntis.wait_for_download(str(tmp_path / "공고목록.xls"), timeout=5)
+    assert sum(sleeps) == pytest.approx(5)
+
+@pytest.mark.skipif(not os.environ.get("NTIS_LIVE_TEST"), reason="실제 NTIS 사이트 확인은 NTIS_LIVE_TEST=1일 때만")
+def test_live_export_endpoint_returns_the_announcement_list(monkeypatch):
+    # 내보내기 주소(NTIS_EXPORT_URL)가 바뀌면 여기서 실패해야 함 (로컬 서버 테스트로는 알 수 없음)
+    monkeypatch.setattr(ntis, "USE_TABLE_CACHE", False)
+    df = ntis.download_list_direct()
+    assert df is not None, f"{ntis.NTIS_EXPORT_URL}에서 공고 목록을 받지 못했습니다."
+    assert list(df.columns) == ntis.REQUIRED_COLUMNS
+    assert len(df) > 0
@@ -0,0 +1,41 @@
+import random
+
+from common.relevance import AhoCorasick, RelevanceFilter
+
+def substring_filter(exclude, include, *texts):
+    """예전 방식과 같은 기준: 키워드마다 본문 전체에서 부분 문자열 검색 (대소문자 무시)"""
+    text = " \n ".join(text for text in texts if text).lower()
+    if any(term.lower() in text for term in exclude if term):
+        return False
+    include = [term for term in include if term]
+    return not include or any(term.lower() in text for term in include)
+
+def test_overlapping_and_nested_terms_are_all_found():
+    automaton = AhoCorasick(["주가", "목표주가", "가상", "he", "she", "hers"])
+    found = {automaton.terms[index] for index in automaton.find("증권가 목표주가 상향, 가상자산 / ushers")}
+    assert found == {"주가", "목표주가", "가상", "he", "she", "hers"}
+
+def test_korean_terms_match_inside_longer_words():
+    automaton = AhoCorasick(["투자", "MOU"])
+    assert {automaton.terms[index] for index in automaton.find("대규모 투자유치와 mou 체결")} == {"투자", "mou"}
+    assert automaton.find("투 자 유치") == set()
+
+def test_filter_counts_exclusions_and_missing_includes():
+    relevance = RelevanceFilter("test", exclude=["징역", "취임"], include=["반도체"])
+    assert relevance.check("반도체 공장 증설", "")
+    assert not relevance.check("반도체 업체 대표 취임", "")
+    assert not relevance.check("배터리 공장 증설", "")
+    assert (relevance.kept, relevance.excluded, relevance.not_included) == (1, 1, 1)
+    assert relevance.hits == {"반도체": 2, "취임": 1}
+
+def test_filter_matches_the_substring_filter():
+    exclude = ["투자", "MOU", "취임", "협력", "선정", "징역", "주가", "목표주가"]
+    include = ["반도체", "AI", "로봇"]
+    vocabulary = exclude + include + ["삼성", "공장", "신제품", "mou", "ai", "주", "가", "투", "자", "반도", "체", " ", "-"]
+    rng = random.Random(7)
+    for _ in range(500):
+        title = "".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 8)))
+        summary = "".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 6)))
+        for exclude_terms, include_terms in ((exclude, []), (exclude, include), ([], include)):
+            relevance = RelevanceFilter("test", exclude_terms, include_terms)
+            assert relevance.check(title, summary) == substring_filter(exclude_terms, include_terms, title, summary), (title, summary)
@@ -0,0 +1,44 @@
+from common.rss import iter_rss_items, plain_text
+
+def feed(*items, close=True):
+    body = "".join(
+        f"<item><title>{title}</title><link>{link}</link>"
+        f"<pubDate>Fri, 05 Sep 2025 03:00:00 GMT</pubDate><source url=\"https://example.com\">예제뉴스</source></item>"
+        for title, link in items
+    )
+    text = f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>검색</title>{body}'
+    return (text + "</channel></rss>" if close else text).encode("utf-8")
+
+ITEMS = [(f"기사 {number}", f"https://example.com/{number}") for number in range(5)]
+
+def test_items_are_read_across_small_chunks():
+    items = list(iter_rss_items(feed(*ITEMS), chunk_size=7))
+    assert [(item.title, item.link) for item in items] == ITEMS
+    assert items[0].source == "예제뉴스" and items[0].pub_date == "Fri, 05 Sep 2025 03:00:00 GMT"
+    assert items[0].description == ""
+
+def test_limit_stops_after_the_requested_items():
+    assert [item.link for item in iter_rss_items(feed(*ITEMS), limit=2)] == [link for _, link in ITEMS[:2]]
+    assert list(iter_rss_items(feed(*ITEMS), limit=0)) == []
+
+def test_truncated_feed_yields_the_complete_items():
+    content = feed(*ITEMS)
+    cut = content[:content.index(b"<item>", content.index(b"https://example.com/2")) + 20]
+    assert [item.link for item in iter_rss_items(cut, chunk_size=16)] == [link for _, link in ITEMS[:3]]
+    # 닫는 태그만 빠진 경우에도 항목은 모두 읽음
+    assert len(list(iter_rss_items(feed(*ITEMS, close=False)))) == 5
+
+def test_malformed_feed_yields_items_before_the_error(capsys):
+    content = feed(*ITEMS).replace(b"<title>\xea\xb8\xb0\xec\x82\xac 3</title>", b"<title>AT&T 3</title>")
+    assert [item.link for item in iter_rss_items(content)] == [link for _, link in ITEMS[:3]]
+    assert "3건까지 사용" in capsys.readouterr().out
+
+def test_empty_and_non_xml_responses_yield_nothing(capsys):
+    assert list(iter_rss_items(b"")) == []
+    assert list(iter_rss_items("<html><body>오류</body></html>")) == []
+    assert list(iter_rss_items(b"Service Unavailable")) == []
+
+def test_plain_text_drops_tags_urls_and_entities():
+    markup = '<a href="https://news.google.com/rss/articles/CBMiAI">반도체 &amp; AI</a>&nbsp;<font>예제뉴스</font> www.example.com/a'
+    assert plain_text(markup) == "반도체 & AI 예제뉴스"
+    assert plain_text(None) == ""
@@ -0,0 +1,79 @@
+from common.rss import RssItem
+from common.search_store import RSS_ITEM_LIMIT, SearchStore, merge_ranges, subtract_ranges
+
+QUERY = '"반도체" "기술"'
+
+def make_store(tmp_path):
+    # 고정 날짜(2025-09)가 보관 기간·최근 날짜 규칙에 걸리지 않게 함
+    return SearchStore(str(tmp_path / "store.sqlite3"), settle_days=0, retention_days=100000)
+
+def item(day, hour=3, number=0):
+    """day(9월 며칠) hour시(UTC)에 나온 기사"""
+    return RssItem(f"기사 {day}-{hour}-{number}", f"https://example.com/{day}/{hour}/{number}", "예제",
+                   f"Mon, {day:02d} Sep 2025 {hour:02d}:00:00 GMT", "")
+
+class FakeFeed:
+    """after:/before: 사이(둘 다 제외) 날짜의 기사를 돌려주는 가짜 구글 뉴스 검색 (UTC 날짜 기준)"""
+    def __init__(self, items):
+        self.items = items
+        self.calls = []
+
+    def __call__(self, after, before):
+        self.calls.append((after, before))
+        return [entry for entry in self.items if after < f"2025-09-{entry.link.split('/')[3]:0>2}" < before]
+
+def test_range_helpers():
+    assert merge_ranges([("2025-09-05", "2025-09-07"), ("2025-09-01", "2025-09-04")]) == [("2025-09-01", "2025-09-07")]
+    covered = [("2025-09-03", "2025-09-04"), ("2025-09-08", "2025-09-20")]
+    assert subtract_ranges("2025-09-01", "2025-09-10", covered) == [("2025-09-01", "2025-09-02"), ("2025-09-05", "2025-09-07")]
+
+def test_gap_query_is_widened_and_covers_requested_days(tmp_path):
+    store = make_store(tmp_path)
+    feed = FakeFeed([item(day) for day in range(1, 10)])
+    items = store.fetch(QUERY, "2025-09-01", "2025-09-07", feed)
+    assert feed.calls == [("2025-08-30", "2025-09-08")]
+    assert store.covered_ranges(QUERY) == [("2025-09-01", "2025-09-07")]
+    assert {entry.link.split("/")[3] for entry in items} == {str(day) for day in range(1, 8)}
+
+def test_single_day_gap_is_fetched_with_a_non_empty_window(tmp_path):
+    store = make_store(tmp_path)
+    feed = FakeFeed([item(day) for day in range(1, 12)])
+    store.fetch(QUERY, "2025-09-01", "2025-09-07", feed)
+    feed.calls.clear()
+
+    items = store.fetch(QUERY, "2025-09-02", "2025-09-08", feed)
+    assert feed.calls == [("2025-09-06", "2025-09-09")]
+    assert store.covered_ranges(QUERY) == [("2025-09-01", "2025-09-08")]
+    days = sorted(int(entry.link.split("/")[3]) for entry in items)
+    assert days == list(range(2, 9))  # 넓게 받은 9일 기사는 저장만 하고 돌려주지 않음
+
+    feed.calls.clear()
+    store.fetch(QUERY, "2025-09-01", "2025-09-08", feed)
+    assert feed.calls == []
+
+def test_items_are_filtered_by_kst_date(tmp_path):
+    store = make_store(tmp_path)
+    # 9월 7일 16시(UTC)는 한국 시간 9월 8일 01시
+    feed = FakeFeed([item(7, hour=3), item(7, hour=16)])
+    items = store.fetch(QUERY, "2025-09-07", "2025-09-07", feed)
+    assert [entry.pub_date for entry in items] == ["Mon, 07 Sep 2025 03:00:00 GMT"]
+
+def test_capped_result_is_not_recorded_as_covered(tmp_path):
+    store = make_store(tmp_path)
+    feed = FakeFeed([item(5, number=number) for number in range(RSS_ITEM_LIMIT)])
+    store.fetch(QUERY, "2025-09-05", "2025-09-05", feed)
+    assert store.covered_ranges(QUERY) == []
+    store.fetch(QUERY, "2025-09-05", "2025-09-05", feed)
+    assert len(feed.calls) == 2
+
+def test_feed_order_is_kept_across_a_coverage_hit(tmp_path):
+    store = make_store(tmp_path)
+    # 구글 뉴스 검색 결과는 날짜순이 아니라 관련도순
+    feed = FakeFeed([item(3), item(6, hour=1), item(2), item(5), item(6, hour=5), item(4)])
+    fresh = [entry.link for entry in feed("2025-08-30", "2025-09-08")]
+    feed.calls.clear()
+
+    first = [entry.link for entry in store.fetch(QUERY, "2025-09-01", "2025-09-07", feed)]
+    second = [entry.link for entry in store.fetch(QUERY, "2025-09-01", "2025-09-07", feed)]
+    assert len(feed.calls) == 1
+    assert first == second == fresh
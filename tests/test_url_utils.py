@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+from common import http_client
+from common import url_utils
+
+class RecordingLimiter:
+    def __init__(self):
+        self.urls = []
+
+    def acquire(self, url=None):
+        self.urls.append(url)
+
+def test_google_news_resolution_uses_the_callers_rate_limiter(tmp_path, monkeypatch):
+    monkeypatch.setattr(url_utils, "_resolution_cache", url_utils.UrlResolutionCache(str(tmp_path / "resolutions.sqlite3")))
+    limiter = RecordingLimiter()
+    requests_sent = []
+
+    def fake_get(url, use_cache=True, rate_limiter=None, **kwargs):
+        requests_sent.append(url)
+        rate_limiter.acquire(url)
+        return SimpleNamespace(url="https://www.example.com/news/1?utm_source=google", text="",
+                               raise_for_status=lambda: None)
+
+    monkeypatch.setattr(http_client, "get", fake_get)
+    link = "https://news.google.com/rss/articles/CBMiAAA?oc=5"
+    # 원문 링크는 그대로 두고, 정규화는 중복 확인 키를 만들 때만 함
+    assert url_utils.resolve_article_url(link, limiter) == "https://www.example.com/news/1?utm_source=google"
+    assert limiter.urls == [link]
+
+    # 풀어낸 결과는 저장되므로 같은 링크는 다시 요청하지 않음
+    assert url_utils.resolve_article_url(link, limiter) == "https://www.example.com/news/1?utm_source=google"
+    assert requests_sent == [link]